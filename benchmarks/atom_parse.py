@@ -0,0 +1,121 @@
+"""Microbenchmark: feedparser + arxiv.Result + PaperMetadata vs. the native Atom parser.
+
+Usage:
+    PYTHONPATH=src python benchmarks/atom_parse.py [--entries 2000] [--repeat 5] [--file page.xml]
+
+Without ``--file`` a synthetic export API response is generated; pass a saved
+response (e.g. ``curl 'https://export.arxiv.org/api/query?search_query=cat:cs.LG
+&max_results=2000' > page.xml``) to measure real data.
+"""
+
+import argparse
+import io
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Callable, List
+
+import arxiv
+import feedparser
+
+from paper_review.models import PaperMetadata
+from paper_review.utils.arxiv import ArxivClient, parse_export_feed
+
+ENTRY = """  <entry>
+    <id>http://arxiv.org/abs/2610.{n:05d}v1</id>
+    <updated>{date}</updated>
+    <published>{date}</published>
+    <title>A Synthetic Paper Title Number {n}
+      Spanning Two Lines</title>
+    <summary>  We study problem {n}. {abstract}
+    </summary>
+    <author><name>Alice Example</name></author>
+    <author>
+      <name>Bob Example</name>
+      <arxiv:affiliation>Example University</arxiv:affiliation>
+    </author>
+    <author><name>Carol Example</name></author>
+    <arxiv:comment>12 pages, 4 figures</arxiv:comment>
+    <link href="http://arxiv.org/abs/2610.{n:05d}v1" rel="alternate" type="text/html"/>
+    <link title="pdf" href="http://arxiv.org/pdf/2610.{n:05d}v1" rel="related"
+      type="application/pdf"/>
+    <arxiv:primary_category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.AI" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>
+"""
+CLIENT = ArxivClient({})
+
+
+def synthetic_feed(entries: int) -> bytes:
+    """Build an export API response with the given number of entries."""
+    now = datetime(2026, 10, 1, tzinfo=UTC)
+    abstract = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 20
+    body = "".join(
+        ENTRY.format(
+            n=n,
+            date=(now - timedelta(minutes=n)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            abstract=abstract,
+        )
+        for n in range(entries)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom" '
+        'xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/" '
+        'xmlns:arxiv="http://arxiv.org/schemas/atom">\n'
+        f"  <opensearch:totalResults>{entries}</opensearch:totalResults>\n"
+        f"{body}</feed>\n"
+    ).encode()
+
+
+def parse_library(data: bytes) -> List[PaperMetadata]:
+    """Current path: feedparser, arxiv.Result, validated PaperMetadata."""
+    feed = feedparser.parse(data)
+    return [CLIENT.to_paper_metadata(arxiv.Result._from_feed_entry(e)) for e in feed.entries]
+
+
+def parse_native(data: bytes) -> List[PaperMetadata]:
+    """Native path: streaming iterparse and model_construct."""
+    return list(parse_export_feed(io.BytesIO(data)))
+
+
+def best_of(parse: Callable[[bytes], List[PaperMetadata]], data: bytes, repeat: int) -> float:
+    """Best wall time of ``repeat`` runs in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        parse(data)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=2000, help="Synthetic entries")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per parser (best is kept)")
+    parser.add_argument("--file", help="Saved export API response to parse instead")
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, "rb") as f:
+            data = f.read()
+    else:
+        data = synthetic_feed(args.entries)
+
+    # Both paths must agree before their timings mean anything
+    expected, actual = parse_library(data), parse_native(data)
+    assert len(expected) == len(actual), (len(expected), len(actual))
+    for a, b in zip(expected, actual, strict=True):
+        assert a.model_dump() == b.model_dump(), (a.arxiv_id, b.arxiv_id)
+
+    library = best_of(parse_library, data, args.repeat)
+    native = best_of(parse_native, data, args.repeat)
+    print(f"{len(actual)} entries, {len(data) / 1e6:.1f} MB")
+    print(f"feedparser + arxiv.Result + PaperMetadata: {library * 1000:8.1f} ms")
+    print(f"iterparse + model_construct:               {native * 1000:8.1f} ms")
+    print(f"speedup: {library / native:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,12 +2,14 @@
 
 from .base import BaseAgent
 from .fetcher import ArxivFetcher, HuggingFaceFetcher
+from .prefilter import EmbeddingPrefilter
 from .ranker import NoveltyRanker
 from .summarizer import SummarizerAgent
 
 __all__ = [
     "BaseAgent",
     "ArxivFetcher",
+    "EmbeddingPrefilter",
     "HuggingFaceFetcher",
     "NoveltyRanker",
     "SummarizerAgent",
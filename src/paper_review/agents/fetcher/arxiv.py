@@ -1,13 +1,26 @@
 """arXiv papers fetcher agent."""
 
+import asyncio
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Set
 
 from loguru import logger
 
 from paper_review.agents.base import BaseAgent
-from paper_review.models import FilterConfig, Paper
-from paper_review.utils import ArxivClient, ImageExtractor, PDFProcessor
+from paper_review.models import FilterConfig, Paper, PaperMetadata
+from paper_review.utils import (
+    ArxivClient,
+    BlobStore,
+    CatalogSync,
+    DailyListing,
+    DownloadManager,
+    ImageExtractor,
+    PaperCatalog,
+    PDFIngestor,
+    PDFProcessor,
+)
+from paper_review.utils.arxiv import to_utc
+from paper_review.utils.download import validate_pdf
 
 
 class ArxivFetcher(BaseAgent):
@@ -25,7 +38,28 @@ class ArxivFetcher(BaseAgent):
         # Initialize components
         self.arxiv_client = ArxivClient(config.get("arxiv", {}))
         self.pdf_processor = PDFProcessor(config.get("pdf", {}))
-        self.image_extractor = ImageExtractor(config.get("pdf", {}))
+        # Content-addressed PDFs and figures (None: plain papers_dir / images_dir files)
+        self.blob_store = BlobStore.from_config(config.get("blob_store", {}))
+        self.image_extractor = ImageExtractor(config.get("pdf", {}), self.blob_store)
+        self.pdf_ingestor = PDFIngestor(config.get("pdf", {}), self.blob_store)
+
+        # Concurrent downloads; sync downloads share the same rate limit
+        self.downloader = DownloadManager.from_config(config.get("download", {}))
+        self.arxiv_client.rate_limiter = self.downloader.bucket
+
+        # Incremental harvesting into a local metadata mirror (None: query arXiv every run)
+        catalog_config = config.get("arxiv", {}).get("catalog", {})
+        self.catalog = PaperCatalog.from_config(catalog_config)
+        self.catalog_sync = (
+            CatalogSync.from_config(catalog_config, self.catalog, self.arxiv_client)
+            if self.catalog is not None
+            else None
+        )
+
+        # Daily listing feeds for "today's new submissions" (None: always use the search API)
+        self.listing = DailyListing.from_config(
+            config.get("arxiv", {}).get("listing", {}), self.arxiv_client.session
+        )
 
         # Get paths from config
         paths = config.get("paths", {})
@@ -56,19 +90,28 @@ class ArxivFetcher(BaseAgent):
 
         logger.info("Fetching arXiv papers metadata only")
 
-        # Fetch papers from arXiv
-        arxiv_results = self.arxiv_client.fetch_recent_papers(
-            categories=filter_config.arxiv_categories if filter_config.arxiv_categories else None
-        )
-
-        papers = []
-        for arxiv_result in arxiv_results:
-            metadata = self.arxiv_client.to_paper_metadata(arxiv_result)
-            paper = Paper(metadata=metadata)
-
-            # Apply filters
-            if self._apply_filters(paper, filter_config):
-                papers.append(paper)
+        if self._use_listing(filter_config):
+            papers = list(self._iter_listing(filter_config))
+        elif self.catalog is not None:
+            papers = list(self._iter_catalog(filter_config))
+        else:
+            # Fetch papers from arXiv (date range and AND/OR category filter pushed into the query;
+            # native_fetch parses the API responses directly)
+            date_from, date_to = filter_config.get_date_range()
+            query = {
+                "categories": filter_config.arxiv_categories or None,
+                "date_from": date_from,
+                "date_to": date_to,
+                "mode": filter_config.arxiv_filter_mode,
+            }
+            if self.arxiv_client.native_fetch:
+                metadata = self.arxiv_client.iter_recent_metadata(**query)
+            else:
+                metadata = map(
+                    self.arxiv_client.to_paper_metadata,
+                    self.arxiv_client.fetch_recent_papers(**query),
+                )
+            papers = list(self._to_papers(metadata, filter_config))
 
         logger.info(
             f"Fetched {len(papers)} papers from arXiv "
@@ -77,6 +120,144 @@ class ArxivFetcher(BaseAgent):
 
         return papers
 
+    def iter_papers(self, filter_config: FilterConfig) -> Iterator[Paper]:
+        """
+        Stream filtered arXiv papers (metadata only) as results arrive.
+
+        Used by the pipeline so that ranking can start before the whole
+        result set has been downloaded.
+
+        Args:
+            filter_config: Filter configuration
+
+        Yields:
+            Papers with metadata only that pass the filters
+        """
+        if "arxiv" not in filter_config.sources:
+            return
+
+        if self._use_listing(filter_config):
+            yield from self._iter_listing(filter_config)
+            return
+
+        if self.catalog is not None:
+            yield from self._iter_catalog(filter_config)
+            return
+
+        # Stops at the first result older than the date range
+        date_from, date_to = filter_config.get_date_range()
+        metadata = self.arxiv_client.iter_recent_metadata(
+            categories=filter_config.arxiv_categories if filter_config.arxiv_categories else None,
+            date_from=date_from,
+            date_to=date_to,
+            mode=filter_config.arxiv_filter_mode,
+        )
+
+        try:
+            yield from self._to_papers(metadata, filter_config)
+        except Exception as e:
+            logger.error(f"Error streaming arXiv papers: {e}")
+
+    def _use_listing(self, filter_config: FilterConfig) -> bool:
+        """Whether the filter asks for the latest day only, which the daily listings cover."""
+        return (
+            self.listing is not None
+            and filter_config.date_from is None
+            and filter_config.date_to is None
+            and filter_config.days_back == 1
+        )
+
+    def _iter_listing(self, filter_config: FilterConfig) -> Iterator[Paper]:
+        """
+        Read the daily listings of the filtered categories, using the search API only for gaps.
+
+        A category is a gap when its listing cannot be fetched, is empty, or
+        is older than the date range (e.g. no announcement yet); those
+        categories are queried with the search API instead.
+        """
+        date_from, date_to = filter_config.get_date_range()
+        mode = filter_config.arxiv_filter_mode
+        cats = (
+            filter_config.arxiv_categories
+            or self.arxiv_client.categories
+            or [self.arxiv_client.category]
+        )
+        # Papers in all AND categories are announced in every one of their listings
+        listed = cats[:1] if mode == "AND" else cats
+
+        seen: Set[str] = set()
+        gaps: List[str] = []
+        for category, entries in self.listing.fetch_many(listed):
+            if not entries or to_utc(max(e.published for e in entries)) < to_utc(date_from):
+                gaps.append(category)
+                continue
+
+            for metadata in entries:
+                if metadata.arxiv_id in seen:
+                    continue
+                seen.add(metadata.arxiv_id)
+                paper = Paper(metadata=metadata)
+                # The listing is the day; its announcement time can be ahead of "now"
+                if self._match_categories(paper, filter_config):
+                    yield paper
+
+        if not gaps:
+            return
+
+        logger.info(f"No current arXiv listing for {gaps}, falling back to the search API")
+        metadata = self.arxiv_client.iter_recent_metadata(
+            categories=cats if mode == "AND" else gaps,
+            date_from=date_from,
+            date_to=date_to,
+            mode=mode,
+        )
+        try:
+            for paper in self._to_papers(metadata, filter_config):
+                if paper.metadata.arxiv_id not in seen:
+                    seen.add(paper.metadata.arxiv_id)
+                    yield paper
+        except Exception as e:
+            logger.error(f"Error streaming arXiv papers: {e}")
+
+    def _iter_catalog(self, filter_config: FilterConfig) -> Iterator[Paper]:
+        """
+        Answer the filter from the mirror, then stream the papers a harvest adds.
+
+        Mirrored papers come from one SQL query, so they are available at
+        once; papers fetched by the harvest follow as their pages arrive.
+        """
+        date_from, _ = filter_config.get_date_range()
+        if not filter_config.arxiv_categories:
+            # Without a category filter the mirror holds just the configured categories
+            filter_config = filter_config.model_copy(
+                update={"arxiv_categories": self.catalog_sync.categories}
+            )
+
+        seen: Set[str] = set()
+        for metadata in self.catalog.search(filter_config):
+            seen.add(metadata.arxiv_id)
+            yield Paper(metadata=metadata)
+
+        try:
+            harvested = self.catalog_sync.iter_harvest(filter_config.arxiv_categories, date_from)
+            for paper in self._to_papers(harvested, filter_config):
+                if paper.metadata.arxiv_id not in seen:
+                    seen.add(paper.metadata.arxiv_id)
+                    yield paper
+        except Exception as e:
+            logger.error(f"Error harvesting arXiv papers, using catalog as is: {e}")
+
+    def _to_papers(
+        self, metadata: Iterable[PaperMetadata], filter_config: FilterConfig
+    ) -> Iterator[Paper]:
+        """Wrap arXiv metadata in papers, yielding only those that pass the filters."""
+        for paper_metadata in metadata:
+            paper = Paper(metadata=paper_metadata)
+
+            # Apply filters
+            if self._apply_filters(paper, filter_config):
+                yield paper
+
     def process_paper(self, paper: Paper) -> Paper:
         """
         Download PDF and extract content from a single paper.
@@ -89,47 +270,140 @@ class ArxivFetcher(BaseAgent):
         Returns:
             Paper with PDF, text, and images
         """
+        paper = self.download_paper(paper)
+        if not paper.pdf_path:
+            return paper
+
+        # Extract text and images in a single parse
+        result = self.pdf_ingestor.ingest(paper.pdf_path, self.images_dir, paper.metadata.arxiv_id)
+        paper.full_text = result.text
+        paper.image_paths = result.image_paths
+
+        if result.error is None:
+            logger.info(f"Successfully processed paper: {paper.metadata.arxiv_id}")
+        return paper
+
+    def download_paper(self, paper: Paper) -> Paper:
+        """
+        Download a paper's PDF from its ``pdf_url`` (skipped if it already exists or is stored).
+
+        Args:
+            paper: Paper with metadata
+
+        Returns:
+            Paper with ``pdf_path`` set on success
+        """
         paper_id = paper.metadata.arxiv_id
         if not paper_id:
             logger.warning("Paper has no arXiv ID, skipping processing")
             return paper
 
+        if not paper.metadata.pdf_url:
+            self.resolve_pdf_urls([paper])
+        if not paper.metadata.pdf_url:
+            logger.warning(f"No PDF URL for paper {paper_id}, skipping processing")
+            return paper
+
+        if self.blob_store is not None:
+            stored = self.blob_store.get(paper_id, "pdf")
+            if stored is not None:
+                paper.pdf_path = str(stored)
+                return paper
+
         try:
             logger.info(f"Processing paper: {paper_id}")
+            pdf_path = self.arxiv_client.download_pdf_url(
+                paper_id, paper.metadata.pdf_url, str(self.papers_dir)
+            )
+            paper.pdf_path = self._store_pdf(pdf_path, paper_id)
+            return paper
 
-            # Download PDF (skip if exists)
-            pdf_url = paper.metadata.pdf_url
-            if pdf_url:
-                # Create a temporary arxiv.Result-like object for download
-                import arxiv
+        except Exception as e:
+            logger.error(f"Error processing paper {paper_id}: {e}")
+            return paper
 
-                # Fetch the paper again to get the Result object for download
-                search = arxiv.Search(id_list=[paper_id])
-                arxiv_results = list(search.results())
+    async def adownload_paper(self, paper: Paper) -> Paper:
+        """
+        Download a paper's PDF through the rate-limited DownloadManager.
 
-                if arxiv_results:
-                    arxiv_result = arxiv_results[0]
-                    pdf_path = self.arxiv_client.download_pdf(arxiv_result, str(self.papers_dir))
-                    paper.pdf_path = pdf_path
+        Args:
+            paper: Paper with metadata
 
-                    # Extract text
-                    full_text = self.pdf_processor.extract_text(pdf_path)
-                    paper.full_text = full_text
+        Returns:
+            Paper with ``pdf_path`` set on success
+        """
+        paper_id = paper.metadata.arxiv_id
+        if not paper_id:
+            logger.warning("Paper has no arXiv ID, skipping processing")
+            return paper
 
-                    # Extract images
-                    image_paths = self.image_extractor.extract_images(
-                        pdf_path, str(self.images_dir), paper_id
-                    )
-                    paper.image_paths = image_paths
+        if not paper.metadata.pdf_url:
+            await asyncio.to_thread(self.resolve_pdf_urls, [paper])
+        if not paper.metadata.pdf_url:
+            logger.warning(f"No PDF URL for paper {paper_id}, skipping processing")
+            return paper
 
-                    logger.info(f"Successfully processed paper: {paper_id}")
+        if self.blob_store is not None:
+            stored = await asyncio.to_thread(self.blob_store.get, paper_id, "pdf")
+            if stored is not None:
+                paper.pdf_path = str(stored)
+                return paper
 
+        try:
+            logger.info(f"Processing paper: {paper_id}")
+            pdf_path = await self.downloader.download(
+                ArxivClient.normalize_pdf_url(paper.metadata.pdf_url),
+                self.papers_dir / f"{paper_id}.pdf",
+                validate=validate_pdf,
+            )
+            paper.pdf_path = await asyncio.to_thread(self._store_pdf, pdf_path, paper_id)
             return paper
 
         except Exception as e:
             logger.error(f"Error processing paper {paper_id}: {e}")
             return paper
 
+    def _store_pdf(self, pdf_path: str | Path, paper_id: str) -> str:
+        """
+        Move a downloaded PDF into the blob store (if enabled).
+
+        Args:
+            pdf_path: Downloaded file in ``papers_dir``
+            paper_id: arXiv ID
+
+        Returns:
+            Path to use as ``Paper.pdf_path``
+        """
+        if self.blob_store is None:
+            return str(pdf_path)
+        return str(self.blob_store.put_file(pdf_path, paper_id, "pdf"))
+
+    def resolve_pdf_urls(self, papers: List[Paper]) -> None:
+        """
+        Fill in missing PDF URLs with one batched arXiv lookup.
+
+        Args:
+            papers: Papers to check (only arXiv papers without ``pdf_url`` are looked up)
+        """
+        missing = [
+            p
+            for p in papers
+            if p.metadata.source == "arxiv" and p.metadata.arxiv_id and not p.metadata.pdf_url
+        ]
+        if not missing:
+            return
+
+        try:
+            results = self.arxiv_client.lookup([p.metadata.arxiv_id for p in missing])
+        except Exception as e:
+            logger.error(f"Error looking up PDF URLs: {e}")
+            return
+
+        for paper in missing:
+            result = results.get(paper.metadata.arxiv_id)
+            if result is not None:
+                paper.metadata.pdf_url = result.pdf_url
+
     def _apply_filters(self, paper: Paper, filter_config: FilterConfig) -> bool:
         """
         Apply filters to a paper.
@@ -141,12 +415,15 @@ class ArxivFetcher(BaseAgent):
         Returns:
             bool: True if paper passes filters
         """
-        # Date filter
+        # Date filter (arXiv timestamps are UTC, the range is local time)
         date_from, date_to = filter_config.get_date_range()
-        if not (date_from <= paper.metadata.published <= date_to):
+        if not (to_utc(date_from) <= to_utc(paper.metadata.published) <= to_utc(date_to)):
             return False
 
-        # Category filter (AND/OR logic)
+        return self._match_categories(paper, filter_config)
+
+    def _match_categories(self, paper: Paper, filter_config: FilterConfig) -> bool:
+        """Apply the AND/OR category filter to a paper."""
         if filter_config.arxiv_categories:
             paper_categories = set(paper.metadata.categories)
             filter_categories = set(filter_config.arxiv_categories)
@@ -179,6 +456,7 @@ class ArxivFetcher(BaseAgent):
         # Stage 2: Process PDFs (optional)
         if process_pdfs and papers:
             logger.info(f"Processing {len(papers)} papers (downloading PDFs and extracting content)")
+            self.resolve_pdf_urls(papers)
             papers = [self.process_paper(paper) for paper in papers]
 
         return papers
@@ -0,0 +1,203 @@
+"""Embedding-based prefilter that shortlists papers before LLM novelty ranking."""
+
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+from loguru import logger
+
+from paper_review.agents.base import BaseAgent
+from paper_review.models import Paper
+from paper_review.utils import AsyncOllamaClient
+from paper_review.utils.novelty_index import NoveltyIndex
+from paper_review.utils.vectors import normalize, rescale, spherical_kmeans
+
+
+class EmbeddingPrefilter(BaseAgent):
+    """
+    Cheap first ranking stage based on title/abstract embeddings.
+
+    Each paper is scored by its similarity to user-interest seed texts and by
+    its distance from the centroid of its cluster among the day's papers
+    (papers far from the day's main topics are more likely to be novel). With
+    ``history`` enabled, distance from previously seen papers is added as a
+    further signal and each run's papers are recorded in a persistent
+    NoveltyIndex. Only the best ``candidate_multiple * top_n`` papers go on
+    to the LLM scorer.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize EmbeddingPrefilter.
+
+        Args:
+            config: Full configuration dictionary
+        """
+        super().__init__(config)
+
+        novelty_config = config.get("novelty_filter", {})
+        prefilter_config = novelty_config.get("prefilter", {})
+        self.enabled = prefilter_config.get("enabled", False)
+        self.candidate_multiple = prefilter_config.get("candidate_multiple", 3)
+        self.interests: List[str] = prefilter_config.get("interests", [])
+        self.num_clusters = prefilter_config.get("num_clusters", 8)
+        self.interest_weight = prefilter_config.get("interest_weight", 1.0)
+        self.outlier_weight = prefilter_config.get("outlier_weight", 0.5)
+
+        history_config = prefilter_config.get("history", {})
+        self.history: NoveltyIndex | None = None
+        if self.enabled and history_config.get("enabled", False):
+            self.history = NoveltyIndex(history_config.get("path", "data/novelty_index"))
+        self.history_k = history_config.get("k", 10)
+        self.history_weight = history_config.get("weight", 1.0)
+
+        self.llm = AsyncOllamaClient(
+            base_url=novelty_config.get("ollama_base_url", "http://localhost:11434"),
+            model=prefilter_config.get("embedding_model", "nomic-embed-text"),
+            max_concurrency=novelty_config.get("max_concurrency", 4),
+        )
+
+        # Normalized interest seed vectors, embedded on first use
+        self._interest_vectors: np.ndarray | None = None
+
+        logger.info(
+            f"Initialized EmbeddingPrefilter (enabled: {self.enabled}, "
+            f"model: {self.llm.model}, interests: {len(self.interests)}, "
+            f"history: {len(self.history) if self.history is not None else 'off'})"
+        )
+
+    def needs_filtering(self, papers: List[Paper], top_n: int) -> bool:
+        """Whether there are enough papers for the prefilter to save LLM calls."""
+        return self.enabled and len(papers) > self.candidate_multiple * top_n
+
+    def shortlist(self, papers: List[Paper], top_n: int) -> List[Paper]:
+        """
+        Select LLM ranking candidates (blocking).
+
+        Args:
+            papers: Papers to filter
+            top_n: Number of papers the LLM ranker will finally select
+
+        Returns:
+            Candidate papers, best first (all papers if embedding fails)
+        """
+        if not self.needs_filtering(papers, top_n) and self.history is None:
+            return papers
+
+        try:
+            if self.interests and self._interest_vectors is None:
+                self._interest_vectors = normalize(self.llm.embed(self.interests))
+            vectors = normalize(self.llm.embed([self._text(p) for p in papers]))
+        except Exception as e:
+            logger.error(f"Embedding prefilter failed, keeping all papers: {e}")
+            return papers
+
+        return self._select(papers, vectors, top_n)
+
+    async def ashortlist(self, papers: List[Paper], top_n: int) -> List[Paper]:
+        """
+        Select LLM ranking candidates without blocking the event loop.
+
+        Args:
+            papers: Papers to filter
+            top_n: Number of papers the LLM ranker will finally select
+
+        Returns:
+            Candidate papers, best first (all papers if embedding fails)
+        """
+        if not self.needs_filtering(papers, top_n) and self.history is None:
+            return papers
+
+        try:
+            if self.interests and self._interest_vectors is None:
+                self._interest_vectors = normalize(await self.llm.aembed(self.interests))
+            vectors = normalize(await self.llm.aembed([self._text(p) for p in papers]))
+        except Exception as e:
+            logger.error(f"Embedding prefilter failed, keeping all papers: {e}")
+            return papers
+
+        return self._select(papers, vectors, top_n)
+
+    def _text(self, paper: Paper) -> str:
+        """Text embedded for a paper."""
+        return f"{paper.metadata.title}\n\n{paper.metadata.summary}"
+
+    def _select(self, papers: List[Paper], vectors: np.ndarray, top_n: int) -> List[Paper]:
+        """Keep the highest-scoring ``candidate_multiple * top_n`` papers and record all of them."""
+        if len(vectors) != len(papers):
+            logger.error(
+                f"Got {len(vectors)} embeddings for {len(papers)} papers, keeping all papers"
+            )
+            return papers
+
+        paper_ids = [p.metadata.arxiv_id or p.metadata.title for p in papers]
+        if not self.needs_filtering(papers, top_n):
+            self._record(paper_ids, vectors)
+            return papers
+
+        # Score against history before today's papers are added to it
+        scores = self.score(vectors, paper_ids)
+        self._record(paper_ids, vectors)
+        k = min(len(papers), self.candidate_multiple * top_n)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        logger.info(f"Embedding prefilter kept {k} of {len(papers)} papers for LLM ranking")
+        return [papers[i] for i in top]
+
+    def _record(self, paper_ids: List[str], vectors: np.ndarray) -> None:
+        """Add papers to the history index, if enabled."""
+        if self.history is None:
+            return
+        try:
+            added = self.history.add(paper_ids, vectors)
+            logger.debug(f"Added {added} papers to novelty history ({len(self.history)} total)")
+        except Exception as e:
+            logger.error(f"Failed to update novelty history: {e}")
+
+    def score(self, vectors: np.ndarray, paper_ids: List[str] | None = None) -> np.ndarray:
+        """
+        Score papers from their normalized embeddings.
+
+        Args:
+            vectors: (n, d) array of L2-normalized embeddings
+            paper_ids: arXiv ids of the papers (needed for the history component)
+
+        Returns:
+            (n,) array of prefilter scores (higher is better)
+        """
+        components: List[Tuple[float, np.ndarray]] = []
+
+        if self._interest_vectors is not None and self.interest_weight:
+            interest = (vectors @ self._interest_vectors.T).max(axis=1)
+            components.append((self.interest_weight, rescale(interest)))
+
+        if self.outlier_weight and len(vectors) > self.num_clusters:
+            centroids, labels = spherical_kmeans(vectors, self.num_clusters)
+            distance = 1.0 - np.einsum("ij,ij->i", vectors, centroids[labels])
+            components.append((self.outlier_weight, rescale(distance)))
+
+        if self.history is not None and self.history_weight and paper_ids is not None:
+            try:
+                history = self.history.novelty(paper_ids, vectors, self.history_k)
+                components.append((self.history_weight, rescale(history)))
+            except Exception as e:
+                logger.error(f"Novelty history lookup failed: {e}")
+
+        scores = np.zeros(len(vectors), dtype=np.float32)
+        for weight, component in components:
+            scores += weight * component
+        return scores
+
+    def execute(self, papers: List[Paper], top_n: int) -> List[Paper]:
+        """
+        Execute the prefilter.
+
+        Args:
+            papers: Papers to filter
+            top_n: Number of papers the LLM ranker will finally select
+
+        Returns:
+            Candidate papers for LLM ranking
+        """
+        return self.shortlist(papers, top_n)
+
@@ -1,18 +1,36 @@
 """Novelty ranking agent for filtering important papers."""
 
+import asyncio
+import hashlib
+import heapq
 import json
-from typing import Any, Dict, List
+import math
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
 
 from loguru import logger
 
 from paper_review.agents.base import BaseAgent
-from paper_review.models import FilterConfig, NoveltyScore, Paper
-from paper_review.utils import OllamaClient
+from paper_review.agents.prefilter import EmbeddingPrefilter
+from paper_review.models import FilterConfig, NoveltyScore, Paper, PaperMetadata
+from paper_review.utils import AsyncOllamaClient, LLMCache, ScoreStore
+from paper_review.utils.novelty_index import base_id
 
 
 class NoveltyRanker(BaseAgent):
     """Rank papers by novelty and importance based on abstracts."""
 
+    SYSTEM_PROMPT = (
+        "You are an expert researcher who evaluates academic papers. "
+        "Always respond in valid JSON format."
+    )
+
+    # Rough token budgeting for batched prompts
+    CHARS_PER_TOKEN = 3.5
+    BATCH_PROMPT_TOKENS = 400  # Instructions and response schema
+    BATCH_OUTPUT_TOKENS = 120  # Response entry per paper
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize NoveltyRanker.
@@ -33,17 +51,49 @@ class NoveltyRanker(BaseAgent):
         ollama_model = filter_config.get("ollama_model", "qwen3:8b")
         self.temperature = filter_config.get("temperature", 0.3)
 
-        self.llm = OllamaClient(base_url=ollama_base_url, model=ollama_model)
+        self.llm = AsyncOllamaClient(
+            base_url=ollama_base_url,
+            model=ollama_model,
+            cache=LLMCache.from_config(config.get("llm_cache", {})),
+            max_concurrency=filter_config.get("max_concurrency", 4),
+        )
+
+        # Batched scoring: up to batch_size abstracts per call, packed to fit num_ctx
+        self.batch_size = max(1, filter_config.get("batch_size", 1))
+        self.num_ctx = filter_config.get("num_ctx", 8192)
+
+        # Cheap embedding stage that shortlists candidates for LLM scoring
+        self.prefilter = EmbeddingPrefilter(config)
+
+        # Scores persisted per (versioned arxiv_id, model, prompt templates)
+        self.score_store = ScoreStore.from_config(filter_config.get("score_cache", {}))
+        self.prompt_hash = self._prompt_hash()
+
+        # Anytime ranking: score in order of a cheap prior until the budget runs out
+        budget_config = filter_config.get("budget", {})
+        self.max_seconds: float | None = budget_config.get("max_seconds")
+        self.max_calls: int | None = budget_config.get("max_calls")
+        self.preferred_categories = set(
+            budget_config.get("preferred_categories")
+            or [config.get("arxiv", {}).get("category", "cs.AI")]
+        )
 
         logger.info(f"Initialized NoveltyRanker (enabled: {self.enabled}, top: {self.top_papers_count})")
 
-    def rank_papers(self, papers: List[Paper], top_n: int | None = None) -> List[Paper]:
+    def rank_papers(
+        self,
+        papers: List[Paper],
+        top_n: int | None = None,
+        upvotes: Dict[str, int] | None = None,
+    ) -> List[Paper]:
         """
         Rank papers by novelty and importance.
 
         Args:
             papers: List of Paper objects
             top_n: Number of top papers to select (overrides config)
+            upvotes: HuggingFace upvotes by unversioned arXiv id for the budget
+                prior, added to those of any HuggingFace papers in ``papers``
 
         Returns:
             Sorted list of top N papers with novelty scores
@@ -60,31 +110,261 @@ class NoveltyRanker(BaseAgent):
 
         logger.info(f"Ranking {len(papers)} papers to select top {n}")
 
-        # Score each paper
-        for paper in papers:
-            if paper.metadata.source == "arxiv":  # Only rank arXiv papers
+        candidates = self.prefilter.shortlist(papers, n)
+        if self.has_budget:
+            upvotes = {**self.upvotes_by_id(papers), **(upvotes or {})}
+            return self._rank_anytime(candidates, n, upvotes)
+
+        self.score_papers(candidates)
+
+        return self.select_top(candidates, n)
+
+    async def arank_papers(
+        self,
+        papers: List[Paper],
+        top_n: int | None = None,
+        upvotes: Dict[str, int] | None = None,
+    ) -> List[Paper]:
+        """
+        Rank papers by novelty and importance without blocking the event loop.
+
+        Args:
+            papers: List of Paper objects
+            top_n: Number of top papers to select (overrides config)
+            upvotes: HuggingFace upvotes by unversioned arXiv id for the budget
+                prior, added to those of any HuggingFace papers in ``papers``
+
+        Returns:
+            Sorted list of top N papers with novelty scores
+        """
+        if not self.enabled:
+            logger.info("Novelty filtering disabled, returning all papers")
+            return papers
+
+        n = top_n or self.top_papers_count
+
+        if len(papers) <= n:
+            logger.info(f"Only {len(papers)} papers, no filtering needed")
+            return papers
+
+        logger.info(f"Ranking {len(papers)} papers to select top {n}")
+
+        candidates = await self.prefilter.ashortlist(papers, n)
+        if self.has_budget:
+            upvotes = {**self.upvotes_by_id(papers), **(upvotes or {})}
+            return await self._arank_anytime(candidates, n, upvotes)
+
+        await self.ascore_papers(candidates)
+
+        return self.select_top(candidates, n)
+
+    @property
+    def has_budget(self) -> bool:
+        """Whether ranking runs under a time or call budget."""
+        return self.max_seconds is not None or self.max_calls is not None
+
+    @staticmethod
+    def upvotes_by_id(papers: List[Paper]) -> Dict[str, int]:
+        """
+        HuggingFace upvotes of papers, keyed by unversioned arXiv id.
+
+        arXiv metadata carries no upvotes; the same paper's HuggingFace entry
+        does, so the budget prior looks them up here.
+        """
+        return {
+            base_id(p.metadata.arxiv_id): p.metadata.upvotes
+            for p in papers
+            if p.metadata.source == "huggingface" and p.metadata.arxiv_id
+        }
+
+    def _prior(self, paper: Paper, upvotes: Dict[str, int]) -> float:
+        """
+        Cheap estimate of how promising a paper is, used to order scoring.
+
+        Combines the paper's HuggingFace upvotes (from ``upvotes``), whether
+        the primary category is one of ``preferred_categories`` and abstract
+        length (very short abstracts tend to be less substantial).
+        """
+        meta = paper.metadata
+        prior = math.log1p(upvotes.get(base_id(meta.arxiv_id or ""), 0))
+        if meta.primary_category in self.preferred_categories:
+            prior += 1.0
+        prior += min(len(meta.summary.split()), 150) / 150
+        return prior
+
+    def _calls_left(self, calls: int) -> int | None:
+        """LLM calls still allowed by ``max_calls`` (None when unlimited)."""
+        return None if self.max_calls is None else max(0, self.max_calls - calls)
+
+    def _budget_left(self, started: float, calls: int) -> bool:
+        """Whether the time and call budgets allow another LLM call."""
+        if self.max_calls is not None and calls >= self.max_calls:
+            return False
+        if self.max_seconds is not None and time.monotonic() - started >= self.max_seconds:
+            return False
+        return True
+
+    def _plan_anytime(
+        self, papers: List[Paper], upvotes: Dict[str, int]
+    ) -> Tuple[List[Paper], List[List[Paper]]]:
+        """
+        Order arXiv papers by prior and plan LLM batches for those without a stored score.
+
+        Returns:
+            Tuple of (prior-ordered papers, batches in scoring order)
+        """
+        targets = sorted(
+            (p for p in papers if p.metadata.source == "arxiv"),
+            key=lambda p: self._prior(p, upvotes),
+            reverse=True,
+        )
+        return targets, self._plan_batches(self._restore_scores(targets))
+
+    def _best_so_far(self, papers: List[Paper], n: int, calls: int, started: float) -> List[Paper]:
+        """
+        Top N once the budget is spent.
+
+        Scored papers come first; remaining slots go to unscored papers in prior order.
+        """
+        top = self.select_top(papers, n)
+        unscored = [p for p in papers if p.novelty_score is None]
+        if unscored:
+            logger.info(
+                f"Ranking budget used ({calls} calls, {time.monotonic() - started:.1f}s), "
+                f"{len(unscored)}/{len(papers)} papers left unscored"
+            )
+        return top + unscored[: n - len(top)]
+
+    def _rank_anytime(self, papers: List[Paper], n: int, upvotes: Dict[str, int]) -> List[Paper]:
+        """
+        Score papers in prior order until the budget runs out (blocking).
+
+        Args:
+            papers: Candidate papers
+            n: Number of top papers to select
+            upvotes: HuggingFace upvotes by unversioned arXiv id
+
+        Returns:
+            Best-so-far top N papers
+        """
+        started = time.monotonic()
+        targets, batches = self._plan_anytime(papers, upvotes)
+
+        calls = 0
+        for batch in batches:
+            if not self._budget_left(started, calls):
+                break
+            calls += self._score_batches([batch], self._calls_left(calls))
+
+        return self._best_so_far(targets, n, calls, started)
+
+    async def _arank_anytime(
+        self, papers: List[Paper], n: int, upvotes: Dict[str, int]
+    ) -> List[Paper]:
+        """
+        Score papers in prior order until the budget runs out.
+
+        Batches are submitted in rounds of ``max_concurrency`` calls; a round
+        still running at the deadline is abandoned.
+
+        Args:
+            papers: Candidate papers
+            n: Number of top papers to select
+            upvotes: HuggingFace upvotes by unversioned arXiv id
+
+        Returns:
+            Best-so-far top N papers
+        """
+        started = time.monotonic()
+        targets, batches = self._plan_anytime(papers, upvotes)
+
+        calls = 0
+        while batches and self._budget_left(started, calls):
+            calls_left = self._calls_left(calls)
+            size = self.llm.max_concurrency
+            if calls_left is not None:
+                size = min(size, calls_left)
+            round_, batches = batches[:size], batches[size:]
+
+            timeout = None
+            if self.max_seconds is not None:
+                timeout = self.max_seconds - (time.monotonic() - started)
+            try:
+                calls += await asyncio.wait_for(self._ascore_batches(round_, calls_left), timeout)
+            except TimeoutError:
+                logger.warning(f"Ranking deadline reached, abandoning {len(round_)} batches")
+                break
+
+        return self._best_so_far(targets, n, calls, started)
+
+    def score_papers(self, papers: List[Paper]) -> None:
+        """
+        Score papers in place, assigning ``novelty_score`` to each arXiv paper.
+
+        Args:
+            papers: List of Paper objects
+        """
+        targets = [p for p in papers if p.metadata.source == "arxiv"]  # Only rank arXiv papers
+        self._score_batches(self._plan_batches(self._restore_scores(targets)))
+
+    def _score_batches(self, batches: List[List[Paper]], max_calls: int | None = None) -> int:
+        """
+        Score planned batches in place (blocking).
+
+        Args:
+            batches: Batches from ``_plan_batches``
+            max_calls: Limit on LLM calls, including individual re-scores; papers
+                beyond it are left unscored
+
+        Returns:
+            Number of LLM calls made
+        """
+        scored: List[Paper] = []
+        calls = 0
+
+        for batch in batches:
+            if max_calls is not None and calls >= max_calls:
+                break
+            if len(batch) > 1:
+                try:
+                    calls += 1
+                    result_text = self.llm.generate(**self._batch_request(batch))
+                    missing = self._apply_batch_scores(batch, result_text)
+                    scored.extend(p for p in batch if all(p is not m for m in missing))
+                    batch = missing
+                except Exception as e:
+                    logger.warning(f"Batch scoring failed, scoring {len(batch)} papers individually: {e}")
+
+            for paper in batch:
+                if max_calls is not None and calls >= max_calls:
+                    break
                 try:
-                    score = self._score_paper(paper)
-                    paper.novelty_score = score
+                    calls += 1
+                    result_text = self.llm.generate(**self._single_request(paper))
+                    paper.novelty_score = self._parse_score(result_text)
+                    scored.append(paper)
                 except Exception as e:
                     logger.error(f"Error scoring paper {paper.metadata.arxiv_id}: {e}")
                     # Give neutral score if scoring fails
-                    paper.novelty_score = NoveltyScore(
-                        total_score=5.0,
-                        novelty=5.0,
-                        impact=5.0,
-                        clarity=5.0,
-                        reasoning="Scoring failed",
-                    )
-
-        # Sort by total score (descending)
-        scored_papers = [p for p in papers if p.novelty_score is not None]
-        sorted_papers = sorted(
-            scored_papers, key=lambda x: x.novelty_score.total_score, reverse=True
-        )
+                    paper.novelty_score = self._neutral_score(f"Error: {str(e)}")
+
+        self._save_scores(scored)
+        return calls
+
+    def select_top(self, papers: List[Paper], n: int) -> List[Paper]:
+        """
+        Select the top N scored papers.
 
-        # Select top N
-        top_papers = sorted_papers[:n]
+        Args:
+            papers: List of papers (already scored)
+            n: Number of top papers to select
+
+        Returns:
+            Sorted list of top N papers
+        """
+        # Heap selection of the N best by total score (no full sort)
+        scored_papers = [p for p in papers if p.novelty_score is not None]
+        top_papers = heapq.nlargest(n, scored_papers, key=lambda x: x.novelty_score.total_score)
 
         logger.info(f"Selected top {len(top_papers)} papers")
         for i, paper in enumerate(top_papers[:5]):  # Log top 5
@@ -93,21 +373,20 @@ class NoveltyRanker(BaseAgent):
 
         return top_papers
 
-    def _score_paper(self, paper: Paper) -> NoveltyScore:
+    def _build_prompt(self, paper: Paper) -> str:
         """
-        Score a single paper based on novelty, impact, and clarity.
+        Create the scoring prompt for a single paper.
 
         Args:
             paper: Paper to score
 
         Returns:
-            NoveltyScore object
+            Formatted prompt string
         """
         title = paper.metadata.title
         abstract = paper.metadata.summary
 
-        # Create scoring prompt
-        prompt = f"""다음 논문의 초록을 분석하고 각 기준에 대해 1-10점으로 평가해주세요.
+        return f"""다음 논문의 초록을 분석하고 각 기준에 대해 1-10점으로 평가해주세요.
 
 논문 제목: {title}
 초록: {abstract}
@@ -125,48 +404,347 @@ class NoveltyRanker(BaseAgent):
   "reasoning": "<간단한 이유 1-2문장>"
 }}"""
 
-        try:
-            system_prompt = "You are an expert researcher who evaluates academic papers. Always respond in valid JSON format."
-            result_text = self.llm.generate(
-                prompt=prompt,
-                system_prompt=system_prompt,
-                temperature=self.temperature,
-                max_tokens=500,
-                format_json=True,
+    def _build_batch_prompt(self, papers: List[Paper]) -> str:
+        """
+        Create one scoring prompt covering several papers.
+
+        Args:
+            papers: Papers to score (numbered from 1 in the prompt)
+
+        Returns:
+            Formatted prompt string
+        """
+        entries = "\n\n".join(
+            f"[{i}] 논문 제목: {paper.metadata.title}\n초록: {paper.metadata.summary}"
+            for i, paper in enumerate(papers, start=1)
+        )
+
+        return f"""다음 {len(papers)}개 논문의 초록을 각각 분석하고 각 기준에 대해 1-10점으로 평가해주세요.
+
+{entries}
+
+평가 기준:
+1. Novelty (참신성): 이 연구가 얼마나 새롭고 혁신적인가?
+2. Impact (영향력): 이 연구가 해당 분야에 얼마나 큰 영향을 미칠 수 있는가?
+3. Clarity (명확성): 초록이 얼마나 명확하고 잘 작성되었는가?
+
+다음 JSON 형식으로만 답변해주세요. 1번부터 {len(papers)}번까지 모든 논문에 대해 항목을 하나씩 포함해야 합니다:
+{{
+  "scores": [
+    {{
+      "id": <논문 번호>,
+      "novelty": <1-10>,
+      "impact": <1-10>,
+      "clarity": <1-10>,
+      "reasoning": "<간단한 이유 1-2문장>"
+    }}
+  ]
+}}"""
+
+    def _single_request(self, paper: Paper) -> Dict[str, Any]:
+        """LLM request arguments for scoring one paper."""
+        return {
+            "prompt": self._build_prompt(paper),
+            "system_prompt": self.SYSTEM_PROMPT,
+            "temperature": self.temperature,
+            "max_tokens": 500,
+            "format_json": True,
+        }
+
+    def _batch_request(self, papers: List[Paper]) -> Dict[str, Any]:
+        """LLM request arguments for scoring several papers in one call."""
+        return {
+            "prompt": self._build_batch_prompt(papers),
+            "system_prompt": self.SYSTEM_PROMPT,
+            "temperature": self.temperature,
+            "max_tokens": self.BATCH_OUTPUT_TOKENS * len(papers) + 100,
+            "format_json": True,
+            "num_ctx": self.num_ctx,
+        }
+
+    def _plan_batches(self, papers: List[Paper]) -> List[List[Paper]]:
+        """
+        Group papers into batches that fit the model's context window.
+
+        Token counts are estimated from character lengths; each paper costs
+        its title and abstract plus room for its share of the JSON response.
+
+        Args:
+            papers: Papers to score
+
+        Returns:
+            List of batches (single-paper batches use the per-paper prompt)
+        """
+        if self.batch_size <= 1:
+            return [[paper] for paper in papers]
+
+        batches: List[List[Paper]] = []
+        current: List[Paper] = []
+        used = self.BATCH_PROMPT_TOKENS
+
+        for paper in papers:
+            text = paper.metadata.title + paper.metadata.summary
+            cost = int(len(text) / self.CHARS_PER_TOKEN) + self.BATCH_OUTPUT_TOKENS
+            if current and (len(current) >= self.batch_size or used + cost > self.num_ctx):
+                batches.append(current)
+                current, used = [], self.BATCH_PROMPT_TOKENS
+            current.append(paper)
+            used += cost
+
+        if current:
+            batches.append(current)
+
+        return batches
+
+    def _apply_batch_scores(self, papers: List[Paper], result_text: str) -> List[Paper]:
+        """
+        Assign scores from a batch response.
+
+        Entries are validated individually: each needs an in-range ``id`` (not
+        seen before) and numeric 1-10 scores for every criterion.
+
+        Args:
+            papers: Papers in the order they appeared in the batch prompt
+            result_text: Raw LLM response
+
+        Returns:
+            Papers whose entry was missing or invalid (to be scored individually)
+        """
+        data = json.loads(self._strip_code_fence(result_text))
+        entries = data.get("scores", []) if isinstance(data, dict) else data
+
+        scores: Dict[int, NoveltyScore] = {}
+        for entry in entries if isinstance(entries, list) else []:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                index = int(entry.get("id")) - 1
+            except (TypeError, ValueError):
+                continue
+            values = [entry.get(criterion) for criterion in ("novelty", "impact", "clarity")]
+            if index in scores or not 0 <= index < len(papers):
+                continue
+            if not all(
+                isinstance(v, (int, float)) and not isinstance(v, bool) and 1 <= v <= 10
+                for v in values
+            ):
+                continue
+
+            novelty, impact, clarity = (float(v) for v in values)
+            scores[index] = NoveltyScore(
+                total_score=(novelty + impact + clarity) / 3.0,
+                novelty=novelty,
+                impact=impact,
+                clarity=clarity,
+                reasoning=str(entry.get("reasoning", "")),
             )
 
-            # Parse JSON response
-            # Try to extract JSON from markdown code blocks if present
-            if "```json" in result_text:
-                result_text = result_text.split("```json")[1].split("```")[0].strip()
-            elif "```" in result_text:
-                result_text = result_text.split("```")[1].split("```")[0].strip()
-
-            scores = json.loads(result_text)
-
-            # Calculate total score (average)
-            total_score = (
-                scores.get("novelty", 5.0) + scores.get("impact", 5.0) + scores.get("clarity", 5.0)
-            ) / 3.0
-
-            return NoveltyScore(
-                total_score=total_score,
-                novelty=scores.get("novelty", 5.0),
-                impact=scores.get("impact", 5.0),
-                clarity=scores.get("clarity", 5.0),
-                reasoning=scores.get("reasoning", ""),
+        missing = []
+        for index, paper in enumerate(papers):
+            if index in scores:
+                paper.novelty_score = scores[index]
+            else:
+                missing.append(paper)
+
+        if missing:
+            logger.warning(
+                f"Batch response covered {len(scores)}/{len(papers)} papers, "
+                f"re-scoring {len(missing)} individually"
             )
 
-        except Exception as e:
-            logger.error(f"Error scoring paper: {e}")
-            # Return neutral scores on error
-            return NoveltyScore(
-                total_score=5.0,
-                novelty=5.0,
-                impact=5.0,
-                clarity=5.0,
-                reasoning=f"Error: {str(e)}",
+        return missing
+
+    def _strip_code_fence(self, result_text: str) -> str:
+        """Extract JSON from markdown code blocks if present."""
+        if "```json" in result_text:
+            return result_text.split("```json")[1].split("```")[0].strip()
+        if "```" in result_text:
+            return result_text.split("```")[1].split("```")[0].strip()
+        return result_text
+
+    def _parse_score(self, result_text: str) -> NoveltyScore:
+        """
+        Parse an LLM scoring response.
+
+        Args:
+            result_text: Raw LLM response
+
+        Returns:
+            NoveltyScore object
+        """
+        scores = json.loads(self._strip_code_fence(result_text))
+
+        # Calculate total score (average)
+        total_score = (
+            scores.get("novelty", 5.0) + scores.get("impact", 5.0) + scores.get("clarity", 5.0)
+        ) / 3.0
+
+        return NoveltyScore(
+            total_score=total_score,
+            novelty=scores.get("novelty", 5.0),
+            impact=scores.get("impact", 5.0),
+            clarity=scores.get("clarity", 5.0),
+            reasoning=scores.get("reasoning", ""),
+        )
+
+    def _neutral_score(self, reasoning: str) -> NoveltyScore:
+        """Neutral score used when scoring fails."""
+        return NoveltyScore(
+            total_score=5.0,
+            novelty=5.0,
+            impact=5.0,
+            clarity=5.0,
+            reasoning=reasoning,
+        )
+
+    def _prompt_hash(self) -> str:
+        """
+        Hash of everything besides the paper that shapes a score.
+
+        The prompt templates are rendered for a placeholder paper, so any
+        edit to them changes the hash and invalidates stored scores.
+        """
+        placeholder = Paper(
+            metadata=PaperMetadata(
+                title="{title}",
+                authors=[],
+                summary="{abstract}",
+                published=datetime(1970, 1, 1),
+                primary_category="",
+                source="arxiv",
             )
+        )
+        material = json.dumps(
+            {
+                "system": self.SYSTEM_PROMPT,
+                "single": self._build_prompt(placeholder),
+                "batch": self._build_batch_prompt([placeholder]),
+                "temperature": self.temperature,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()[:16]
+
+    def _restore_scores(self, papers: List[Paper]) -> List[Paper]:
+        """
+        Assign previously stored scores.
+
+        Args:
+            papers: Papers to score
+
+        Returns:
+            Papers without a stored score (still to be scored by the LLM)
+        """
+        if self.score_store is None:
+            return papers
+
+        ids = [p.metadata.arxiv_id for p in papers if p.metadata.arxiv_id]
+        try:
+            stored = self.score_store.get_many(ids, self.llm.model, self.prompt_hash)
+        except Exception as e:
+            logger.warning(f"Score store lookup failed: {e}")
+            return papers
+
+        pending = []
+        for paper in papers:
+            score = stored.get(paper.metadata.arxiv_id)
+            if score is not None:
+                paper.novelty_score = score
+            else:
+                pending.append(paper)
+
+        if stored:
+            logger.info(f"Reused {len(papers) - len(pending)} stored novelty scores")
+        return pending
+
+    def _save_scores(self, papers: List[Paper]) -> None:
+        """Persist scores produced by the LLM."""
+        if self.score_store is None:
+            return
+
+        scores = {
+            p.metadata.arxiv_id: p.novelty_score
+            for p in papers
+            if p.metadata.arxiv_id and p.novelty_score is not None
+        }
+        try:
+            self.score_store.put_many(scores, self.llm.model, self.prompt_hash)
+        except Exception as e:
+            logger.warning(f"Failed to store novelty scores: {e}")
+
+    async def ascore_papers(self, papers: List[Paper]) -> None:
+        """
+        Score papers concurrently, assigning ``novelty_score`` to each arXiv paper.
+
+        Papers are packed into batched prompts where possible; entries missing
+        from a batch response are re-scored individually. Requests are
+        submitted together and bounded by the client's ``max_concurrency``,
+        so throughput scales with Ollama's parallel slots.
+
+        Args:
+            papers: List of Paper objects
+        """
+        targets = [p for p in papers if p.metadata.source == "arxiv"]
+        await self._ascore_batches(self._plan_batches(self._restore_scores(targets)))
+
+    async def _ascore_batches(
+        self, batches: List[List[Paper]], max_calls: int | None = None
+    ) -> int:
+        """
+        Score planned batches in place, concurrently.
+
+        Each batch is applied and its scores kept as soon as its response
+        arrives; papers missing from a batch response are re-scored
+        individually. Scores gathered so far are persisted even if the call
+        is cancelled (e.g. at the anytime ranking deadline).
+
+        Args:
+            batches: Batches from ``_plan_batches``
+            max_calls: Limit on LLM calls, including individual re-scores; the
+                batched calls must fit in it, and papers whose re-score does
+                not are left unscored
+
+        Returns:
+            Number of LLM calls made
+        """
+        scored: List[Paper] = []
+        # Batched calls are counted up front so that re-scores cannot take their share
+        calls = sum(len(batch) > 1 for batch in batches)
+
+        async def score_batch(batch: List[Paper]) -> None:
+            nonlocal calls
+            singles = batch
+            if len(batch) > 1:
+                try:
+                    result = await self.llm.agenerate(**self._batch_request(batch))
+                    singles = self._apply_batch_scores(batch, result)
+                    scored.extend(p for p in batch if all(p is not m for m in singles))
+                except Exception as e:
+                    logger.warning(f"Batch scoring failed, scoring {len(batch)} papers individually: {e}")
+
+            if max_calls is not None and len(singles) > max_calls - calls:
+                allowed = max(0, max_calls - calls)
+                logger.debug(f"Call budget spent, leaving {len(singles) - allowed} papers unscored")
+                singles = singles[:allowed]
+            calls += len(singles)
+
+            results = await self.llm.agenerate_many(self._single_request(p) for p in singles)
+            for paper, result in zip(singles, results, strict=True):
+                try:
+                    if isinstance(result, BaseException):
+                        raise result
+                    paper.novelty_score = self._parse_score(result)
+                    scored.append(paper)
+                except Exception as e:
+                    logger.error(f"Error scoring paper {paper.metadata.arxiv_id}: {e}")
+                    paper.novelty_score = self._neutral_score(f"Error: {str(e)}")
+
+        try:
+            await asyncio.gather(*(score_batch(batch) for batch in batches))
+        finally:
+            self._save_scores(scored)
+        return calls
 
     def execute(self, papers: List[Paper], filter_config: FilterConfig) -> List[Paper]:
         """
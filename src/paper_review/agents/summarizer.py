@@ -1,17 +1,24 @@
 """Summarizer Agent for creating paper summaries using LLM."""
 
-from typing import Any, Dict, List
+import asyncio
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Tuple
 
 from loguru import logger
 
 from paper_review.agents.base import BaseAgent
-from paper_review.models import Paper, PaperSummary
-from paper_review.utils import OllamaClient
+from paper_review.models import Paper, PaperMetadata, PaperSummary
+from paper_review.utils import AsyncOllamaClient, LLMCache, SummaryStore
 
 
 class SummarizerAgent(BaseAgent):
     """Agent responsible for summarizing papers using LLM."""
 
+    SYSTEM_PROMPT = (
+        "You are an expert AI researcher who excels at summarizing academic papers "
+        "in a clear and structured way."
+    )
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize SummarizerAgent.
@@ -31,12 +38,21 @@ class SummarizerAgent(BaseAgent):
         self.temperature = mode_config.get("temperature", 0.7)
         self.max_tokens = mode_config.get("max_tokens", 2000)
 
-        self.llm = OllamaClient(base_url=ollama_base_url, model=ollama_model)
+        self.llm = AsyncOllamaClient(
+            base_url=ollama_base_url,
+            model=ollama_model,
+            cache=LLMCache.from_config(config.get("llm_cache", {})),
+            max_concurrency=mode_config.get("max_concurrency", 4),
+        )
 
         # Get summary config
         summary_config = config.get("summary", {})
         self.language = summary_config.get("language", "ko")
 
+        # Durable summaries so incremental runs only summarize new or changed papers
+        self.store = SummaryStore.from_config(mode_config.get("summary_store", {}))
+        self.prompt_version = self._prompt_version()
+
         logger.info(f"Initialized SummarizerAgent (mode: {self.mode}, language: {self.language})")
 
     def create_summary_prompt(self, paper: Paper) -> str:
@@ -109,57 +125,207 @@ Please clearly separate each section.
         Returns:
             PaperSummary object
         """
-        paper_id = paper.metadata.arxiv_id or paper.metadata.title[:20]
+        stored = self._stored_summary(paper)
+        if stored is not None:
+            return stored
+
+        paper_id = self._paper_id(paper)
         logger.info(f"Creating summary for paper: {paper_id}")
 
         try:
-            prompt = self.create_summary_prompt(paper)
-
-            system_prompt = "You are an expert AI researcher who excels at summarizing academic papers in a clear and structured way."
-
             # Call LLM
             summary_text = self.llm.generate(
-                prompt=prompt,
-                system_prompt=system_prompt,
+                prompt=self.create_summary_prompt(paper),
+                system_prompt=self.SYSTEM_PROMPT,
                 temperature=self.temperature,
                 max_tokens=self.max_tokens,
             )
 
             logger.info(f"Successfully created summary for paper: {paper_id}")
+            self._remember(paper, summary_text)
 
-            return PaperSummary(
-                paper_id=paper_id,
-                metadata=paper.metadata,
-                summary=summary_text,
-                image_paths=paper.image_paths,
-            )
+            return self._make_summary(paper, summary_text)
 
         except Exception as e:
             logger.error(f"Error creating summary for paper {paper_id}: {e}")
 
-            return PaperSummary(
-                paper_id=paper_id,
-                metadata=paper.metadata,
-                summary=f"Error creating summary: {str(e)}",
-                image_paths=paper.image_paths,
+            return self._make_summary(paper, f"Error creating summary: {str(e)}")
+
+    async def asummarize_paper(self, paper: Paper) -> PaperSummary:
+        """
+        Create a summary for a single paper without blocking the event loop.
+
+        Args:
+            paper: Paper to summarize
+
+        Returns:
+            PaperSummary object
+        """
+        stored = self._stored_summary(paper)
+        if stored is not None:
+            return stored
+
+        paper_id = self._paper_id(paper)
+        logger.info(f"Creating summary for paper: {paper_id}")
+
+        try:
+            summary_text = await self.llm.agenerate(
+                prompt=self.create_summary_prompt(paper),
+                system_prompt=self.SYSTEM_PROMPT,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
             )
 
-    def summarize_papers(self, papers: List[Paper]) -> List[PaperSummary]:
+            logger.info(f"Successfully created summary for paper: {paper_id}")
+            self._remember(paper, summary_text)
+
+            return self._make_summary(paper, summary_text)
+
+        except Exception as e:
+            logger.error(f"Error creating summary for paper {paper_id}: {e}")
+
+            return self._make_summary(paper, f"Error creating summary: {str(e)}")
+
+    def _paper_id(self, paper: Paper) -> str:
+        """Identifier used for a paper's summary."""
+        return paper.metadata.arxiv_id or paper.metadata.title[:20]
+
+    def _prompt_version(self) -> str:
+        """
+        Hash of the prompt template and generation settings.
+
+        The template is rendered for a placeholder paper, so editing it
+        invalidates stored summaries.
+        """
+        placeholder = Paper(
+            metadata=PaperMetadata(
+                title="{title}",
+                authors=["{authors}"],
+                summary="{abstract}",
+                published=datetime(1970, 1, 1),
+                primary_category="",
+                source="arxiv",
+            )
+        )
+        return SummaryStore.hash_text(
+            "\n".join(
+                [
+                    self.SYSTEM_PROMPT,
+                    self.create_summary_prompt(placeholder),
+                    str(self.temperature),
+                    str(self.max_tokens),
+                ]
+            )
+        )
+
+    def _store_key(self, paper: Paper) -> Tuple[str, str, str, str, str]:
+        """Summary store key: (paper id, input hash, model, language, prompt version)."""
+        meta = paper.metadata
+        input_hash = SummaryStore.hash_text(
+            "\n".join([meta.title, ", ".join(meta.authors), meta.summary])
+        )
+        return self._paper_id(paper), input_hash, self.llm.model, self.language, self.prompt_version
+
+    def _stored_summary(self, paper: Paper) -> PaperSummary | None:
+        """Previously generated summary for unchanged inputs, if any."""
+        if self.store is None:
+            return None
+        try:
+            text = self.store.get(*self._store_key(paper))
+        except Exception as e:
+            logger.warning(f"Summary store lookup failed: {e}")
+            return None
+        if text is None:
+            return None
+
+        logger.info(f"Reusing stored summary for paper: {self._paper_id(paper)}")
+        return self._make_summary(paper, text)
+
+    def _remember(self, paper: Paper, summary_text: str) -> None:
+        """Persist a successfully generated summary."""
+        if self.store is None or not summary_text:
+            return
+        try:
+            self.store.put(*self._store_key(paper), summary_text)
+        except Exception as e:
+            logger.warning(f"Failed to store summary: {e}")
+
+    def _make_summary(self, paper: Paper, summary_text: str) -> PaperSummary:
+        """Wrap summary text into a PaperSummary."""
+        return PaperSummary(
+            paper_id=self._paper_id(paper),
+            metadata=paper.metadata,
+            summary=summary_text,
+            image_paths=paper.image_paths,
+        )
+
+    def summarize_papers(
+        self,
+        papers: List[Paper],
+        on_progress: Callable[[int, int, PaperSummary], None] | None = None,
+    ) -> List[PaperSummary]:
         """
-        Create summaries for multiple papers.
+        Create summaries for multiple papers concurrently.
+
+        Runs ``asummarize_papers`` on a private event loop, so it must not be
+        called from a running loop (use ``asummarize_papers`` there).
 
         Args:
             papers: List of papers to summarize
+            on_progress: Called as (completed, total, summary) after each paper
 
         Returns:
-            List of PaperSummary objects
+            List of PaperSummary objects, in the order of ``papers``
+        """
+
+        async def run() -> List[PaperSummary]:
+            try:
+                return await self.asummarize_papers(papers, on_progress)
+            finally:
+                await self.llm.aclose()
+
+        return asyncio.run(run())
+
+    async def asummarize_papers(
+        self,
+        papers: List[Paper],
+        on_progress: Callable[[int, int, PaperSummary], None] | None = None,
+    ) -> List[PaperSummary]:
         """
-        logger.info(f"Creating summaries for {len(papers)} papers")
+        Create summaries for multiple papers concurrently.
 
-        summaries = []
-        for paper in papers:
-            summary = self.summarize_paper(paper)
-            summaries.append(summary)
+        At most ``summary_mode.max_concurrency`` LLM calls are in flight, so
+        total time scales with Ollama's parallel slots rather than the paper
+        count. A failed paper gets an error summary without affecting the others.
+
+        Args:
+            papers: List of papers to summarize
+            on_progress: Called as (completed, total, summary) after each paper
+
+        Returns:
+            List of PaperSummary objects, in the order of ``papers``
+        """
+        logger.info(
+            f"Creating summaries for {len(papers)} papers "
+            f"(concurrency: {self.llm.max_concurrency})"
+        )
+
+        async def summarize(index: int, paper: Paper) -> Tuple[int, PaperSummary]:
+            return index, await self.asummarize_paper(paper)
+
+        summaries: List[PaperSummary | None] = [None] * len(papers)
+        tasks = [summarize(i, paper) for i, paper in enumerate(papers)]
+
+        for completed, next_done in enumerate(asyncio.as_completed(tasks), start=1):
+            index, summary = await next_done
+            summaries[index] = summary
+
+            logger.info(f"Summarized {completed}/{len(papers)}: {summary.paper_id}")
+            if on_progress is not None:
+                try:
+                    on_progress(completed, len(papers), summary)
+                except Exception as e:
+                    logger.warning(f"Progress callback failed: {e}")
 
         logger.info(f"Completed creating {len(summaries)} summaries")
 
@@ -0,0 +1,88 @@
+"""Command line interface."""
+
+import argparse
+from datetime import date, datetime
+from typing import List
+
+from loguru import logger
+
+from paper_review.core.config import ConfigLoader
+from paper_review.utils.catalog import PaperCatalog
+from paper_review.utils.snapshot import SnapshotIngestor
+
+
+def _parse_date(value: str) -> date:
+    """Parse a YYYY-MM-DD argument."""
+    return date.fromisoformat(value)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser."""
+    parser = argparse.ArgumentParser(prog="paper-review", description="Paper review service")
+    parser.add_argument("--config", default="config/config.yaml", help="Configuration file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    backfill = commands.add_parser(
+        "backfill",
+        help="Load an arXiv JSON-lines metadata snapshot into the local catalog",
+    )
+    backfill.add_argument("snapshot", help="Snapshot file (.json or .json.gz)")
+    backfill.add_argument(
+        "--categories", nargs="*", default=None, help="Categories to keep (default: all)"
+    )
+    backfill.add_argument(
+        "--date-from", type=_parse_date, help="First submission date (YYYY-MM-DD)"
+    )
+    backfill.add_argument("--date-to", type=_parse_date, help="Last submission date (YYYY-MM-DD)")
+    backfill.add_argument("--batch-size", type=int, default=50000, help="Rows per transaction")
+
+    return parser
+
+
+def backfill(args: argparse.Namespace) -> int:
+    """Run the ``backfill`` command."""
+    config = ConfigLoader(args.config).config
+    catalog_config = config.get("arxiv", {}).get("catalog", {})
+    catalog = PaperCatalog(catalog_config.get("path", "data/cache/arxiv_catalog.sqlite3"))
+
+    date_from = datetime.combine(args.date_from, datetime.min.time()) if args.date_from else None
+    date_to = datetime.combine(args.date_to, datetime.max.time()) if args.date_to else None
+
+    try:
+        ingestor = SnapshotIngestor(
+            catalog,
+            batch_size=args.batch_size,
+            overlap_minutes=catalog_config.get("overlap_minutes", 60),
+        )
+        stats = ingestor.ingest(args.snapshot, args.categories, date_from, date_to)
+    finally:
+        catalog.close()
+
+    print(
+        f"Ingested {stats['rows']} papers in {stats['seconds']:.1f}s "
+        f"({stats['rows_per_second']:.0f}/s)"
+    )
+    return 0
+
+
+def main(argv: List[str] | None = None) -> int:
+    """
+    Entry point of the ``paper-review`` command.
+
+    Args:
+        argv: Command line arguments (default: sys.argv)
+
+    Returns:
+        Exit code
+    """
+    args = build_parser().parse_args(argv)
+
+    try:
+        if args.command == "backfill":
+            return backfill(args)
+    except FileNotFoundError as e:
+        logger.error(str(e))
+        return 1
+
+    return 0
+
@@ -1,12 +1,28 @@
 """Main pipeline orchestrator for paper review service."""
 
+import asyncio
+import concurrent.futures
+import threading
+import time
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Tuple
 
 from loguru import logger
 
 from paper_review.agents import ArxivFetcher, HuggingFaceFetcher, NoveltyRanker, SummarizerAgent
 from paper_review.models import FilterConfig, Paper, PaperSummary, SummaryReport
+from paper_review.utils import PDFIngestPool
+
+# Queue items are (order key, payload). The key restores the report order at the end:
+# ranked arXiv papers first (by rank), then HuggingFace papers (by fetch order).
+OrderKey = Tuple[int, int]
+StageItem = Tuple[OrderKey, Any]
+
+ARXIV_GROUP = 0
+HF_GROUP = 1
+
+# End-of-stream marker passed down the stage queues
+_DONE = object()
 
 
 class PaperReviewPipeline:
@@ -27,6 +43,28 @@ class PaperReviewPipeline:
         self.novelty_ranker = NoveltyRanker(config)
         self.summarizer = SummarizerAgent(config)
 
+        # Streaming engine settings
+        pipeline_config = config.get("pipeline", {})
+        self.queue_size = pipeline_config.get("queue_size", 32)
+        # An empty "workers:" section loads as None
+        workers = pipeline_config.get("workers") or {}
+        # LLM stages default to one worker per in-flight request slot
+        self.rank_workers = workers.get("rank", self.novelty_ranker.llm.max_concurrency)
+        # CPU-bound PDF parsing runs in worker processes (one per core by default)
+        ingest_config = pipeline_config.get("ingest", {})
+        self.ingest_pool = PDFIngestPool(
+            config.get("pdf", {}),
+            processes=ingest_config.get("processes"),
+            timeout=ingest_config.get("timeout", 120),
+            text_dir=config.get("paths", {}).get("text_dir", "data/text"),
+            blob_store_config=config.get("blob_store", {}),
+        )
+        self.pdf_workers = workers.get("pdf", self.ingest_pool.processes)
+        self.summarize_workers = workers.get("summarize", self.summarizer.llm.max_concurrency)
+        self.source_deadlines: Dict[str, float | None] = pipeline_config.get(
+            "source_deadlines", {}
+        )
+
         logger.info("Initialized PaperReviewPipeline")
 
     async def run(
@@ -35,6 +73,14 @@ class PaperReviewPipeline:
         """
         Run the full pipeline.
 
+        Stages (fetch → rank → PDF process → summarize) run concurrently and are
+        connected by bounded queues, so each stage starts on an item as soon as
+        the upstream stage emits it. Sources are fetched concurrently, each within
+        its own deadline. Ranking is the only barrier: the top N can
+        only be selected once every arXiv paper has been scored, but scoring
+        itself overlaps with fetching, and HuggingFace papers skip ranking
+        entirely.
+
         Args:
             filter_config: Filter configuration
             process_pdfs: Whether to download PDFs and extract content
@@ -44,54 +90,59 @@ class PaperReviewPipeline:
         """
         logger.info(f"Starting pipeline with sources: {filter_config.sources}")
 
-        all_papers: List[Paper] = []
+        rank_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        pdf_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        summarize_queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        results: List[Tuple[OrderKey, PaperSummary]] = []
 
-        # Stage 1: Fetch papers from all sources
-        if "arxiv" in filter_config.sources:
-            arxiv_papers = self.arxiv_fetcher.fetch_metadata_only(filter_config)
-            logger.info(f"Fetched {len(arxiv_papers)} arXiv papers")
-            all_papers.extend(arxiv_papers)
+        rank_handle, rank_finalize = self._make_rank_handlers(filter_config)
+        started = time.perf_counter()
 
-        if "huggingface" in filter_config.sources:
-            hf_papers = await self.hf_fetcher.fetch_daily_papers(filter_config)
-            logger.info(f"Fetched {len(hf_papers)} HuggingFace papers")
-            all_papers.extend(hf_papers)
+        try:
+            async with asyncio.TaskGroup() as group:
+                fetch_task = group.create_task(self._fetch_stage(filter_config, rank_queue))
+                group.create_task(
+                    self._run_stage(
+                        "rank",
+                        rank_queue,
+                        pdf_queue,
+                        rank_handle,
+                        workers=self.rank_workers,
+                        finalize=rank_finalize,
+                    )
+                )
+                group.create_task(
+                    self._run_stage(
+                        "pdf",
+                        pdf_queue,
+                        summarize_queue,
+                        self._make_pdf_handler(process_pdfs),
+                        workers=self.pdf_workers,
+                    )
+                )
+                group.create_task(
+                    self._run_stage(
+                        "summarize",
+                        summarize_queue,
+                        None,
+                        self._make_summarize_handler(results),
+                        workers=self.summarize_workers,
+                    )
+                )
+        finally:
+            self.ingest_pool.shutdown()
+            await self.arxiv_fetcher.downloader.aclose()
+            await self.novelty_ranker.llm.aclose()
+            await self.novelty_ranker.prefilter.llm.aclose()
+            await self.summarizer.llm.aclose()
 
-        if not all_papers:
+        if fetch_task.result() == 0:
             logger.warning("No papers fetched from any source")
             return self._create_empty_report()
 
-        logger.info(f"Total papers fetched: {len(all_papers)}")
-
-        # Stage 2: Novelty ranking (arXiv only)
-        arxiv_papers = [p for p in all_papers if p.metadata.source == "arxiv"]
-        hf_papers = [p for p in all_papers if p.metadata.source == "huggingface"]
+        summaries = [summary for _, summary in sorted(results, key=lambda item: item[0])]
 
-        if arxiv_papers and filter_config.novelty_enabled:
-            logger.info(f"Ranking {len(arxiv_papers)} arXiv papers")
-            ranked_arxiv = self.novelty_ranker.execute(arxiv_papers, filter_config)
-            logger.info(f"Selected top {len(ranked_arxiv)} arXiv papers")
-        else:
-            ranked_arxiv = arxiv_papers
-
-        # Combine ranked arXiv papers with all HF papers
-        selected_papers = ranked_arxiv + hf_papers
-        logger.info(
-            f"Total selected papers: {len(selected_papers)} "
-            f"(arXiv: {len(ranked_arxiv)}, HF: {len(hf_papers)})"
-        )
-
-        # Stage 3: Process PDFs (arXiv only, if requested)
-        if process_pdfs and ranked_arxiv:
-            logger.info(f"Processing {len(ranked_arxiv)} arXiv papers (downloading PDFs)")
-            for paper in ranked_arxiv:
-                self.arxiv_fetcher.process_paper(paper)
-
-        # Stage 4: Summarize papers
-        logger.info(f"Summarizing {len(selected_papers)} papers")
-        summaries = self.summarizer.execute(selected_papers)
-
-        # Stage 5: Create report
+        # Create report
         report = SummaryReport(
             date=datetime.now().strftime("%Y-%m-%d"),
             total_papers=len(summaries),
@@ -100,13 +151,291 @@ class PaperReviewPipeline:
             summaries=summaries,
         )
 
+        blob_store = self.arxiv_fetcher.blob_store
+        if blob_store is not None:
+            # Keep the files of recent reports; older ones become evictable again
+            blob_store.release_pins()
+            blob_store.pin(
+                [s.metadata.arxiv_id for s in summaries if s.metadata.arxiv_id],
+                owner=f"report:{report.date}",
+            )
+            blob_store.evict()
+
         logger.info(
-            f"Pipeline completed: {report.total_papers} papers "
+            f"Pipeline completed in {time.perf_counter() - started:.1f}s: "
+            f"{report.total_papers} papers "
             f"(arXiv: {report.arxiv_count}, HF: {report.huggingface_count})"
         )
+        for name, llm in (("ranker", self.novelty_ranker.llm), ("summarizer", self.summarizer.llm)):
+            if llm.cache is not None:
+                logger.info(f"LLM cache ({name}): {llm.cache.stats()}")
+        if process_pdfs:
+            logger.info(f"PDF downloads: {self.arxiv_fetcher.downloader.stats()}")
+        if self.summarizer.store is not None:
+            logger.info(f"Summary store: {self.summarizer.store.stats()}")
+        if blob_store is not None:
+            logger.info(f"Blob store: {blob_store.stats()}")
 
         return report
 
+    async def _fetch_stage(self, filter_config: FilterConfig, outbox: asyncio.Queue) -> int:
+        """
+        Stage 1: fetch papers from all sources concurrently and emit them one by one.
+
+        Returns:
+            Total number of papers emitted
+        """
+        sources = []
+        if "arxiv" in filter_config.sources:
+            sources.append(
+                self._fetch_source(
+                    "arxiv",
+                    ARXIV_GROUP,
+                    _iterate_in_thread(lambda: self.arxiv_fetcher.iter_papers(filter_config)),
+                    outbox,
+                )
+            )
+        if "huggingface" in filter_config.sources:
+            sources.append(
+                self._fetch_source(
+                    "huggingface",
+                    HF_GROUP,
+                    self._iterate_hf_papers(filter_config),
+                    outbox,
+                )
+            )
+
+        try:
+            counts = await asyncio.gather(*sources)
+        finally:
+            await outbox.put(_DONE)
+
+        total = sum(counts)
+        logger.info(f"Total papers fetched: {total}")
+        return total
+
+    async def _fetch_source(
+        self,
+        name: str,
+        group: int,
+        papers: AsyncIterator[Paper],
+        outbox: asyncio.Queue,
+    ) -> int:
+        """
+        Forward papers from one source until it is exhausted or its deadline expires.
+
+        The deadline (``pipeline.source_deadlines.<name>``, in seconds) only counts
+        time spent waiting on the source; time blocked on a full outbox is
+        downstream backpressure and is not charged to the source. Papers emitted
+        before the deadline are kept as partial results.
+
+        Returns:
+            Number of papers emitted
+        """
+        remaining = self.source_deadlines.get(name)
+        loop = asyncio.get_running_loop()
+        count = 0
+
+        try:
+            while True:
+                waited_from = loop.time()
+                try:
+                    paper = await asyncio.wait_for(anext(papers), timeout=remaining)
+                except StopAsyncIteration:
+                    break
+                if remaining is not None:
+                    remaining = max(0.0, remaining - (loop.time() - waited_from))
+
+                await outbox.put(((group, count), paper))
+                count += 1
+
+            logger.info(f"Fetched {count} {name} papers")
+        except TimeoutError:
+            logger.warning(
+                f"{name} fetch exceeded its {self.source_deadlines[name]}s deadline, "
+                f"continuing with {count} partial results"
+            )
+        except Exception as e:
+            logger.error(f"{name} fetch failed after {count} papers: {e}")
+        finally:
+            await papers.aclose()
+
+        return count
+
+    async def _iterate_hf_papers(self, filter_config: FilterConfig) -> AsyncIterator[Paper]:
+        """Yield HuggingFace daily papers."""
+        for paper in await self.hf_fetcher.fetch_daily_papers(filter_config):
+            yield paper
+
+    def _make_rank_handlers(
+        self, filter_config: FilterConfig
+    ) -> Tuple[
+        Callable[[StageItem], Awaitable[List[StageItem]]],
+        Callable[[], Awaitable[List[StageItem]]],
+    ]:
+        """
+        Stage 2: novelty ranking (arXiv only).
+
+        HuggingFace papers pass straight through; their upvotes are kept for
+        the ranking budget's prior. arXiv papers are buffered and scored in
+        chunks of ``batch_size`` as they arrive once there are more than
+        ``top_n`` of them (with fewer, no ranking is needed, matching
+        ``NoveltyRanker.rank_papers``); the top N are emitted when the fetch
+        stage is exhausted. With the embedding prefilter or a ranking budget
+        enabled, papers are only buffered and ranked once the fetch stage is
+        exhausted.
+        """
+        ranker = self.novelty_ranker
+        ranking = filter_config.novelty_enabled and ranker.enabled
+        top_n = filter_config.novelty_top_n or ranker.top_papers_count
+        # The embedding prefilter and budgeted (prior-ordered) ranking need the
+        # whole candidate set, so scoring waits for it
+        streaming = not ranker.prefilter.enabled and not ranker.has_budget
+        buffered: List[Paper] = []
+        pending: List[Paper] = []
+        upvotes: Dict[str, int] = {}
+
+        async def handle(item: StageItem) -> List[StageItem]:
+            key, paper = item
+            if not ranking or paper.metadata.source != "arxiv":
+                upvotes.update(ranker.upvotes_by_id([paper]))
+                return [item]
+
+            buffered.append(paper)
+            if not streaming:
+                return []
+            if len(buffered) == top_n + 1:
+                pending.extend(buffered)
+            elif len(buffered) > top_n + 1:
+                pending.append(paper)
+
+            # Score in chunks so batched prompts can be filled
+            if len(pending) < ranker.batch_size:
+                return []
+
+            chunk = list(pending)
+            pending.clear()
+            await ranker.ascore_papers(chunk)
+            return []
+
+        async def finalize() -> List[StageItem]:
+            if not ranking or not buffered:
+                return []
+
+            if not streaming:
+                selected = await ranker.arank_papers(buffered, top_n, upvotes)
+            elif len(buffered) <= top_n:
+                logger.info(f"Only {len(buffered)} papers, no filtering needed")
+                selected = buffered
+            else:
+                if pending:
+                    await ranker.ascore_papers(list(pending))
+                    pending.clear()
+                logger.info(f"Ranked {len(buffered)} arXiv papers to select top {top_n}")
+                selected = ranker.select_top(buffered, top_n)
+
+            # One batched lookup for any selected paper missing its PDF URL
+            await asyncio.to_thread(self.arxiv_fetcher.resolve_pdf_urls, selected)
+
+            return [((ARXIV_GROUP, rank), paper) for rank, paper in enumerate(selected)]
+
+        return handle, finalize
+
+    def _make_pdf_handler(
+        self, process_pdfs: bool
+    ) -> Callable[[StageItem], Awaitable[List[StageItem]]]:
+        """
+        Stage 3: download PDFs and extract content (arXiv only, if requested).
+
+        Downloads go through the fetcher's rate-limited DownloadManager;
+        parsing runs in the ingest process pool. Extracted text is written to
+        ``paths.text_dir`` and referenced by ``Paper.text_path``.
+        """
+
+        async def handle(item: StageItem) -> List[StageItem]:
+            key, paper = item
+            if process_pdfs and paper.metadata.source == "arxiv":
+                paper = await self.arxiv_fetcher.adownload_paper(paper)
+
+                if paper.pdf_path:
+                    result = await self.ingest_pool.ingest(
+                        paper.pdf_path, self.arxiv_fetcher.images_dir, paper.metadata.arxiv_id
+                    )
+                    if result.error:
+                        logger.warning(
+                            f"Skipping PDF content of {paper.metadata.arxiv_id}: {result.error}"
+                        )
+                    else:
+                        paper.text_path = result.text_path
+                        paper.image_paths = result.image_paths
+            return [(key, paper)]
+
+        return handle
+
+    def _make_summarize_handler(
+        self, results: List[Tuple[OrderKey, PaperSummary]]
+    ) -> Callable[[StageItem], Awaitable[List[StageItem]]]:
+        """Stage 4: summarize papers, collecting summaries with their order key."""
+
+        async def handle(item: StageItem) -> List[StageItem]:
+            key, paper = item
+            summary = await self.summarizer.asummarize_paper(paper)
+            results.append((key, summary))
+            return []
+
+        return handle
+
+    async def _run_stage(
+        self,
+        name: str,
+        inbox: asyncio.Queue,
+        outbox: asyncio.Queue | None,
+        handle: Callable[[StageItem], Awaitable[List[StageItem]]],
+        workers: int = 1,
+        finalize: Callable[[], Awaitable[List[StageItem]]] | None = None,
+    ) -> None:
+        """
+        Run one pipeline stage until its inbox is exhausted.
+
+        Args:
+            name: Stage name (for logging)
+            inbox: Queue to consume items from
+            outbox: Queue to emit items to (None for the last stage)
+            handle: Coroutine turning one input item into zero or more output items
+            workers: Number of concurrent workers consuming the inbox
+            finalize: Optional coroutine emitting items once the inbox is drained
+        """
+        started = time.perf_counter()
+        processed = 0
+
+        async def emit(items: List[StageItem]) -> None:
+            if outbox is not None:
+                for out in items:
+                    await outbox.put(out)
+
+        async def worker() -> None:
+            nonlocal processed
+            while True:
+                item = await inbox.get()
+                if item is _DONE:
+                    # Leave the marker for sibling workers
+                    await inbox.put(_DONE)
+                    return
+                await emit(await handle(item))
+                processed += 1
+
+        try:
+            await asyncio.gather(*(worker() for _ in range(max(1, workers))))
+            if finalize is not None:
+                await emit(await finalize())
+        finally:
+            if outbox is not None:
+                await outbox.put(_DONE)
+
+        logger.info(
+            f"Stage '{name}' finished: {processed} items in {time.perf_counter() - started:.1f}s"
+        )
+
     def _create_empty_report(self) -> SummaryReport:
         """Create an empty report when no papers are found."""
         return SummaryReport(
@@ -116,3 +445,60 @@ class PaperReviewPipeline:
             huggingface_count=0,
             summaries=[],
         )
+
+
+async def _iterate_in_thread(factory: Callable[[], Iterator[Any]], buffer: int = 1):
+    """
+    Consume a blocking iterator in a worker thread without stalling the event loop.
+
+    The thread blocks while the hand-off buffer is full, so a slow consumer
+    throttles the producer (backpressure). If the consumer stops early (e.g.
+    a source deadline), the thread is told to stop at its next item. It is a
+    daemon thread rather than an executor worker, so ``asyncio.run`` does not
+    wait for a blocked call to return at shutdown.
+
+    Args:
+        factory: Callable creating the iterator (called in the worker thread)
+        buffer: Number of items the thread may run ahead of the consumer
+
+    Yields:
+        Items produced by the iterator
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=buffer)
+    stop = threading.Event()
+    failure: List[BaseException] = []
+
+    def hand_off(item: Any) -> bool:
+        future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        while True:
+            try:
+                future.result(timeout=0.5)
+                return True
+            except concurrent.futures.TimeoutError:
+                if stop.is_set():
+                    future.cancel()
+                    return False
+
+    def produce() -> None:
+        try:
+            for item in factory():
+                if stop.is_set() or not hand_off(item):
+                    return
+        except BaseException as e:  # re-raised in the consumer
+            failure.append(e)
+        finally:
+            if not stop.is_set():
+                hand_off(_DONE)
+
+    threading.Thread(target=produce, name="source-iterator", daemon=True).start()
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                break
+            yield item
+        if failure:
+            raise failure[0]
+    finally:
+        stop.set()
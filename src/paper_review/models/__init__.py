@@ -1,12 +1,14 @@
 """Data models for paper review service."""
 
 from .filters import FilterConfig
+from .ingest import PDFIngestResult
 from .paper import NoveltyScore, Paper, PaperMetadata
 from .summary import PaperSummary, SummaryReport
 
 __all__ = [
     "FilterConfig",
     "NoveltyScore",
+    "PDFIngestResult",
     "Paper",
     "PaperMetadata",
     "PaperSummary",
@@ -0,0 +1,26 @@
+"""PDF ingestion data models."""
+
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class PDFIngestResult(BaseModel):
+    """PDF 한 번의 파싱으로 얻은 결과."""
+
+    pdf_path: str = Field(description="PDF 파일 경로")
+    text: str = Field(default="", description="추출된 전체 텍스트")
+    text_path: Optional[str] = Field(
+        default=None, description="텍스트를 파일로 저장한 경우 그 경로 (이때 text는 비어 있음)"
+    )
+    page_offsets: List[int] = Field(
+        default_factory=list, description="전체 텍스트에서 각 페이지가 시작하는 문자 위치"
+    )
+    page_count: int = Field(default=0, description="페이지 수")
+    metadata: Dict[str, Any] = Field(default_factory=dict, description="PDF 메타데이터")
+    image_paths: List[str] = Field(default_factory=list, description="추출된 이미지 경로")
+    timings: Dict[str, float] = Field(
+        default_factory=dict,
+        description="단계별 소요 시간(초): open, text, images, total",
+    )
+    error: Optional[str] = Field(default=None, description="실패 시 오류 메시지")
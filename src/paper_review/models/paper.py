@@ -71,6 +71,9 @@ class Paper(BaseModel):
     metadata: PaperMetadata = Field(description="논문 메타데이터")
     pdf_path: Optional[str] = Field(default=None, description="로컬 PDF 파일 경로")
     full_text: Optional[str] = Field(default=None, description="추출된 전체 텍스트")
+    text_path: Optional[str] = Field(
+        default=None, description="추출된 전체 텍스트 파일 경로 (프로세스 풀 처리 시)"
+    )
     image_paths: List[str] = Field(default_factory=list, description="추출된 이미지 경로")
     novelty_score: Optional[NoveltyScore] = Field(
         default=None, description="Novelty ranking 점수 (arXiv만)"
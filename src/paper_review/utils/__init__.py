@@ -1,13 +1,38 @@
 """Utility modules for paper review service."""
 
 from .arxiv import ArxivClient
+from .blob_store import BlobStore
+from .cache import LLMCache
+from .catalog import CatalogSync, HighWaterMark, PaperCatalog
+from .download import DownloadManager, TokenBucket
 from .image import ImageExtractor
-from .llm import OllamaClient
+from .ingest import PDFIngestor, PDFIngestPool
+from .listing import DailyListing
+from .llm import AsyncOllamaClient, OllamaClient
+from .novelty_index import NoveltyIndex
 from .pdf import PDFProcessor
+from .score_store import ScoreStore
+from .snapshot import SnapshotIngestor
+from .summary_store import SummaryStore
 
 __all__ = [
     "ArxivClient",
+    "AsyncOllamaClient",
+    "BlobStore",
+    "CatalogSync",
+    "DailyListing",
+    "DownloadManager",
+    "HighWaterMark",
     "ImageExtractor",
+    "LLMCache",
+    "NoveltyIndex",
     "OllamaClient",
+    "PDFIngestPool",
+    "PDFIngestor",
     "PDFProcessor",
+    "PaperCatalog",
+    "ScoreStore",
+    "SnapshotIngestor",
+    "SummaryStore",
+    "TokenBucket",
 ]
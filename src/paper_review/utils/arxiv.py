@@ -1,13 +1,64 @@
 """arXiv API client for fetching papers."""
 
-import arxiv
-from datetime import datetime
+import heapq
+import queue
+import threading
+import xml.etree.ElementTree as ET
+from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import IO, Any, Callable, Dict, Iterator, List
 
+import arxiv
+import requests
+import urllib3
 from loguru import logger
+from requests.adapters import HTTPAdapter
 
 from paper_review.models import PaperMetadata
+from paper_review.utils.download import TokenBucket, download_blocking, validate_pdf
+from paper_review.utils.listing import ARXIV, ATOM
+
+EXPORT_API_URL = "https://export.arxiv.org/api/query"
+
+# Export API failures worth another try: HTTP/connection errors, timeouts (including
+# reads of the streamed body, which urllib3 raises directly) and truncated feeds
+RETRYABLE_API_ERRORS = (
+    requests.HTTPError,
+    requests.ConnectionError,
+    requests.Timeout,
+    urllib3.exceptions.HTTPError,
+    ET.ParseError,
+)
+
+# End-of-stream marker for per-query producer threads
+_END = object()
+
+# Results buffered per parallel query ahead of the merge
+MERGE_BUFFER = 100
+
+
+class _ApiAdapter(HTTPAdapter):
+    """HTTP adapter pacing export API requests and giving them a default timeout."""
+
+    def __init__(self, timeout: float, limiter: TokenBucket, **kwargs: Any):
+        """
+        Initialize the adapter.
+
+        Args:
+            timeout: Timeout in seconds for requests sent without one
+            limiter: Token bucket acquired before every request
+            **kwargs: Passed to HTTPAdapter
+        """
+        super().__init__(**kwargs)
+        self.timeout = timeout
+        self.limiter = limiter
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        """Send a request once the limiter allows it, applying the default timeout."""
+        if kwargs.get("timeout") is None:  # The arxiv library sets none
+            kwargs["timeout"] = self.timeout
+        self.limiter.acquire_blocking()
+        return super().send(request, **kwargs)
 
 
 class ArxivClient:
@@ -26,13 +77,352 @@ class ArxivClient:
         self.sort_by = config.get("sort_by", "submittedDate")
         self.sort_order = config.get("sort_order", "descending")
 
-        # Create arXiv client
-        self.client = arxiv.Client()
+        # OR filters with this many categories are split into parallel per-category queries
+        self.split_threshold = config.get("split_threshold", 3)
+
+        # Every export API request, from any client or thread (and, with a lock
+        # file, any process), is paced by one shared limiter
+        self.delay_seconds = config.get("delay_seconds", 3.0)
+        self.api_limiter = TokenBucket.shared(
+            1 / self.delay_seconds if self.delay_seconds > 0 else 0,
+            lock_path=config.get("api_lock_file"),
+        )
+
+        # Create arXiv client (a stalled API request fails instead of outliving the deadline)
+        self.page_size = config.get("page_size", 100)
+        self.api_timeout = config.get("api_timeout", 30)
+        self.client = self._new_client()
+
+        # Pooled HTTP session for PDF downloads (keep-alive across papers)
+        self.download_timeout = config.get("download_timeout", 60)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=config.get("download_pool_size", 8))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Native export API path: pages fetched over the pooled session and parsed
+        # without feedparser or pydantic validation (see iter_recent_metadata)
+        self.native_fetch = config.get("native_fetch", False)
+        self.api_url = config.get("api_url", EXPORT_API_URL)
+        self.num_retries = config.get("num_retries", 3)
+
+        # Optional shared rate limiter for downloads (see DownloadManager.bucket)
+        self.rate_limiter: TokenBucket | None = None
 
         logger.info(f"Initialized ArxivClient for category: {self.category}")
 
+    def _new_client(self) -> arxiv.Client:
+        """Create an arXiv API client paced by ``api_limiter`` with ``api_timeout``."""
+        # The library's own per-client delay would not hold across parallel clients
+        client = arxiv.Client(page_size=self.page_size, delay_seconds=0)
+        adapter = _ApiAdapter(self.api_timeout, self.api_limiter)
+        client._session.mount("https://", adapter)
+        client._session.mount("http://", adapter)
+        return client
+
+    def plan_queries(self, cats: List[str], mode: str = "OR") -> List[List[str]]:
+        """
+        Split a category filter into the category groups to query.
+
+        AND filters become a single ``cat:A AND cat:B`` query. OR filters
+        with at least ``split_threshold`` categories become one query per
+        category (run concurrently and merged); arXiv pages large OR queries
+        slowly.
+
+        Args:
+            cats: Categories to search
+            mode: Category filter mode ("AND" or "OR")
+
+        Returns:
+            Category groups, one per query
+        """
+        if mode == "AND" or len(cats) < self.split_threshold:
+            return [cats]
+        return [[cat] for cat in cats]
+
+    def _build_query(
+        self,
+        cats: List[str],
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        mode: str = "OR",
+    ) -> str:
+        """Build an AND/OR query across the given categories, optionally limited to a date range."""
+        if len(cats) > 1:
+            query = f" {mode} ".join([f"cat:{cat}" for cat in cats])
+        else:
+            query = f"cat:{cats[0]}"
+
+        if date_from is None and date_to is None:
+            return query
+        if len(cats) > 1:
+            query = f"({query})"
+        return f"{query} AND {self._date_range_query(date_from, date_to)}"
+
+    @staticmethod
+    def _date_range_query(date_from: datetime | None, date_to: datetime | None) -> str:
+        """``submittedDate:[from TO to]`` clause (arXiv expects GMT as YYYYMMDDHHMM)."""
+        # arXiv started in 1991
+        start = to_utc(date_from or datetime(1991, 1, 1, tzinfo=UTC))
+        end = to_utc(date_to or datetime.now(UTC))
+        return f"submittedDate:[{start:%Y%m%d%H%M} TO {end:%Y%m%d%H%M}]"
+
+    def iter_recent_papers(
+        self,
+        categories: List[str] | None = None,
+        max_results: int | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        mode: str = "OR",
+    ) -> Iterator[arxiv.Result]:
+        """
+        Stream recent papers from arXiv as result pages arrive.
+
+        The date range is pushed into the query, and since results are sorted
+        by submission date (newest first) the stream stops at the first result
+        older than ``date_from``, so no further pages are requested. Split OR
+        queries (see ``plan_queries``) run in parallel threads and are merged
+        by submission date; papers listed in several categories are yielded once.
+
+        Args:
+            categories: List of categories to search (overrides config)
+            max_results: Maximum number of results (overrides config)
+            date_from: Earliest submission time (naive datetimes are local time)
+            date_to: Latest submission time (naive datetimes are local time)
+            mode: Category filter mode ("AND" or "OR")
+
+        Yields:
+            arXiv paper results in submission order (newest first)
+        """
+        max_res = max_results or self.max_results
+        start = to_utc(date_from) if date_from is not None else None
+        end = to_utc(date_to) if date_to is not None else None
+
+        def run_query(query: str, in_thread: bool) -> Iterator[arxiv.Result]:
+            # Each thread has its own client (arxiv.Client is not thread-safe)
+            client = self._new_client() if in_thread else self.client
+            return self._iter_query(client, query, max_res, start, end)
+
+        yield from self._iter_planned(
+            categories, max_res, date_from, date_to, mode, run_query,
+            lambda result: result.entry_id.split("/")[-1],
+        )
+
+    def iter_recent_metadata(
+        self,
+        categories: List[str] | None = None,
+        max_results: int | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        mode: str = "OR",
+    ) -> Iterator[PaperMetadata]:
+        """
+        Stream recent papers from arXiv as PaperMetadata.
+
+        Same queries and ordering as ``iter_recent_papers``. With
+        ``native_fetch`` enabled the export API pages are requested over the
+        pooled session and parsed as they stream in (see
+        ``parse_export_feed``), skipping feedparser and pydantic validation;
+        otherwise the ``arxiv`` library results are converted.
+
+        Args:
+            categories: List of categories to search (overrides config)
+            max_results: Maximum number of results (overrides config)
+            date_from: Earliest submission time (naive datetimes are local time)
+            date_to: Latest submission time (naive datetimes are local time)
+            mode: Category filter mode ("AND" or "OR")
+
+        Yields:
+            Paper metadata in submission order (newest first)
+        """
+        if not self.native_fetch:
+            for result in self.iter_recent_papers(
+                categories, max_results, date_from, date_to, mode
+            ):
+                yield self.to_paper_metadata(result)
+            return
+
+        max_res = max_results or self.max_results
+        start = to_utc(date_from) if date_from is not None else None
+        end = to_utc(date_to) if date_to is not None else None
+
+        def run_query(query: str, in_thread: bool) -> Iterator[PaperMetadata]:
+            return self._iter_query_native(query, max_res, start, end)
+
+        yield from self._iter_planned(
+            categories, max_res, date_from, date_to, mode, run_query,
+            lambda metadata: metadata.arxiv_id,
+        )
+
+    def _iter_planned(
+        self,
+        categories: List[str] | None,
+        max_res: int,
+        date_from: datetime | None,
+        date_to: datetime | None,
+        mode: str,
+        run_query: Callable[[str, bool], Iterator[Any]],
+        id_of: Callable[[Any], str],
+    ) -> Iterator[Any]:
+        """Plan the queries, run (and merge) them, and yield each paper once up to ``max_res``."""
+        cats = categories or self.categories or [self.category]
+        queries = [
+            self._build_query(group, date_from, date_to, mode)
+            for group in self.plan_queries(cats, mode)
+        ]
+
+        logger.info(
+            f"Streaming up to {max_res} recent papers from categories: {cats} "
+            f"({mode}, {len(queries)} quer{'y' if len(queries) == 1 else 'ies'})"
+        )
+
+        if len(queries) == 1:
+            results = run_query(queries[0], False)
+        else:
+            results = self._iter_merged(queries, run_query)
+
+        count = 0
+        seen: set[str] = set()
+        try:
+            for result in results:
+                arxiv_id = id_of(result)
+                if arxiv_id in seen:
+                    continue
+                seen.add(arxiv_id)
+                count += 1
+                yield result
+                if count >= max_res:
+                    break
+        finally:
+            results.close()
+
+        logger.info(f"Streamed {count} papers from categories: {cats}")
+
+    @staticmethod
+    def _iter_query(
+        client: arxiv.Client,
+        query: str,
+        max_results: int,
+        start: datetime | None,
+        end: datetime | None,
+    ) -> Iterator[arxiv.Result]:
+        """Run one query, stopping at the first result older than ``start``."""
+        search = arxiv.Search(
+            query=query,
+            max_results=max_results,
+            sort_by=arxiv.SortCriterion.SubmittedDate,
+            sort_order=arxiv.SortOrder.Descending,
+        )
+        for result in client.results(search):
+            published = to_utc(result.published)
+            if start is not None and published < start:
+                return
+            if end is None or published <= end:
+                yield result
+
+    def _iter_query_native(
+        self,
+        query: str,
+        max_results: int,
+        start: datetime | None,
+        end: datetime | None,
+    ) -> Iterator[PaperMetadata]:
+        """Page through one export API query, stopping at the first paper older than ``start``."""
+        offset = 0
+        tries = 0
+        while offset < max_results:
+            params = {
+                "search_query": query,
+                "start": offset,
+                "max_results": min(self.page_size, max_results - offset),
+                "sortBy": "submittedDate",
+                "sortOrder": "descending",
+            }
+            count = 0
+            try:
+                # Paced with every other API request in the process (and across
+                # processes when api_lock_file is set)
+                self.api_limiter.acquire_blocking()
+                with self.session.get(
+                    self.api_url, params=params, timeout=self.api_timeout, stream=True
+                ) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    for metadata in parse_export_feed(response.raw):
+                        count += 1
+                        if start is not None and metadata.published < start:
+                            return
+                        if end is None or metadata.published <= end:
+                            yield metadata
+            except RETRYABLE_API_ERRORS as e:
+                # A page that already yielded papers cannot be retried without duplicates
+                if count or tries >= self.num_retries:
+                    raise
+                tries += 1
+                logger.debug(f"arXiv API request failed (try {tries}): {e}")
+                continue
+
+            if count == 0 and offset > 0 and tries < self.num_retries:
+                # arXiv occasionally returns spurious empty pages
+                tries += 1
+                continue
+            if count < params["max_results"]:
+                return
+            offset += count
+            tries = 0
+
+    def _iter_merged(
+        self, queries: List[str], run_query: Callable[[str, bool], Iterator[Any]]
+    ) -> Iterator[Any]:
+        """Run queries in parallel threads and k-way merge them by submission date."""
+        stop = threading.Event()
+
+        def put(out: queue.Queue, item: Any) -> bool:
+            # Bounded queues: wait for the merge, but give up once it has stopped
+            while not stop.is_set():
+                try:
+                    out.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce(query: str, out: queue.Queue) -> None:
+            try:
+                for result in run_query(query, True):
+                    if not put(out, result):
+                        return
+            except BaseException as e:  # re-raised in the consumer
+                put(out, e)
+            finally:
+                put(out, _END)
+
+        def drain(out: queue.Queue) -> Iterator[Any]:
+            while (item := out.get()) is not _END:
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+
+        streams = []
+        for query in queries:
+            out: queue.Queue = queue.Queue(maxsize=MERGE_BUFFER)
+            threading.Thread(target=produce, args=(query, out), daemon=True).start()
+            streams.append(drain(out))
+
+        try:
+            yield from heapq.merge(
+                *streams, key=lambda result: to_utc(result.published), reverse=True
+            )
+        finally:
+            stop.set()
+
     def fetch_recent_papers(
-        self, categories: List[str] | None = None, max_results: int | None = None
+        self,
+        categories: List[str] | None = None,
+        max_results: int | None = None,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        mode: str = "OR",
     ) -> List[arxiv.Result]:
         """
         Fetch recent papers from arXiv.
@@ -40,6 +430,9 @@ class ArxivClient:
         Args:
             categories: List of categories to search (overrides config)
             max_results: Maximum number of results (overrides config)
+            date_from: Earliest submission time (pushed into the query)
+            date_to: Latest submission time (pushed into the query)
+            mode: Category filter mode ("AND" or "OR")
 
         Returns:
             List of arXiv paper results
@@ -47,24 +440,11 @@ class ArxivClient:
         cats = categories or self.categories or [self.category]
         max_res = max_results or self.max_results
 
-        logger.info(f"Fetching {max_res} recent papers from categories: {cats}")
+        logger.info(f"Fetching up to {max_res} recent papers from categories: {cats}")
 
         try:
-            # Create query for multiple categories with OR condition
-            if len(cats) > 1:
-                query = " OR ".join([f"cat:{cat}" for cat in cats])
-            else:
-                query = f"cat:{cats[0]}"
-
-            search = arxiv.Search(
-                query=query,
-                max_results=max_res,
-                sort_by=arxiv.SortCriterion.SubmittedDate,
-                sort_order=arxiv.SortOrder.Descending,
-            )
-
             # Fetch results
-            results = list(self.client.results(search))
+            results = list(self.iter_recent_papers(cats, max_res, date_from, date_to, mode))
 
             logger.info(f"Successfully fetched {len(results)} papers")
 
@@ -110,26 +490,69 @@ class ArxivClient:
         Returns:
             Path to downloaded PDF file
         """
-        Path(download_dir).mkdir(parents=True, exist_ok=True)
+        return self.download_pdf_url(paper.entry_id.split("/")[-1], paper.pdf_url, download_dir)
 
-        # Generate filename from paper ID
-        paper_id = paper.entry_id.split("/")[-1]
-        filename = f"{paper_id}.pdf"
-        filepath = Path(download_dir) / filename
+    def download_pdf_url(self, paper_id: str, pdf_url: str, download_dir: str) -> str:
+        """
+        Download a PDF from its URL over the pooled session (reusing a valid existing file).
 
-        # Check if PDF already exists
-        if filepath.exists():
-            logger.info(f"PDF already exists, skipping download: {paper_id}")
-            return str(filepath)
+        Args:
+            paper_id: arXiv ID (used as the file name)
+            pdf_url: PDF URL (e.g. PaperMetadata.pdf_url)
+            download_dir: Directory to save PDF
 
-        # Download PDF
+        Returns:
+            Path to downloaded PDF file
+        """
+        filepath = Path(download_dir) / f"{paper_id}.pdf"
+        pdf_url = self.normalize_pdf_url(pdf_url)
+
+        # Atomic, resumable and validated (corrupt files are quarantined and re-downloaded)
         logger.info(f"Downloading PDF for paper: {paper_id}")
-        paper.download_pdf(dirpath=download_dir, filename=filename)
+        download_blocking(
+            self.session,
+            pdf_url,
+            filepath,
+            timeout=self.download_timeout,
+            validate=validate_pdf,
+            rate_limiter=self.rate_limiter,
+        )
 
-        logger.info(f"PDF downloaded to: {filepath}")
+        logger.info(f"PDF available at: {filepath}")
 
         return str(filepath)
 
+    @staticmethod
+    def normalize_pdf_url(pdf_url: str) -> str:
+        """Use https for arXiv PDF URLs (arXiv redirects http, costing a round trip)."""
+        if pdf_url.startswith("http://arxiv.org/"):
+            return "https://" + pdf_url[len("http://") :]
+        return pdf_url
+
+    def lookup(self, arxiv_ids: List[str]) -> Dict[str, arxiv.Result]:
+        """
+        Fetch several papers by ID with a single batched ``id_list`` query.
+
+        Args:
+            arxiv_ids: arXiv IDs, with or without version
+
+        Returns:
+            Mapping from each requested ID to its result (missing IDs are omitted)
+        """
+        if not arxiv_ids:
+            return {}
+
+        logger.info(f"Looking up {len(arxiv_ids)} papers on arXiv")
+        search = arxiv.Search(id_list=list(arxiv_ids), max_results=len(arxiv_ids))
+
+        found: Dict[str, arxiv.Result] = {}
+        for result in self.client.results(search):
+            versioned = result.entry_id.split("/")[-1]
+            found[versioned] = result
+            found[versioned.rsplit("v", 1)[0]] = result
+
+        return {arxiv_id: found[arxiv_id] for arxiv_id in arxiv_ids if arxiv_id in found}
+
     def to_paper_metadata(self, paper: arxiv.Result) -> PaperMetadata:
         """
         Convert arXiv result to PaperMetadata.
@@ -156,3 +579,75 @@ class ArxivClient:
             source="arxiv",
             tags=paper.categories,  # For arXiv, tags = categories
         )
+
+
+def parse_export_feed(source: IO[bytes]) -> Iterator[PaperMetadata]:
+    """
+    Stream papers from an arXiv export API (Atom) response.
+
+    The document is parsed incrementally with ``iterparse`` and each entry is
+    dropped once converted. Metadata is built with ``model_construct``: every
+    field comes straight from arXiv's schema with the right type, so pydantic
+    validation is skipped.
+
+    Args:
+        source: Binary file-like object with the Atom document
+
+    Yields:
+        Metadata of the papers in the response (ValueError on an arXiv error entry)
+    """
+    root = None
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if root is None:
+            root = elem
+            continue
+        if event != "end" or elem.tag != f"{ATOM}entry":
+            continue
+
+        entry_id = elem.findtext(f"{ATOM}id", "")
+        if "/api/errors" in entry_id:
+            raise ValueError(f"arXiv API error: {elem.findtext(f'{ATOM}summary', '').strip()}")
+
+        arxiv_id = entry_id.rsplit("/", 1)[-1]
+        categories = [c.get("term") for c in elem.iter(f"{ATOM}category")]
+        primary = elem.find(f"{ARXIV}primary_category")
+        pdf_url = next(
+            (link.get("href") for link in elem.iter(f"{ATOM}link") if link.get("title") == "pdf"),
+            f"https://arxiv.org/pdf/{arxiv_id}",
+        )
+        updated = elem.findtext(f"{ATOM}updated")
+
+        yield PaperMetadata.model_construct(
+            title=" ".join(elem.findtext(f"{ATOM}title", "").split()),
+            authors=[name.text for name in elem.iter(f"{ATOM}name") if name.text],
+            summary=elem.findtext(f"{ATOM}summary", "").strip(),
+            published=datetime.fromisoformat(elem.findtext(f"{ATOM}published")),
+            updated=datetime.fromisoformat(updated) if updated else None,
+            arxiv_id=arxiv_id,
+            pdf_url=pdf_url,
+            primary_category=primary.get("term") if primary is not None else categories[0],
+            categories=categories,
+            doi=elem.findtext(f"{ARXIV}doi"),
+            journal_ref=elem.findtext(f"{ARXIV}journal_ref"),
+            comment=elem.findtext(f"{ARXIV}comment"),
+            source="arxiv",
+            tags=categories,  # For arXiv, tags = categories
+        )
+        # Finished entries are children of the feed element
+        root.clear()
+
+
+def to_utc(value: datetime) -> datetime:
+    """
+    Convert a datetime to aware UTC.
+
+    arXiv timestamps are aware (UTC) while FilterConfig date ranges are naive
+    local times; comparing them directly raises TypeError.
+
+    Args:
+        value: Naive (local time) or aware datetime
+
+    Returns:
+        Aware datetime in UTC
+    """
+    return value.astimezone(UTC)
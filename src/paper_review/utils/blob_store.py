@@ -0,0 +1,376 @@
+"""Content-addressed store for downloaded PDFs and extracted figures."""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+from loguru import logger
+
+from paper_review.utils.store import SQLiteStore
+
+
+class BlobStore(SQLiteStore):
+    """
+    Content-addressed file store with a SQLite index and a disk quota.
+
+    Files are stored once under ``<root>/<aa>/<sha256>.<ext>``, so identical
+    figures are deduplicated and concurrent runs never overwrite each other's
+    files. The index maps ``(paper_id, role)`` (e.g. ``("2511.14899v1",
+    "pdf")`` or ``("2511.14899v1", "image_1")``) to blobs. Writes go to a
+    temporary file that is renamed into place. Above ``max_size_gb`` the least
+    recently used blobs are evicted, except pinned ones (e.g. figures of
+    recent reports). Every blob a run writes or reads is also pinned by a
+    lease for ``lease_hours``, so eviction never removes a file a run in
+    progress (in any process) still needs before its report pins it.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS blobs (
+        digest TEXT PRIMARY KEY,
+        ext TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        created_at REAL NOT NULL,
+        accessed_at REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_blobs_accessed ON blobs(accessed_at);
+    CREATE TABLE IF NOT EXISTS refs (
+        paper_id TEXT NOT NULL,
+        role TEXT NOT NULL,
+        digest TEXT NOT NULL,
+        PRIMARY KEY (paper_id, role)
+    );
+    CREATE INDEX IF NOT EXISTS idx_refs_digest ON refs(digest);
+    CREATE TABLE IF NOT EXISTS pins (
+        owner TEXT NOT NULL,
+        digest TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        PRIMARY KEY (owner, digest)
+    );
+    CREATE INDEX IF NOT EXISTS idx_pins_digest ON pins(digest);
+    """
+
+    # Run eviction after this many inserts
+    EVICT_INTERVAL = 20
+
+    # Pin owner of the leases taken when a blob is written or read
+    LEASE_OWNER = "lease"
+
+    def __init__(
+        self,
+        root: str | Path = "data/blobs",
+        index_path: str | Path | None = None,
+        max_size_gb: float | None = 10,
+        pin_days: float = 7,
+        lease_hours: float = 24,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory holding the blob files
+            index_path: Path to the SQLite index (default: ``<root>/index.sqlite3``)
+            max_size_gb: Disk quota for all blobs (None = unbounded)
+            pin_days: Pins older than this are released by ``release_pins``
+            lease_hours: Leases older than this are released by ``release_pins``
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        super().__init__(index_path or self.root / "index.sqlite3")
+        self.max_bytes = int(max_size_gb * 1024**3) if max_size_gb is not None else None
+        self.pin_age = pin_days * 86400
+        self.lease_age = lease_hours * 3600
+
+        self.hits = 0
+        self.misses = 0
+        self.deduplicated = 0
+        self._puts_since_evict = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "BlobStore | None":
+        """
+        Create a store from the ``blob_store`` config section.
+
+        Args:
+            config: blob_store configuration dictionary
+
+        Returns:
+            BlobStore, or None if disabled
+        """
+        if not config.get("enabled", False):
+            return None
+
+        return cls(
+            root=config.get("root", "data/blobs"),
+            index_path=config.get("index_path"),
+            max_size_gb=config.get("max_size_gb", 10),
+            pin_days=config.get("pin_days", 7),
+            lease_hours=config.get("lease_hours", 24),
+        )
+
+    def blob_path(self, digest: str, ext: str) -> Path:
+        """Location of a blob file."""
+        return self.root / digest[:2] / f"{digest}{ext}"
+
+    def get(self, paper_id: str, role: str) -> Path | None:
+        """
+        Look up a paper's blob and mark it as recently used.
+
+        Args:
+            paper_id: Paper identifier
+            role: Blob role (e.g. "pdf", "image_1")
+
+        Returns:
+            Path to the file, or None if not stored
+        """
+        now = time.time()
+        with self.transaction() as conn:
+            row = conn.execute(
+                "SELECT b.digest, b.ext FROM refs r JOIN blobs b ON b.digest = r.digest "
+                "WHERE r.paper_id = ? AND r.role = ?",
+                (paper_id, role),
+            ).fetchone()
+            if row is not None:
+                conn.execute("UPDATE blobs SET accessed_at = ? WHERE digest = ?", (now, row[0]))
+                self._lease(conn, row[0], now)
+
+        path = self.blob_path(*row) if row is not None else None
+        if path is None or not path.exists():
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return path
+
+    def put_bytes(self, data: bytes, paper_id: str, role: str, ext: str) -> Path:
+        """
+        Store file content for a paper.
+
+        Args:
+            data: File content
+            paper_id: Paper identifier
+            role: Blob role (e.g. "pdf", "image_1")
+            ext: File extension including the dot (e.g. ".png")
+
+        Returns:
+            Path to the stored blob
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        # Leased before the existence check, so eviction cannot remove the file after it
+        path = self._register(digest, ext, len(data), paper_id, role)
+        if not path.exists():
+            self._write_atomic(path, lambda f: f.write(data))
+        return path
+
+    def put_file(self, source: str | Path, paper_id: str, role: str, move: bool = True) -> Path:
+        """
+        Store an existing file for a paper.
+
+        Args:
+            source: File to store
+            paper_id: Paper identifier
+            role: Blob role (e.g. "pdf")
+            move: Remove ``source`` once it is stored
+
+        Returns:
+            Path to the stored blob
+        """
+        source = Path(source)
+        sha = hashlib.sha256()
+        with open(source, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+
+        # Leased before the existence check, so eviction cannot remove the file after it
+        path = self._register(digest, source.suffix, source.stat().st_size, paper_id, role)
+        if not path.exists():
+            with open(source, "rb") as src:
+                self._write_atomic(path, lambda f: shutil.copyfileobj(src, f, 1 << 20))
+        if move:
+            source.unlink(missing_ok=True)
+
+        return path
+
+    def paths(self, paper_id: str) -> Dict[str, Path]:
+        """
+        All stored blobs of a paper.
+
+        Args:
+            paper_id: Paper identifier
+
+        Returns:
+            Mapping of role to blob path
+        """
+        rows = self.query(
+            "SELECT r.role, b.digest, b.ext FROM refs r JOIN blobs b ON b.digest = r.digest "
+            "WHERE r.paper_id = ?",
+            (paper_id,),
+        )
+        return {role: self.blob_path(digest, ext) for role, digest, ext in rows}
+
+    def pin(self, paper_ids: Iterable[str], owner: str) -> int:
+        """
+        Protect every blob of the given papers from eviction.
+
+        Args:
+            paper_ids: Paper identifiers
+            owner: Pin owner (e.g. "report:2025-11-20"); pins are released per owner
+
+        Returns:
+            Number of blobs pinned
+        """
+        paper_ids = list(paper_ids)
+        if not paper_ids:
+            return 0
+
+        placeholders = ",".join("?" * len(paper_ids))
+        with self.transaction() as conn:
+            return conn.execute(
+                f"INSERT OR REPLACE INTO pins (owner, digest, created_at) "
+                f"SELECT DISTINCT ?, digest, ? FROM refs WHERE paper_id IN ({placeholders})",
+                (owner, time.time(), *paper_ids),
+            ).rowcount
+
+    def unpin(self, owner: str) -> int:
+        """
+        Release all pins of an owner.
+
+        Args:
+            owner: Pin owner
+
+        Returns:
+            Number of pins released
+        """
+        with self.transaction() as conn:
+            return conn.execute("DELETE FROM pins WHERE owner = ?", (owner,)).rowcount
+
+    def release_pins(self) -> int:
+        """
+        Release pins older than ``pin_days`` and leases older than ``lease_hours``.
+
+        Returns:
+            Number of pins released
+        """
+        now = time.time()
+        with self.transaction() as conn:
+            return conn.execute(
+                "DELETE FROM pins WHERE created_at < CASE WHEN owner = ? THEN ? ELSE ? END",
+                (self.LEASE_OWNER, now - self.lease_age, now - self.pin_age),
+            ).rowcount
+
+    def evict(self) -> int:
+        """
+        Remove least recently used unpinned blobs until under the disk quota.
+
+        Returns:
+            Number of evicted blobs
+        """
+        self._puts_since_evict = 0
+        if self.max_bytes is None:
+            return 0
+
+        stale: List[tuple] = []
+        with self.transaction() as conn:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+            if total <= self.max_bytes:
+                return 0
+
+            candidates = conn.execute(
+                "SELECT digest, ext, size FROM blobs "
+                "WHERE digest NOT IN (SELECT digest FROM pins) ORDER BY accessed_at"
+            ).fetchall()
+            for digest, ext, size in candidates:
+                if total <= self.max_bytes:
+                    break
+                # The pin check is repeated under the write lock: another process may
+                # have leased the blob since the SELECT
+                if conn.execute(
+                    "DELETE FROM blobs WHERE digest = ? AND digest NOT IN (SELECT digest FROM pins)",
+                    (digest,),
+                ).rowcount:
+                    conn.execute("DELETE FROM refs WHERE digest = ?", (digest,))
+                    stale.append((digest, ext))
+                    total -= size
+
+            # Removed before the write lock is released: a concurrent put either leases
+            # the blob first (and keeps it) or registers it afterwards and rewrites it
+            for digest, ext in stale:
+                self.blob_path(digest, ext).unlink(missing_ok=True)
+
+        if stale:
+            logger.info(f"Evicted {len(stale)} blobs (still {total / 1024**2:.0f} MB stored)")
+        if total > self.max_bytes:
+            logger.warning("Blob store is over quota with only pinned blobs left")
+        return len(stale)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get store counters.
+
+        Returns:
+            Dictionary with hits, misses, deduplicated writes, blob count,
+            total size and pinned blob count
+        """
+        blobs, size = self.query("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs")[0]
+        pinned = self.query("SELECT COUNT(DISTINCT digest) FROM pins")[0][0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "deduplicated": self.deduplicated,
+            "blobs": blobs,
+            "size_bytes": size,
+            "pinned": pinned,
+        }
+
+    def _register(self, digest: str, ext: str, size: int, paper_id: str, role: str) -> Path:
+        """Index a blob, point the paper's role at it, lease it and evict if due."""
+        now = time.time()
+        with self.transaction() as conn:
+            inserted = conn.execute(
+                "INSERT OR IGNORE INTO blobs (digest, ext, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (digest, ext, size, now, now),
+            ).rowcount
+            if not inserted:
+                conn.execute("UPDATE blobs SET accessed_at = ? WHERE digest = ?", (now, digest))
+            conn.execute(
+                "INSERT OR REPLACE INTO refs (paper_id, role, digest) VALUES (?, ?, ?)",
+                (paper_id, role, digest),
+            )
+            # Pinned in the same transaction, so no eviction can see it unpinned
+            self._lease(conn, digest, now)
+
+        if inserted:
+            self._puts_since_evict += 1
+            if self._puts_since_evict >= self.EVICT_INTERVAL:
+                self.evict()
+        else:
+            self.deduplicated += 1
+
+        return self.blob_path(digest, ext)
+
+    def _lease(self, conn, digest: str, now: float) -> None:
+        """Pin a blob in use by a run until its lease expires."""
+        conn.execute(
+            "INSERT OR REPLACE INTO pins (owner, digest, created_at) VALUES (?, ?, ?)",
+            (self.LEASE_OWNER, digest, now),
+        )
+
+    @staticmethod
+    def _write_atomic(path: Path, write) -> None:
+        """Write a file via a temporary file in the same directory and rename it."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
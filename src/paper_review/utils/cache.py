@@ -0,0 +1,209 @@
+"""Persistent cache for LLM responses."""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+from loguru import logger
+
+from paper_review.utils.store import SQLiteStore
+
+
+class LLMCache(SQLiteStore):
+    """
+    Content-addressed on-disk cache of LLM responses.
+
+    Entries are keyed by a hash of everything that determines a generation
+    (model, system prompt, prompt, sampling options and output format), and
+    evicted by age and by total size (least recently used first).
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS responses (
+        key TEXT PRIMARY KEY,
+        model TEXT NOT NULL,
+        response TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        created_at REAL NOT NULL,
+        accessed_at REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at);
+    """
+
+    # Run eviction after this many inserts
+    EVICT_INTERVAL = 100
+
+    def __init__(
+        self,
+        path: str | Path = "data/cache/llm.sqlite3",
+        max_size_mb: float = 512,
+        max_age_days: float = 30,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Path to the SQLite database file
+            max_size_mb: Maximum total size of cached responses
+            max_age_days: Entries older than this are treated as misses and evicted
+        """
+        super().__init__(path)
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.max_age = max_age_days * 86400
+
+        self.hits = 0
+        self.misses = 0
+        self._puts_since_evict = 0
+
+        self.evict()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "LLMCache | None":
+        """
+        Create a cache from the ``llm_cache`` config section.
+
+        Args:
+            config: llm_cache configuration dictionary
+
+        Returns:
+            LLMCache, or None if caching is disabled
+        """
+        if not config.get("enabled", False):
+            return None
+
+        return cls(
+            path=config.get("path", "data/cache/llm.sqlite3"),
+            max_size_mb=config.get("max_size_mb", 512),
+            max_age_days=config.get("max_age_days", 30),
+        )
+
+    @staticmethod
+    def make_key(
+        model: str,
+        prompt: str,
+        system_prompt: str | None,
+        options: Dict[str, Any],
+        format: str | None,
+    ) -> str:
+        """
+        Build the cache key for a generation request.
+
+        Args:
+            model: Model name
+            prompt: User prompt
+            system_prompt: System prompt
+            options: Sampling options (temperature, num_predict, ...)
+            format: Output format constraint (e.g. "json")
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        material = json.dumps(
+            {
+                "model": model,
+                "system": system_prompt,
+                "prompt": prompt,
+                "options": options,
+                "format": format,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached response text, or None on a miss
+        """
+        now = time.time()
+        with self.transaction() as conn:
+            row = conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None or now - row[1] > self.max_age:
+                if row is not None:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+
+        self.hits += 1
+        return row[0]
+
+    def put(self, key: str, model: str, response: str) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key from make_key
+            model: Model name (kept for inspection)
+            response: Response text
+        """
+        now = time.time()
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, model, response, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, len(response.encode("utf-8")), now, now),
+            )
+
+        self._puts_since_evict += 1
+        if self._puts_since_evict >= self.EVICT_INTERVAL:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        Remove expired entries, then least recently used ones until under the size limit.
+
+        Returns:
+            Number of evicted entries
+        """
+        self._puts_since_evict = 0
+        with self.transaction() as conn:
+            evicted = conn.execute(
+                "DELETE FROM responses WHERE created_at < ?", (time.time() - self.max_age,)
+            ).rowcount
+
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+            if total > self.max_bytes:
+                stale = []
+                for key, size in conn.execute(
+                    "SELECT key, size FROM responses ORDER BY accessed_at"
+                ):
+                    if total <= self.max_bytes:
+                        break
+                    stale.append((key,))
+                    total -= size
+                conn.executemany("DELETE FROM responses WHERE key = ?", stale)
+                evicted += len(stale)
+
+        if evicted:
+            logger.info(f"Evicted {evicted} LLM cache entries")
+        return evicted
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with hits, misses, hit rate, entry count and total size
+        """
+        entries, size = self.query("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses")[0]
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "size_bytes": size,
+        }
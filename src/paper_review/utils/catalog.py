@@ -0,0 +1,474 @@
+"""Local mirror of arXiv paper metadata, kept up to date incrementally."""
+
+import asyncio
+import sqlite3
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Set, Tuple
+
+from loguru import logger
+
+from paper_review.models import FilterConfig, PaperMetadata
+from paper_review.utils.arxiv import ArxivClient, to_utc
+from paper_review.utils.store import SQLiteStore
+
+# (arxiv_id, published timestamp, primary category, PaperMetadata JSON, all categories)
+CatalogRow = Tuple[str, float, str, str, List[str]]
+
+
+class HighWaterMark(NamedTuple):
+    """Harvested time range of one category."""
+
+    since: datetime  # Oldest submission time covered
+    until: datetime  # Newest submission time seen
+    arxiv_id: str | None  # Paper seen at ``until``
+
+
+class PaperCatalog(SQLiteStore):
+    """
+    On-disk mirror of arXiv metadata with per-category high-water marks.
+
+    Each category records the contiguous submission time range harvested
+    so far, so a run only asks arXiv for papers newer than the mark (and
+    for older ones when a wider date range is requested). Papers are
+    indexed by submission time and primary category, and a category join
+    table lets ``search`` translate a FilterConfig into one SQL query.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS papers (
+        arxiv_id TEXT PRIMARY KEY,
+        published REAL NOT NULL,
+        primary_category TEXT NOT NULL,
+        metadata TEXT NOT NULL,
+        harvested_at REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_papers_published ON papers(published);
+    CREATE INDEX IF NOT EXISTS idx_papers_primary ON papers(primary_category, published);
+    CREATE TABLE IF NOT EXISTS paper_categories (
+        category TEXT NOT NULL,
+        arxiv_id TEXT NOT NULL,
+        published REAL NOT NULL,
+        PRIMARY KEY (category, arxiv_id)
+    );
+    CREATE INDEX IF NOT EXISTS idx_paper_categories_published
+        ON paper_categories(category, published);
+    CREATE INDEX IF NOT EXISTS idx_paper_categories_paper ON paper_categories(arxiv_id);
+    CREATE TABLE IF NOT EXISTS watermarks (
+        category TEXT PRIMARY KEY,
+        since REAL NOT NULL,
+        until REAL NOT NULL,
+        arxiv_id TEXT,
+        updated_at REAL NOT NULL
+    );
+    """
+
+    def __init__(self, path: str | Path = "data/cache/arxiv_catalog.sqlite3"):
+        """
+        Initialize the catalog.
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        super().__init__(path)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "PaperCatalog | None":
+        """
+        Create a catalog from the ``arxiv.catalog`` config section.
+
+        Args:
+            config: catalog configuration dictionary
+
+        Returns:
+            PaperCatalog, or None if disabled
+        """
+        if not config.get("enabled", False):
+            return None
+
+        return cls(path=config.get("path", "data/cache/arxiv_catalog.sqlite3"))
+
+    def get_mark(self, category: str) -> HighWaterMark | None:
+        """
+        Get the harvested range of a category.
+
+        Args:
+            category: arXiv category (e.g. "cs.LG")
+
+        Returns:
+            HighWaterMark, or None if the category was never harvested
+        """
+        rows = self.query(
+            "SELECT since, until, arxiv_id FROM watermarks WHERE category = ?", (category,)
+        )
+        if not rows:
+            return None
+
+        since, until, arxiv_id = rows[0]
+        return HighWaterMark(_from_timestamp(since), _from_timestamp(until), arxiv_id)
+
+    def update_mark(
+        self,
+        category: str,
+        since: datetime,
+        newest: datetime | None = None,
+        arxiv_id: str | None = None,
+    ) -> HighWaterMark:
+        """
+        Extend the harvested range of a category (marks never move backwards).
+
+        Args:
+            category: arXiv category
+            since: Oldest submission time covered by the harvest
+            newest: Submission time of the newest paper seen (None if none)
+            arxiv_id: Id of the newest paper seen
+
+        Returns:
+            Updated HighWaterMark
+        """
+        with self.transaction() as conn:
+            row = conn.execute(
+                "SELECT since, until, arxiv_id FROM watermarks WHERE category = ?", (category,)
+            ).fetchone()
+
+            new_since = since.timestamp()
+            new_until, new_id = (newest.timestamp(), arxiv_id) if newest else (new_since, None)
+            if row is not None:
+                new_since = min(new_since, row[0])
+                if row[1] >= new_until:
+                    new_until, new_id = row[1], row[2]
+
+            conn.execute(
+                "INSERT OR REPLACE INTO watermarks (category, since, until, arxiv_id, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (category, new_since, new_until, new_id, time.time()),
+            )
+
+        return HighWaterMark(_from_timestamp(new_since), _from_timestamp(new_until), new_id)
+
+    def covers(self, categories: List[str], date_from: datetime) -> bool:
+        """
+        Whether every category has been harvested back to ``date_from``.
+
+        Args:
+            categories: arXiv categories
+            date_from: Oldest submission time needed (naive datetimes are local time)
+
+        Returns:
+            True if the catalog alone can answer the range
+        """
+        since = to_utc(date_from)
+        for category in categories:
+            mark = self.get_mark(category)
+            if mark is None or mark.since > since:
+                return False
+        return True
+
+    def add_many(self, papers: List[PaperMetadata]) -> int:
+        """
+        Add (or refresh) paper metadata.
+
+        Args:
+            papers: Metadata of harvested arXiv papers
+
+        Returns:
+            Number of papers not previously in the catalog
+        """
+        if not papers:
+            return 0
+
+        rows = [
+            (
+                p.arxiv_id,
+                p.published.timestamp(),
+                p.primary_category,
+                p.model_dump_json(),
+                p.categories,
+            )
+            for p in papers
+        ]
+        with self.transaction() as conn:
+            before = conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+            self._insert(conn, rows)
+            after = conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+
+        return after - before
+
+    def add_rows(self, rows: List[CatalogRow]) -> None:
+        """
+        Bulk-insert pre-serialized papers in one transaction (used for backfills).
+
+        Args:
+            rows: Catalog rows; the metadata JSON must be a valid PaperMetadata
+        """
+        with self.transaction() as conn:
+            self._insert(conn, rows)
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, rows: Iterable[CatalogRow]) -> None:
+        """Upsert papers and rewrite their category memberships."""
+        rows = list(rows)
+        now = time.time()
+        conn.executemany(
+            "INSERT OR REPLACE INTO papers "
+            "(arxiv_id, published, primary_category, metadata, harvested_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(row[0], row[1], row[2], row[3], now) for row in rows],
+        )
+        conn.executemany(
+            "DELETE FROM paper_categories WHERE arxiv_id = ?", [(row[0],) for row in rows]
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO paper_categories (category, arxiv_id, published) "
+            "VALUES (?, ?, ?)",
+            [
+                (category, arxiv_id, published)
+                for arxiv_id, published, primary, _, categories in rows
+                for category in set(categories) | {primary}
+            ],
+        )
+
+    def search(self, filter_config: FilterConfig, limit: int | None = None) -> List[PaperMetadata]:
+        """
+        Papers matching the arXiv part of a filter (date range and AND/OR categories).
+
+        Args:
+            filter_config: Filter configuration
+            limit: Maximum number of papers (None = all)
+
+        Returns:
+            Paper metadata, newest first
+        """
+        sql, params = self._filter_sql(filter_config)
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        papers = []
+        for arxiv_id, metadata in self.query(sql, params):
+            try:
+                papers.append(PaperMetadata.model_validate_json(metadata))
+            except ValueError as e:
+                logger.warning(f"Ignoring invalid catalog entry for {arxiv_id}: {e}")
+        return papers
+
+    @staticmethod
+    def _filter_sql(filter_config: FilterConfig) -> Tuple[str, List[Any]]:
+        """Translate a FilterConfig into a query over the mirror."""
+        date_from, date_to = filter_config.get_date_range()
+        params: List[Any] = [date_from.timestamp(), date_to.timestamp()]
+        categories = sorted(set(filter_config.arxiv_categories))
+
+        if not categories:
+            sql = "SELECT arxiv_id, metadata FROM papers p WHERE p.published BETWEEN ? AND ?"
+        else:
+            placeholders = ",".join("?" * len(categories))
+            # Each category is an index range scan on (category, published)
+            sql = (
+                "SELECT p.arxiv_id, p.metadata FROM papers p JOIN ("
+                "SELECT arxiv_id FROM paper_categories "
+                f"WHERE category IN ({placeholders}) AND published BETWEEN ? AND ? "
+                "GROUP BY arxiv_id"
+            )
+            params = [*categories, *params]
+            if filter_config.arxiv_filter_mode == "AND":
+                sql += " HAVING COUNT(*) = ?"
+                params.append(len(categories))
+            sql += ") c ON c.arxiv_id = p.arxiv_id"
+
+        return sql + " ORDER BY p.published DESC", params
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get catalog counters.
+
+        Returns:
+            Dictionary with paper and category counts
+        """
+        papers = self.query("SELECT COUNT(*) FROM papers")[0][0]
+        categories = self.query("SELECT COUNT(*) FROM watermarks")[0][0]
+        return {"papers": papers, "categories": categories}
+
+
+class CatalogSync:
+    """
+    Keep a PaperCatalog up to date from the arXiv API.
+
+    ``harvest`` is called by the fetcher before it serves a filter from the
+    catalog; ``run`` keeps a fixed set of categories synced in the background
+    (e.g. in the web application) so that listings never wait for arXiv.
+    """
+
+    def __init__(
+        self,
+        catalog: PaperCatalog,
+        client: ArxivClient,
+        overlap_minutes: float = 60,
+        categories: List[str] | None = None,
+        days_back: int = 7,
+        interval_minutes: float = 30,
+    ):
+        """
+        Initialize the sync.
+
+        Args:
+            catalog: Catalog to fill
+            client: arXiv API client
+            overlap_minutes: Re-query this far behind a mark for late-indexed papers
+            categories: Categories kept synced by ``run`` (default: the client's)
+            days_back: History that ``run`` keeps covered
+            interval_minutes: Pause between background syncs
+        """
+        self.catalog = catalog
+        self.client = client
+        self.overlap = timedelta(minutes=overlap_minutes)
+        self.categories = categories or client.categories or [client.category]
+        self.days_back = days_back
+        self.interval = interval_minutes * 60
+
+    @classmethod
+    def from_config(
+        cls, config: Dict[str, Any], catalog: PaperCatalog, client: ArxivClient
+    ) -> "CatalogSync":
+        """
+        Create a sync from the ``arxiv.catalog`` config section.
+
+        Args:
+            config: catalog configuration dictionary
+            catalog: Catalog to fill
+            client: arXiv API client
+
+        Returns:
+            CatalogSync
+        """
+        sync_config = config.get("sync", {})
+        return cls(
+            catalog,
+            client,
+            overlap_minutes=config.get("overlap_minutes", 60),
+            categories=sync_config.get("categories"),
+            days_back=sync_config.get("days_back", 7),
+            interval_minutes=sync_config.get("interval_minutes", 30),
+        )
+
+    def harvest(self, categories: List[str], date_from: datetime) -> int:
+        """
+        Bring the catalog up to date for the given categories.
+
+        Per category, only papers newer than its high-water mark are fetched
+        (minus a small overlap for papers indexed late), plus older ones if
+        ``date_from`` lies before the harvested range.
+
+        Args:
+            categories: arXiv categories
+            date_from: Oldest submission time that must be covered
+
+        Returns:
+            Number of papers added to the catalog
+        """
+        return sum(added for _, added in self._harvest_chunks(categories, date_from))
+
+    def iter_harvest(self, categories: List[str], date_from: datetime) -> Iterator[PaperMetadata]:
+        """
+        Harvest like ``harvest``, streaming each fetched paper once it is stored.
+
+        A category's mark is only extended once its range has been fully
+        fetched, so closing the stream early never marks a range as covered.
+
+        Args:
+            categories: arXiv categories
+            date_from: Oldest submission time that must be covered
+
+        Yields:
+            Metadata of every paper fetched (new or already in the catalog)
+        """
+        for chunk, _ in self._harvest_chunks(categories, date_from):
+            yield from chunk
+
+    def _harvest_chunks(
+        self, categories: List[str], date_from: datetime
+    ) -> Iterator[Tuple[List[PaperMetadata], int]]:
+        """Fetch and store papers, yielding each stored chunk with its count of new papers."""
+        added = 0
+        for category in categories:
+            fetched = 0
+            mark = self.catalog.get_mark(category)
+            if mark is None:
+                ranges = [(to_utc(date_from), None)]
+            else:
+                ranges = [(mark.until - self.overlap, None)]
+                if to_utc(date_from) < mark.since:
+                    ranges.append((to_utc(date_from), mark.since))
+
+            for start, end in ranges:
+                newest = None
+                seen: Set[str] = set()
+                # A result set cut off at max_results is continued from its oldest paper,
+                # so the mark never claims a range with a gap in it
+                while True:
+                    count = new = 0
+                    oldest = None
+                    chunk: List[PaperMetadata] = []
+                    results = self.client.iter_recent_metadata(
+                        [category], date_from=start, date_to=end
+                    )
+                    for metadata in results:
+                        count += 1
+                        newest = newest or metadata
+                        oldest = to_utc(metadata.published)
+                        if metadata.arxiv_id not in seen:
+                            seen.add(metadata.arxiv_id)
+                            new += 1
+                        chunk.append(metadata)
+                        if len(chunk) >= self.client.page_size:
+                            added += (stored := self.catalog.add_many(chunk))
+                            yield chunk, stored
+                            chunk = []
+                    if chunk:
+                        added += (stored := self.catalog.add_many(chunk))
+                        yield chunk, stored
+                    fetched += count
+
+                    if count < self.client.max_results:
+                        break
+                    if new == 0:
+                        # max_results papers share one timestamp: step past it
+                        logger.warning(f"Skipping papers of {category} submitted at {oldest}")
+                        end = oldest - timedelta(seconds=1)
+                    else:
+                        end = oldest
+
+                self.catalog.update_mark(
+                    category,
+                    start,
+                    newest.published if newest else None,
+                    newest.arxiv_id if newest else None,
+                )
+
+            logger.info(f"Harvested {category}: {fetched} entries fetched")
+
+        logger.info(f"Catalog: {added} new papers ({self.catalog.stats()})")
+
+    def sync_once(self) -> int:
+        """
+        Harvest the configured categories over the last ``days_back`` days.
+
+        Returns:
+            Number of papers added to the catalog
+        """
+        return self.harvest(self.categories, datetime.now() - timedelta(days=self.days_back))
+
+    async def run(self) -> None:
+        """Sync in a worker thread every ``interval_minutes`` until cancelled."""
+        while True:
+            try:
+                await asyncio.to_thread(self.sync_once)
+            except Exception as e:
+                logger.error(f"Background catalog sync failed: {e}")
+            await asyncio.sleep(self.interval)
+
+
+def _from_timestamp(value: float) -> datetime:
+    """Aware UTC datetime from a Unix timestamp."""
+    return datetime.fromtimestamp(value, tz=UTC)
@@ -0,0 +1,529 @@
+"""Rate-limited concurrent file downloads."""
+
+import asyncio
+import fcntl
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Tuple
+
+import fitz  # PyMuPDF
+import httpx
+import requests
+from loguru import logger
+
+# Checks a downloaded file; returns a description of the problem, or None if it is fine
+Validator = Callable[[Path], str | None]
+
+# Files that fail validation are moved here (relative to the download directory)
+QUARANTINE_DIR = "quarantine"
+
+# A PDF header may appear anywhere in the first 1024 bytes
+PDF_MAGIC = b"%PDF-"
+
+# Poll interval while another download of the same file holds its lock
+LOCK_POLL_SECONDS = 0.1
+
+
+def validate_pdf(path: Path) -> str | None:
+    """
+    Check that a file is a PDF that PyMuPDF can open.
+
+    Args:
+        path: File to check
+
+    Returns:
+        Description of the problem, or None if the file is a valid PDF
+    """
+    with open(path, "rb") as f:
+        head = f.read(1024)
+    if PDF_MAGIC not in head:
+        return "missing %PDF header (e.g. an HTML error page)"
+
+    try:
+        with fitz.open(str(path), filetype="pdf") as doc:
+            if doc.page_count == 0:
+                return "PDF has no pages"
+    except Exception as e:
+        return f"PDF cannot be opened: {e}"
+
+    return None
+
+
+def quarantine(path: Path, reason: str) -> Path:
+    """
+    Move a bad file out of the way so it is neither trusted nor re-parsed.
+
+    Args:
+        path: File to move
+        reason: Why the file is bad (logged)
+
+    Returns:
+        New location of the file
+    """
+    target_dir = path.parent / QUARANTINE_DIR
+    target_dir.mkdir(parents=True, exist_ok=True)
+    target = target_dir / f"{path.name}.{int(time.time())}"
+    path.replace(target)
+    logger.warning(f"Quarantined {path.name} ({reason}) -> {target}")
+    return target
+
+
+def _is_cached(dest: Path, validate: Validator | None) -> bool:
+    """Whether ``dest`` exists and passes validation (invalid files are quarantined)."""
+    if not dest.exists():
+        return False
+    if validate is not None:
+        problem = validate(dest)
+        if problem is not None:
+            quarantine(dest, problem)
+            return False
+    return True
+
+
+def _lock_file(dest: Path) -> Path:
+    """Lock file guarding ``dest`` and its partial download."""
+    return dest.with_name(dest.name + ".lock")
+
+
+@contextmanager
+def _dest_lock(dest: Path) -> Iterator[None]:
+    """Hold the exclusive per-destination lock (blocking)."""
+    with open(_lock_file(dest), "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+@asynccontextmanager
+async def _adest_lock(dest: Path) -> AsyncIterator[None]:
+    """Hold the exclusive per-destination lock without blocking the event loop."""
+    with open(_lock_file(dest), "a") as f:
+        while True:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                await asyncio.sleep(LOCK_POLL_SECONDS)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _resume_headers(partial: Path) -> Tuple[int, Dict[str, str]]:
+    """Byte offset and Range header to resume an interrupted download."""
+    offset = partial.stat().st_size if partial.exists() else 0
+    return offset, ({"Range": f"bytes={offset}-"} if offset else {})
+
+
+def _open_partial(partial: Path, offset: int, status_code: int):
+    """Open the partial file for appending (206 Partial Content) or rewriting."""
+    if offset and status_code == 206:
+        logger.info(f"Resuming {partial.name} at byte {offset}")
+        return open(partial, "ab")
+    return open(partial, "wb")
+
+
+def _sync(f) -> None:
+    """Flush a file to disk."""
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def _commit(partial: Path, dest: Path, validate: Validator | None) -> None:
+    """Validate a finished download and atomically move it into place."""
+    if validate is not None:
+        problem = validate(partial)
+        if problem is not None:
+            quarantine(partial, problem)
+            raise ValueError(f"Invalid download for {dest.name}: {problem}")
+    partial.replace(dest)
+
+
+def download_blocking(
+    session: requests.Session,
+    url: str,
+    dest: str | Path,
+    timeout: float = 60.0,
+    validate: Validator | None = None,
+    rate_limiter: "TokenBucket | None" = None,
+) -> Path:
+    """
+    Download a file atomically with resume and validation (blocking).
+
+    A valid existing ``dest`` is reused; an invalid one is quarantined and
+    downloaded again. The body goes to ``<dest>.part`` (resumed with an HTTP
+    Range request if it exists from an interrupted run) and is renamed
+    into place only after it passes ``validate``. Downloads of the same
+    ``dest`` (from any thread or process) are serialized by ``<dest>.lock``.
+
+    Args:
+        session: Pooled requests session
+        url: Source URL
+        dest: Destination path
+        timeout: Request timeout in seconds
+        validate: Optional check applied before committing (e.g. validate_pdf)
+        rate_limiter: Optional token bucket acquired before the request
+
+    Returns:
+        Destination path
+    """
+    dest = Path(dest)
+    if _is_cached(dest, validate):
+        return dest
+    dest.parent.mkdir(parents=True, exist_ok=True)
+
+    with _dest_lock(dest):
+        # Another download of the same file may have finished while we waited
+        if _is_cached(dest, validate):
+            return dest
+        if rate_limiter is not None:
+            rate_limiter.acquire_blocking()
+
+        partial = dest.with_name(dest.name + ".part")
+        offset, headers = _resume_headers(partial)
+
+        with session.get(url, stream=True, timeout=timeout, headers=headers) as response:
+            # 416: the partial file already holds the whole body
+            if not (offset and response.status_code == 416):
+                try:
+                    response.raise_for_status()
+                except requests.HTTPError:
+                    # Nothing to resume from an error response
+                    partial.unlink(missing_ok=True)
+                    raise
+                with _open_partial(partial, offset, response.status_code) as f:
+                    for chunk in response.iter_content(chunk_size=DownloadManager.CHUNK_SIZE):
+                        f.write(chunk)
+                    _sync(f)
+
+        _commit(partial, dest, validate)
+    return dest
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter shared by every user in the process.
+
+    Tokens refill at ``rate`` per second up to ``capacity``. Callers reserve
+    a token and sleep until it is due, so waiting callers are served in
+    order. With ``lock_path`` set, the bucket state lives in that file under
+    an exclusive lock, so separate processes (e.g. web pipeline workers)
+    share one budget.
+    """
+
+    _shared: Dict[Tuple[float, float, str | None], "TokenBucket"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, rate: float, capacity: float = 1.0, lock_path: str | Path | None = None):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate: Tokens per second (<= 0 disables limiting)
+            capacity: Maximum burst size
+            lock_path: State file for sharing the bucket across processes (optional)
+        """
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.lock_path = Path(lock_path) if lock_path else None
+        if self.lock_path is not None:
+            self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = time.time()
+
+    @classmethod
+    def shared(
+        cls, rate: float, capacity: float = 1.0, lock_path: str | Path | None = None
+    ) -> "TokenBucket":
+        """
+        Get the process-wide bucket for these settings, creating it on first use.
+
+        Args:
+            rate: Tokens per second
+            capacity: Maximum burst size
+            lock_path: State file for sharing the bucket across processes (optional)
+
+        Returns:
+            Shared TokenBucket
+        """
+        key = (rate, capacity, str(lock_path) if lock_path else None)
+        with cls._shared_lock:
+            if key not in cls._shared:
+                cls._shared[key] = cls(rate, capacity, lock_path)
+            return cls._shared[key]
+
+    def reserve(self) -> float:
+        """
+        Take a token.
+
+        Returns:
+            Seconds to wait before the token may be used
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            if self.lock_path is None:
+                self._tokens, self._updated, wait = self._take(self._tokens, self._updated)
+                return wait
+
+            with open(self.lock_path, "a+") as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    state = f.read().split()
+                    tokens, updated = (
+                        (float(state[0]), float(state[1]))
+                        if len(state) == 2
+                        else (self.capacity, time.time())
+                    )
+                    tokens, updated, wait = self._take(tokens, updated)
+                    f.seek(0)
+                    f.truncate()
+                    f.write(f"{tokens} {updated}")
+                    f.flush()
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+            return wait
+
+    def _take(self, tokens: float, updated: float) -> Tuple[float, float, float]:
+        """Refill, take one token (possibly going into debt) and compute the wait."""
+        now = time.time()
+        tokens = min(self.capacity, tokens + (now - updated) * self.rate) - 1.0
+        return tokens, now, max(0.0, -tokens / self.rate)
+
+    async def acquire(self) -> None:
+        """Wait for a token without blocking the event loop."""
+        if self.lock_path is not None:
+            # Another process may hold the state file lock
+            wait = await asyncio.to_thread(self.reserve)
+        else:
+            wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def acquire_blocking(self) -> None:
+        """Wait for a token (blocking)."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+class DownloadManager:
+    """
+    Async downloader with a persistent connection pool.
+
+    At most ``max_concurrency`` downloads run at once, and each request
+    first takes a token from a shared TokenBucket so that every pipeline
+    in the process (or, with a lock file, on the machine) stays within
+    the server's courtesy limit.
+    """
+
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        rate_per_second: float = 1 / 3,
+        burst: float = 1.0,
+        lock_path: str | Path | None = None,
+        timeout: float = 60.0,
+    ):
+        """
+        Initialize the download manager.
+
+        Args:
+            max_concurrency: Maximum number of concurrent downloads
+            rate_per_second: Request rate limit (<= 0 disables limiting)
+            burst: Requests allowed back to back before the rate applies
+            lock_path: State file for sharing the rate limit across processes (optional)
+            timeout: Per-request timeout in seconds
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.bucket = TokenBucket.shared(rate_per_second, burst, lock_path)
+
+        # Bound to the event loop they were created on (see _get_client)
+        self._client: httpx.AsyncClient | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        # Metrics
+        self.completed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.resumed = 0
+        self.bytes = 0
+        self.queued = 0
+        self.in_flight = 0
+        self._seconds = 0.0
+        self._first_start: float | None = None
+        self._last_end: float | None = None
+
+        logger.info(
+            f"Initialized DownloadManager (concurrency: {self.max_concurrency}, "
+            f"rate: {rate_per_second}/s, shared: {lock_path is not None})"
+        )
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "DownloadManager":
+        """
+        Create a download manager from the ``download`` config section.
+
+        Args:
+            config: download configuration dictionary
+
+        Returns:
+            DownloadManager
+        """
+        return cls(
+            max_concurrency=config.get("max_concurrency", 4),
+            rate_per_second=config.get("rate_per_second", 1 / 3),
+            burst=config.get("burst", 1),
+            lock_path=config.get("lock_file"),
+            timeout=config.get("timeout", 60),
+        )
+
+    def _get_client(self) -> Tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        """Get the pooled HTTP client and semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._client, self._semaphore
+
+    async def download(
+        self, url: str, dest: str | Path, validate: Validator | None = None
+    ) -> Path:
+        """
+        Download a file atomically with resume and validation.
+
+        A valid existing ``dest`` is reused; an invalid one is quarantined and
+        downloaded again. The body is streamed to ``<dest>.part`` (resumed with
+        an HTTP Range request if it exists from an interrupted run) and renamed
+        into place only after it passes ``validate``. Downloads of the same
+        ``dest`` are serialized by ``<dest>.lock``, and file I/O runs in worker
+        threads.
+
+        Args:
+            url: Source URL
+            dest: Destination path
+            validate: Optional check applied before committing (e.g. validate_pdf)
+
+        Returns:
+            Destination path
+        """
+        dest = Path(dest)
+        if await asyncio.to_thread(_is_cached, dest, validate):
+            self.skipped += 1
+            return dest
+        dest.parent.mkdir(parents=True, exist_ok=True)
+
+        async with _adest_lock(dest):
+            # Another download of the same file may have finished while we waited
+            if await asyncio.to_thread(_is_cached, dest, validate):
+                self.skipped += 1
+                return dest
+
+            client, semaphore = self._get_client()
+            partial = dest.with_name(dest.name + ".part")
+
+            self.queued += 1
+            waiting = True
+            try:
+                async with semaphore:
+                    await self.bucket.acquire()
+                    waiting = False
+                    self.queued -= 1
+                    self.in_flight += 1
+                    started = time.monotonic()
+                    if self._first_start is None:
+                        self._first_start = started
+
+                    try:
+                        offset, headers = _resume_headers(partial)
+                        async with client.stream("GET", url, headers=headers) as response:
+                            # 416: the partial file already holds the whole body
+                            if not (offset and response.status_code == 416):
+                                response.raise_for_status()
+                                if offset and response.status_code == 206:
+                                    self.resumed += 1
+                                f = await asyncio.to_thread(
+                                    _open_partial, partial, offset, response.status_code
+                                )
+                                try:
+                                    async for chunk in response.aiter_bytes(self.CHUNK_SIZE):
+                                        await asyncio.to_thread(f.write, chunk)
+                                        self.bytes += len(chunk)
+                                    await asyncio.to_thread(_sync, f)
+                                finally:
+                                    f.close()
+
+                        await asyncio.to_thread(_commit, partial, dest, validate)
+                        self.completed += 1
+                    except BaseException as e:
+                        self.failed += 1
+                        if isinstance(e, httpx.HTTPStatusError):
+                            # Nothing to resume from an error response
+                            partial.unlink(missing_ok=True)
+                        raise
+                    finally:
+                        self.in_flight -= 1
+                        self._last_end = time.monotonic()
+                        self._seconds += self._last_end - started
+            finally:
+                # Cancelled while waiting for a slot or a token
+                if waiting:
+                    self.queued -= 1
+
+        return dest
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get download metrics.
+
+        Returns:
+            Dictionary with counts (completed, failed, skipped, resumed), bytes,
+            current queue depth and in-flight
+            downloads, throughput over the active period and mean download time
+        """
+        active = 0.0
+        if self._first_start is not None and self._last_end is not None:
+            active = self._last_end - self._first_start
+        finished = self.completed + self.failed
+        return {
+            "completed": self.completed,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "resumed": self.resumed,
+            "bytes": self.bytes,
+            "queued": self.queued,
+            "in_flight": self.in_flight,
+            "throughput_bytes_per_s": self.bytes / active if active > 0 else 0.0,
+            "mean_seconds": self._seconds / finished if finished else 0.0,
+        }
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            if self._loop is asyncio.get_running_loop():
+                await self._client.aclose()
+            self._client = None
+            self._semaphore = None
+            self._loop = None
@@ -8,17 +8,21 @@ import fitz  # PyMuPDF
 from loguru import logger
 from PIL import Image
 
+from paper_review.utils.blob_store import BlobStore
+
 
 class ImageExtractor:
     """Extract images from PDF files."""
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], blob_store: BlobStore | None = None):
         """
         Initialize ImageExtractor.
 
         Args:
             config: Configuration dictionary for image extraction settings
+            blob_store: Store images content-addressed instead of in the output directory
         """
+        self.blob_store = blob_store
         self.max_images = config.get("max_images_per_paper", 3)
         self.image_format = config.get("image_format", "png")
         self.image_quality = config.get("image_quality", 85)
@@ -45,72 +49,17 @@ class ImageExtractor:
         output_path.mkdir(parents=True, exist_ok=True)
 
         try:
-            doc = fitz.open(str(pdf_path))
-            image_paths = []
-            image_count = 0
-
-            for page_num in range(len(doc)):
-                if image_count >= self.max_images:
-                    break
-
-                page = doc[page_num]
-                image_list = page.get_images()
+            with fitz.open(str(pdf_path)) as doc:
+                image_paths: List[str] = []
 
-                for img_index, img_info in enumerate(image_list):
-                    if image_count >= self.max_images:
+                for page_num in range(len(doc)):
+                    if len(image_paths) >= self.max_images:
                         break
-
-                    try:
-                        xref = img_info[0]
-                        base_image = doc.extract_image(xref)
-
-                        if base_image:
-                            image_bytes = base_image["image"]
-
-                            # Load image with PIL to check dimensions
-                            img = Image.open(io.BytesIO(image_bytes))
-
-                            # Filter by size
-                            if img.width >= self.min_width and img.height >= self.min_height:
-                                # Save image
-                                filename = f"{paper_id}_img_{image_count + 1}.{self.image_format}"
-                                filepath = output_path / filename
-
-                                # Convert and save
-                                if img.mode in ("RGBA", "LA", "P"):
-                                    # Convert to RGB for formats that don't support transparency
-                                    if self.image_format.lower() in ["jpg", "jpeg"]:
-                                        background = Image.new("RGB", img.size, (255, 255, 255))
-                                        if img.mode == "P":
-                                            img = img.convert("RGBA")
-                                        background.paste(
-                                            img,
-                                            mask=img.split()[-1] if img.mode == "RGBA" else None,
-                                        )
-                                        img = background
-
-                                img.save(
-                                    filepath,
-                                    format=self.image_format.upper(),
-                                    quality=self.image_quality
-                                    if self.image_format.lower() in ["jpg", "jpeg"]
-                                    else None,
-                                )
-
-                                image_paths.append(str(filepath))
-                                image_count += 1
-
-                                logger.info(
-                                    f"Extracted image {image_count}: {filename} ({img.width}x{img.height})"
-                                )
-
-                    except Exception as e:
-                        logger.warning(
-                            f"Error extracting image {img_index} from page {page_num}: {e}"
+                    image_paths.extend(
+                        self.extract_page_images(
+                            doc, page_num, output_path, paper_id, start_index=len(image_paths)
                         )
-                        continue
-
-            doc.close()
+                    )
 
             logger.info(f"Successfully extracted {len(image_paths)} images")
 
@@ -120,6 +69,95 @@ class ImageExtractor:
             logger.error(f"Error extracting images from PDF: {e}")
             return []
 
+    def extract_page_images(
+        self,
+        doc: fitz.Document,
+        page_num: int,
+        output_dir: str | Path,
+        paper_id: str,
+        start_index: int = 0,
+    ) -> List[str]:
+        """
+        Extract images from one page of an already opened PDF.
+
+        Args:
+            doc: Open PyMuPDF document
+            page_num: Page index
+            output_dir: Directory to save extracted images (must exist)
+            paper_id: Unique identifier for the paper (used in filenames)
+            start_index: Number of images already extracted from this paper
+
+        Returns:
+            List of paths to extracted image files (at most max_images - start_index)
+        """
+        output_path = Path(output_dir)
+        image_paths: List[str] = []
+        image_count = start_index
+
+        for img_index, img_info in enumerate(doc[page_num].get_images()):
+            if image_count >= self.max_images:
+                break
+
+            try:
+                xref = img_info[0]
+                base_image = doc.extract_image(xref)
+
+                if base_image:
+                    image_bytes = base_image["image"]
+
+                    # Load image with PIL to check dimensions
+                    img = Image.open(io.BytesIO(image_bytes))
+
+                    # Filter by size
+                    if img.width >= self.min_width and img.height >= self.min_height:
+                        filename = f"{paper_id}_img_{image_count + 1}.{self.image_format}"
+
+                        # Convert and save
+                        if img.mode in ("RGBA", "LA", "P"):
+                            # Convert to RGB for formats that don't support transparency
+                            if self.image_format.lower() in ["jpg", "jpeg"]:
+                                background = Image.new("RGB", img.size, (255, 255, 255))
+                                if img.mode == "P":
+                                    img = img.convert("RGBA")
+                                background.paste(
+                                    img,
+                                    mask=img.split()[-1] if img.mode == "RGBA" else None,
+                                )
+                                img = background
+
+                        # Save image (identical figures share one blob in the blob store)
+                        buffer = io.BytesIO()
+                        img.save(
+                            buffer,
+                            format=self.image_format.upper(),
+                            quality=self.image_quality
+                            if self.image_format.lower() in ["jpg", "jpeg"]
+                            else None,
+                        )
+                        if self.blob_store is not None:
+                            filepath = self.blob_store.put_bytes(
+                                buffer.getvalue(),
+                                paper_id,
+                                f"image_{image_count + 1}",
+                                f".{self.image_format}",
+                            )
+                        else:
+                            filepath = output_path / filename
+                            filepath.write_bytes(buffer.getvalue())
+
+                        image_paths.append(str(filepath))
+                        image_count += 1
+
+                        logger.info(
+                            f"Extracted image {image_count}: {filename} ({img.width}x{img.height})"
+                        )
+
+            except Exception as e:
+                logger.warning(f"Error extracting image {img_index} from page {page_num}: {e}")
+                continue
+
+        return image_paths
+
     def get_image_info(self, image_path: str | Path) -> Dict[str, Any]:
         """
         Get information about an image file.
@@ -0,0 +1,317 @@
+"""Single-pass PDF ingestion, in-process or in a worker process pool."""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from multiprocessing.connection import Connection
+from multiprocessing.context import BaseContext
+from pathlib import Path
+from typing import Any, Dict, List, Set
+
+import fitz  # PyMuPDF
+from loguru import logger
+
+from paper_review.models import PDFIngestResult
+from paper_review.utils.blob_store import BlobStore
+from paper_review.utils.image import ImageExtractor
+from paper_review.utils.pdf import PDFProcessor
+
+
+class PDFIngestor:
+    """
+    Extract text, page count, metadata and figures from a PDF in one pass.
+
+    The document is opened once and each page is visited once, instead of
+    the separate parses done by ``PDFProcessor`` and ``ImageExtractor``.
+    """
+
+    def __init__(self, config: Dict[str, Any] | None = None, blob_store: BlobStore | None = None):
+        """
+        Initialize PDFIngestor.
+
+        Args:
+            config: Configuration dictionary for PDF settings
+            blob_store: Store figures content-addressed instead of in ``images_dir``
+        """
+        self.config = config or {}
+        self.image_extractor = ImageExtractor(self.config, blob_store)
+        logger.info("Initialized PDFIngestor")
+
+    def ingest(
+        self,
+        pdf_path: str | Path,
+        images_dir: str | Path | None = None,
+        paper_id: str | None = None,
+    ) -> PDFIngestResult:
+        """
+        Parse a PDF once.
+
+        Args:
+            pdf_path: Path to PDF file
+            images_dir: Directory to save figures (no figures are extracted if None)
+            paper_id: Unique identifier for the paper (used in image filenames)
+
+        Returns:
+            PDFIngestResult with content and per-step timings; on failure,
+            whatever was extracted so far plus the error message
+        """
+        pdf_path = Path(pdf_path)
+        paper_id = paper_id or pdf_path.stem
+        if images_dir is not None:
+            Path(images_dir).mkdir(parents=True, exist_ok=True)
+
+        result = PDFIngestResult(pdf_path=str(pdf_path))
+        text_parts: List[str] = []
+        text_seconds = image_seconds = 0.0
+        max_images = self.image_extractor.max_images if images_dir is not None else 0
+        started = time.perf_counter()
+
+        try:
+            with fitz.open(str(pdf_path)) as doc:
+                result.timings["open"] = time.perf_counter() - started
+                result.page_count = len(doc)
+                result.metadata = PDFProcessor.document_metadata(doc)
+
+                for page_num in range(len(doc)):
+                    t0 = time.perf_counter()
+                    text_parts.append(doc[page_num].get_text())
+                    t1 = time.perf_counter()
+                    text_seconds += t1 - t0
+
+                    if len(result.image_paths) < max_images:
+                        result.image_paths.extend(
+                            self.image_extractor.extract_page_images(
+                                doc,
+                                page_num,
+                                images_dir,
+                                paper_id,
+                                start_index=len(result.image_paths),
+                            )
+                        )
+                        image_seconds += time.perf_counter() - t1
+
+        except Exception as e:
+            logger.error(f"Error ingesting PDF {pdf_path}: {e}")
+            result.error = str(e)
+
+        offset = 0
+        for part in text_parts:
+            result.page_offsets.append(offset)
+            offset += len(part) + 1  # Joined with "\n"
+        result.text = "\n".join(text_parts)
+        result.timings.update(
+            text=text_seconds, images=image_seconds, total=time.perf_counter() - started
+        )
+
+        logger.info(
+            f"Ingested {pdf_path.name}: {result.page_count} pages, {len(result.text)} chars, "
+            f"{len(result.image_paths)} images in {result.timings['total']:.2f}s"
+        )
+        return result
+
+
+# Per-process ingestor reused across tasks in a pool worker
+_worker_ingestor: PDFIngestor | None = None
+
+
+def _ingest_in_worker(
+    config: Dict[str, Any],
+    blob_store_config: Dict[str, Any],
+    pdf_path: str,
+    images_dir: str | None,
+    text_dir: str,
+    paper_id: str,
+) -> Dict[str, Any]:
+    """
+    Ingest a PDF inside a pool worker.
+
+    The text is written to ``text_dir`` so only paths, offsets and timings
+    cross the process boundary (as a plain dict).
+
+    Returns:
+        Serialized PDFIngestResult with ``text_path`` set and ``text`` empty
+    """
+    global _worker_ingestor
+    if _worker_ingestor is None:
+        _worker_ingestor = PDFIngestor(config, BlobStore.from_config(blob_store_config))
+
+    result = _worker_ingestor.ingest(pdf_path, images_dir, paper_id)
+
+    text_path = Path(text_dir) / f"{paper_id}.txt"
+    text_path.parent.mkdir(parents=True, exist_ok=True)
+    text_path.write_text(result.text, encoding="utf-8")
+    result.text_path = str(text_path)
+    result.text = ""
+
+    return result.model_dump()
+
+
+def _worker_main(
+    conn: Connection, config: Dict[str, Any], blob_store_config: Dict[str, Any], text_dir: str
+) -> None:
+    """Serve ingest tasks sent over ``conn`` until it is closed."""
+    while True:
+        try:
+            pdf_path, images_dir, paper_id = conn.recv()
+        except EOFError:
+            return
+
+        try:
+            data = _ingest_in_worker(
+                config, blob_store_config, pdf_path, images_dir, text_dir, paper_id
+            )
+        except Exception as e:
+            data = PDFIngestResult(pdf_path=pdf_path, error=str(e)).model_dump()
+        conn.send(data)
+
+
+class _Worker:
+    """A pool worker process and its end of the task pipe."""
+
+    def __init__(self, context: BaseContext, args: tuple):
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child, *args), daemon=True)
+        self.process.start()
+        child.close()
+
+    async def call(self, task: tuple) -> Dict[str, Any]:
+        """Send one task and wait for its result without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        readable = loop.create_future()
+
+        def on_readable() -> None:
+            if not readable.done():
+                readable.set_result(None)
+
+        self.conn.send(task)
+        loop.add_reader(self.conn.fileno(), on_readable)
+        try:
+            await readable
+        finally:
+            loop.remove_reader(self.conn.fileno())
+        # Raises EOFError if the process died instead of answering
+        return self.conn.recv()
+
+    def stop(self) -> None:
+        """Kill the process (a busy worker cannot be interrupted otherwise)."""
+        self.conn.close()
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(1)
+
+
+class PDFIngestPool:
+    """
+    Run PDFIngestor in worker processes so PyMuPDF work uses every core.
+
+    Each worker handles one task at a time over its own pipe. A task that
+    exceeds its timeout or crashes its worker (e.g. on a malformed PDF) fails
+    alone: only that worker is killed, and a fresh one replaces it on demand.
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any] | None = None,
+        processes: int | None = None,
+        timeout: float | None = 120.0,
+        text_dir: str | Path = "data/text",
+        blob_store_config: Dict[str, Any] | None = None,
+    ):
+        """
+        Initialize the pool (workers start on first use).
+
+        Args:
+            config: Configuration dictionary for PDF settings
+            processes: Number of worker processes (default: CPU count)
+            timeout: Seconds allowed per PDF (None = no limit)
+            text_dir: Directory for extracted text files
+            blob_store_config: ``blob_store`` config section; when enabled, workers
+                store figures in the shared BlobStore
+        """
+        self.config = config or {}
+        self.blob_store_config = blob_store_config or {}
+        self.processes = processes or os.cpu_count() or 1
+        self.timeout = timeout
+        self.text_dir = Path(text_dir)
+
+        # spawn: never fork a process with running threads and event loops
+        self._context = multiprocessing.get_context("spawn")
+        self._workers: Set[_Worker] = set()
+        self._idle: List[_Worker] = []
+        self._slots: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _spawn(self) -> _Worker:
+        """Start a worker process."""
+        worker = _Worker(
+            self._context, (self.config, self.blob_store_config, str(self.text_dir))
+        )
+        self._workers.add(worker)
+        return worker
+
+    def _discard(self, worker: _Worker) -> None:
+        """Kill a worker and forget it."""
+        self._workers.discard(worker)
+        worker.stop()
+
+    def start(self) -> None:
+        """Start the worker processes (no-op if already running)."""
+        if not self._workers:
+            self._idle = [self._spawn() for _ in range(self.processes)]
+            logger.info(f"Started PDF ingest pool ({self.processes} worker process(es))")
+
+    def shutdown(self) -> None:
+        """Stop all worker processes."""
+        if self._workers:
+            for worker in list(self._workers):
+                self._discard(worker)
+            self._idle = []
+            logger.info("Stopped PDF ingest pool")
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Slot semaphore bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._loop is not loop:
+            self._slots = asyncio.Semaphore(self.processes)
+            self._loop = loop
+        return self._slots
+
+    async def ingest(
+        self, pdf_path: str | Path, images_dir: str | Path | None, paper_id: str
+    ) -> PDFIngestResult:
+        """
+        Ingest a PDF in a worker process.
+
+        Args:
+            pdf_path: Path to PDF file
+            images_dir: Directory to save figures (no figures are extracted if None)
+            paper_id: Unique identifier for the paper (used in file names)
+
+        Returns:
+            PDFIngestResult with ``text_path`` instead of inline text; ``error``
+            is set if the task failed, timed out or crashed its worker
+        """
+        task = (str(pdf_path), str(images_dir) if images_dir is not None else None, paper_id)
+
+        async with self._semaphore():
+            self.start()
+            worker = self._idle.pop() if self._idle else self._spawn()
+            try:
+                data = await asyncio.wait_for(worker.call(task), self.timeout)
+            except TimeoutError:
+                logger.error(f"PDF ingestion of {paper_id} timed out after {self.timeout}s")
+                self._discard(worker)
+                return PDFIngestResult(pdf_path=str(pdf_path), error="Ingestion timed out")
+            except (EOFError, OSError):
+                logger.error(f"PDF ingestion of {paper_id} crashed its worker process")
+                self._discard(worker)
+                return PDFIngestResult(pdf_path=str(pdf_path), error="Worker process crashed")
+            except BaseException:
+                # Cancelled mid-task: the worker's reply would be read by the next task
+                self._discard(worker)
+                raise
+
+            if worker in self._workers:  # Not stopped by shutdown() meanwhile
+                self._idle.append(worker)
+            return PDFIngestResult.model_validate(data)
@@ -0,0 +1,191 @@
+"""arXiv daily listings (per-category Atom feeds of each announcement)."""
+
+import re
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import IO, Any, Dict, Iterable, Iterator, List, Tuple
+
+import requests
+from loguru import logger
+
+from paper_review.models import PaperMetadata
+
+DEFAULT_URL_TEMPLATE = "https://rss.arxiv.org/atom/{category}"
+
+ATOM = "{http://www.w3.org/2005/Atom}"
+ARXIV = "{http://arxiv.org/schemas/atom}"
+DC = "{http://purl.org/dc/elements/1.1/}"
+
+# "arXiv:2511.14899v1 Announce Type: new \nAbstract: ..."
+_SUMMARY_PREFIX = re.compile(r"^arXiv:\S+\s+Announce Type:\s*\S+\s*Abstract:\s*", re.DOTALL)
+_AUTHOR_SEPARATOR = re.compile(r",\s*|\s+and\s+")
+
+
+def parse_listing(
+    source: IO[bytes], announce_types: Iterable[str] | None = None
+) -> Iterator[PaperMetadata]:
+    """
+    Stream papers from an arXiv listing feed.
+
+    The document is parsed incrementally and each entry is dropped once
+    converted, so memory does not grow with the listing size.
+
+    Args:
+        source: Binary file-like object with the Atom document
+        announce_types: Entry types to keep (e.g. "new", "cross"; None = all)
+
+    Yields:
+        Metadata of the announced papers (``published`` is the announcement time)
+    """
+    wanted = set(announce_types) if announce_types is not None else None
+    root = None
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if root is None:
+            root = elem
+            continue
+        if event != "end" or elem.tag != f"{ATOM}entry":
+            continue
+
+        announce_type = elem.findtext(f"{ARXIV}announce_type", "new").strip()
+        if wanted is None or announce_type in wanted:
+            metadata = _to_metadata(elem)
+            if metadata is not None:
+                yield metadata
+        # Finished entries are children of the feed element
+        root.clear()
+
+
+def _to_metadata(entry: ET.Element) -> PaperMetadata | None:
+    """Convert a listing entry to PaperMetadata (None if it has no arXiv ID)."""
+    entry_id = entry.findtext(f"{ATOM}id", "").strip()
+    arxiv_id = entry_id.rsplit(":", 1)[-1] if entry_id.startswith("oai:") else ""
+    if not arxiv_id:
+        return None
+
+    categories = [c.get("term") for c in entry.iter(f"{ATOM}category") if c.get("term")]
+    creators = entry.findtext(f"{DC}creator")
+    if creators is not None:
+        authors = [a.strip() for a in _AUTHOR_SEPARATOR.split(creators) if a.strip()]
+    else:
+        authors = [name.text.strip() for name in entry.iter(f"{ATOM}name") if name.text]
+
+    published = datetime.fromisoformat(entry.findtext(f"{ATOM}published", "").strip())
+    updated = entry.findtext(f"{ATOM}updated")
+    summary = _SUMMARY_PREFIX.sub("", entry.findtext(f"{ATOM}summary", "").strip())
+
+    return PaperMetadata(
+        title=" ".join(entry.findtext(f"{ATOM}title", "").split()),
+        authors=authors,
+        summary=" ".join(summary.split()),
+        published=published,
+        updated=datetime.fromisoformat(updated.strip()) if updated else None,
+        arxiv_id=arxiv_id,
+        pdf_url=f"https://arxiv.org/pdf/{arxiv_id}",
+        # Listings put the primary category first
+        primary_category=categories[0] if categories else "",
+        categories=categories,
+        doi=entry.findtext(f"{ARXIV}DOI"),
+        journal_ref=entry.findtext(f"{ARXIV}journal_reference"),
+        source="arxiv",
+        tags=categories,
+    )
+
+
+class DailyListing:
+    """Fetch the latest daily announcement of arXiv categories from their listing feeds."""
+
+    def __init__(
+        self,
+        session: requests.Session,
+        url_template: str = DEFAULT_URL_TEMPLATE,
+        announce_types: List[str] | None = None,
+        timeout: float = 30,
+        max_workers: int = 8,
+    ):
+        """
+        Initialize the listing fetcher.
+
+        Args:
+            session: Pooled HTTP session (e.g. ArxivClient.session)
+            url_template: Feed URL with a ``{category}`` placeholder
+            announce_types: Entry types to keep (default: new submissions and cross-lists)
+            timeout: Request timeout in seconds
+            max_workers: Feeds fetched concurrently
+        """
+        self.session = session
+        self.url_template = url_template
+        self.announce_types = announce_types or ["new", "cross"]
+        self.timeout = timeout
+        self.max_workers = max_workers
+
+    @classmethod
+    def from_config(
+        cls, config: Dict[str, Any], session: requests.Session
+    ) -> "DailyListing | None":
+        """
+        Create a listing fetcher from the ``arxiv.listing`` config section.
+
+        Args:
+            config: listing configuration dictionary
+            session: Pooled HTTP session
+
+        Returns:
+            DailyListing, or None if disabled
+        """
+        if not config.get("enabled", False):
+            return None
+
+        return cls(
+            session,
+            url_template=config.get("url_template", DEFAULT_URL_TEMPLATE),
+            announce_types=config.get("announce_types"),
+            timeout=config.get("timeout", 30),
+            max_workers=config.get("max_workers", 8),
+        )
+
+    def fetch(self, category: str) -> List[PaperMetadata]:
+        """
+        Fetch and parse the listing of one category.
+
+        Args:
+            category: arXiv category (e.g. "cs.LG")
+
+        Returns:
+            Papers of the latest announcement
+        """
+        url = self.url_template.format(category=category)
+        with self.session.get(url, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            # Parse while the body streams in (transparently decompressed)
+            response.raw.decode_content = True
+            return list(parse_listing(response.raw, self.announce_types))
+
+    def fetch_many(
+        self, categories: List[str]
+    ) -> Iterator[Tuple[str, List[PaperMetadata] | None]]:
+        """
+        Fetch several listings concurrently.
+
+        Args:
+            categories: arXiv categories
+
+        Yields:
+            (category, papers) as each listing completes; papers is None if the fetch failed
+        """
+        if not categories:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(categories))) as pool:
+            futures = {pool.submit(self.fetch, category): category for category in categories}
+            for future in as_completed(futures):
+                category = futures[future]
+                try:
+                    papers = future.result()
+                except Exception as e:
+                    logger.warning(f"Error fetching arXiv listing for {category}: {e}")
+                    yield category, None
+                    continue
+
+                logger.info(f"arXiv listing for {category}: {len(papers)} papers")
+                yield category, papers
@@ -1,28 +1,90 @@
 """LLM client utilities for Ollama."""
 
-from typing import Any, Dict
+import asyncio
+from typing import Any, Dict, Iterable, List, Tuple
 
+import httpx
 import requests
 from loguru import logger
 
+from paper_review.utils.cache import LLMCache
+
 
 class OllamaClient:
     """Client for interacting with Ollama API."""
 
-    def __init__(self, base_url: str = "http://localhost:11434", model: str = "qwen3:8b"):
+    # Texts per embeddings request
+    EMBED_BATCH_SIZE = 64
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:11434",
+        model: str = "qwen3:8b",
+        cache: LLMCache | None = None,
+    ):
         """
         Initialize Ollama client.
 
         Args:
             base_url: Ollama API base URL
             model: Model name to use
+            cache: Optional persistent response cache
         """
         self.base_url = base_url
         self.model = model
         self.timeout = 120.0
+        self.cache = cache
+
+        # Reuse connections across calls (HTTP keep-alive)
+        self.session = requests.Session()
 
         logger.info(f"Initialized OllamaClient (model: {model}, url: {base_url})")
 
+    def _prepare(
+        self,
+        prompt: str,
+        system_prompt: str | None,
+        temperature: float,
+        max_tokens: int,
+        format_json: bool,
+        num_ctx: int | None = None,
+    ) -> Tuple[Dict[str, Any], str | None]:
+        """
+        Build the request payload and cache key for a generation.
+
+        Returns:
+            Tuple of (payload, cache key or None if caching is disabled)
+        """
+        full_prompt = prompt
+        if system_prompt:
+            full_prompt = f"{system_prompt}\n\n{prompt}"
+
+        options: Dict[str, Any] = {"temperature": temperature, "num_predict": max_tokens}
+        if num_ctx:
+            options["num_ctx"] = num_ctx
+        output_format = "json" if format_json else None
+
+        payload: Dict[str, Any] = {
+            "model": self.model,
+            "prompt": full_prompt,
+            "stream": False,
+            "options": options,
+        }
+
+        if output_format:
+            payload["format"] = output_format
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = LLMCache.make_key(self.model, prompt, system_prompt, options, output_format)
+
+        return payload, cache_key
+
+    def _remember(self, cache_key: str | None, text: str) -> None:
+        """Store a successful response in the cache."""
+        if cache_key is not None and text:
+            self.cache.put(cache_key, self.model, text)
+
     def generate(
         self,
         prompt: str,
@@ -30,6 +92,7 @@ class OllamaClient:
         temperature: float = 0.7,
         max_tokens: int = 2000,
         format_json: bool = False,
+        num_ctx: int | None = None,
     ) -> str:
         """
         Generate text using Ollama.
@@ -40,32 +103,31 @@ class OllamaClient:
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
             format_json: Whether to enforce JSON output format
+            num_ctx: Context window size override (optional)
 
         Returns:
             Generated text
         """
-        full_prompt = prompt
-        if system_prompt:
-            full_prompt = f"{system_prompt}\n\n{prompt}"
+        payload, cache_key = self._prepare(
+            prompt, system_prompt, temperature, max_tokens, format_json, num_ctx
+        )
 
-        payload: Dict[str, Any] = {
-            "model": self.model,
-            "prompt": full_prompt,
-            "stream": False,
-            "options": {"temperature": temperature, "num_predict": max_tokens},
-        }
-
-        if format_json:
-            payload["format"] = "json"
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/generate", json=payload, timeout=self.timeout
             )
             response.raise_for_status()
             result = response.json()
+            text = result.get("response", "")
+
+            self._remember(cache_key, text)
 
-            return result.get("response", "")
+            return text
 
         except requests.exceptions.Timeout:
             logger.error(f"Ollama request timed out after {self.timeout}s")
@@ -76,3 +138,196 @@ class OllamaClient:
         except Exception as e:
             logger.error(f"Unexpected error calling Ollama: {e}")
             raise
+
+    def embed(self, texts: List[str], model: str | None = None) -> List[List[float]]:
+        """
+        Embed texts using Ollama's embeddings endpoint.
+
+        Args:
+            texts: Texts to embed
+            model: Embedding model (defaults to the client's model)
+
+        Returns:
+            One embedding vector per text
+        """
+        embeddings: List[List[float]] = []
+        for start in range(0, len(texts), self.EMBED_BATCH_SIZE):
+            chunk = texts[start : start + self.EMBED_BATCH_SIZE]
+            try:
+                response = self.session.post(
+                    f"{self.base_url}/api/embed",
+                    json={"model": model or self.model, "input": chunk},
+                    timeout=self.timeout,
+                )
+                response.raise_for_status()
+                embeddings.extend(response.json().get("embeddings", []))
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Ollama embedding request failed: {e}")
+                raise
+
+        return embeddings
+
+
+class AsyncOllamaClient(OllamaClient):
+    """
+    Ollama client with an async API on a persistent connection pool.
+
+    At most ``max_concurrency`` requests are in flight at once; set it to the
+    server's ``OLLAMA_NUM_PARALLEL`` so throughput scales with its parallel
+    slots. The synchronous ``generate`` remains available.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:11434",
+        model: str = "qwen3:8b",
+        cache: LLMCache | None = None,
+        max_concurrency: int = 4,
+    ):
+        """
+        Initialize async Ollama client.
+
+        Args:
+            base_url: Ollama API base URL
+            model: Model name to use
+            cache: Optional persistent response cache
+            max_concurrency: Maximum number of in-flight requests
+        """
+        super().__init__(base_url=base_url, model=model, cache=cache)
+        self.max_concurrency = max(1, max_concurrency)
+
+        # Bound to the event loop they were created on (see _get_client)
+        self._client: httpx.AsyncClient | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_client(self) -> Tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        """Get the pooled HTTP client and semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency,
+                ),
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._client, self._semaphore
+
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        format_json: bool = False,
+        num_ctx: int | None = None,
+    ) -> str:
+        """
+        Generate text using Ollama without blocking the event loop.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System prompt (optional)
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+            format_json: Whether to enforce JSON output format
+            num_ctx: Context window size override (optional)
+
+        Returns:
+            Generated text
+        """
+        payload, cache_key = self._prepare(
+            prompt, system_prompt, temperature, max_tokens, format_json, num_ctx
+        )
+
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        client, semaphore = self._get_client()
+
+        try:
+            async with semaphore:
+                response = await client.post("/api/generate", json=payload)
+            response.raise_for_status()
+            result = response.json()
+            text = result.get("response", "")
+
+            self._remember(cache_key, text)
+
+            return text
+
+        except httpx.TimeoutException:
+            logger.error(f"Ollama request timed out after {self.timeout}s")
+            raise
+        except httpx.HTTPError as e:
+            logger.error(f"Ollama request failed: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error calling Ollama: {e}")
+            raise
+
+    async def aembed(self, texts: List[str], model: str | None = None) -> List[List[float]]:
+        """
+        Embed texts without blocking the event loop.
+
+        Texts are sent in chunks; chunks run concurrently within ``max_concurrency``.
+
+        Args:
+            texts: Texts to embed
+            model: Embedding model (defaults to the client's model)
+
+        Returns:
+            One embedding vector per text
+        """
+        client, semaphore = self._get_client()
+
+        async def embed_chunk(chunk: List[str]) -> List[List[float]]:
+            try:
+                async with semaphore:
+                    response = await client.post(
+                        "/api/embed", json={"model": model or self.model, "input": chunk}
+                    )
+                response.raise_for_status()
+                return response.json().get("embeddings", [])
+            except httpx.HTTPError as e:
+                logger.error(f"Ollama embedding request failed: {e}")
+                raise
+
+        chunks = await asyncio.gather(
+            *(
+                embed_chunk(texts[start : start + self.EMBED_BATCH_SIZE])
+                for start in range(0, len(texts), self.EMBED_BATCH_SIZE)
+            )
+        )
+        return [vector for chunk in chunks for vector in chunk]
+
+    async def agenerate_many(
+        self, calls: Iterable[Dict[str, Any]]
+    ) -> List[str | BaseException]:
+        """
+        Submit a batch of generations, bounded by ``max_concurrency``.
+
+        Args:
+            calls: Keyword arguments for ``agenerate``, one dict per request
+
+        Returns:
+            Results in request order; a failed request yields its exception
+        """
+        return await asyncio.gather(
+            *(self.agenerate(**kwargs) for kwargs in calls), return_exceptions=True
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            if self._loop is asyncio.get_running_loop():
+                await self._client.aclose()
+            self._client = None
+            self._semaphore = None
+            self._loop = None
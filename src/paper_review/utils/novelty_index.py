@@ -0,0 +1,360 @@
+"""Persistent nearest-neighbour index of previously seen paper embeddings."""
+
+import fcntl
+import json
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+from paper_review.utils.vectors import normalize, spherical_kmeans
+
+
+class NoveltyIndex:
+    """
+    Append-only, memory-mapped embedding store with nearest-neighbour search.
+
+    Layout of the index directory:
+
+    - ``vectors.f32``: row-major float32 matrix of L2-normalized embeddings
+    - ``ids.txt``: one paper id per row
+    - ``meta.json``: embedding dimension
+    - ``centroids.npy`` / ``lists.i32``: IVF coarse quantizer and per-row list
+      labels, created once the index reaches ``ivf_min_rows`` rows
+
+    The matrix is never loaded whole: exact search streams it in blocks of
+    ``block_rows`` rows, and IVF search only reads the ``nprobe`` closest
+    lists. Appends are serialized across processes with a file lock.
+    """
+
+    VECTORS_FILE = "vectors.f32"
+    IDS_FILE = "ids.txt"
+    META_FILE = "meta.json"
+    CENTROIDS_FILE = "centroids.npy"
+    LISTS_FILE = "lists.i32"
+    LOCK_FILE = ".lock"
+
+    def __init__(
+        self,
+        directory: str | Path = "data/novelty_index",
+        block_rows: int = 8192,
+        ivf_min_rows: int = 50000,
+        num_lists: int = 256,
+        nprobe: int = 8,
+    ):
+        """
+        Open (and create if needed) the index.
+
+        Args:
+            directory: Index directory
+            block_rows: Rows per block for exact search
+            ivf_min_rows: Row count at which the IVF quantizer is trained
+            num_lists: Number of IVF lists
+            nprobe: IVF lists searched per query
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.block_rows = block_rows
+        self.ivf_min_rows = ivf_min_rows
+        self.num_lists = num_lists
+        self.nprobe = nprobe
+
+        self._lock = threading.Lock()
+        self.dim: int | None = None
+        self._ids: List[str] = []
+        self._known: set[str] = set()
+        self._ids_offset = 0
+        self._centroids: np.ndarray | None = None
+        # IVF rows grouped by list (row count, row order, list bounds); see _ivf_lists
+        self._ivf_lists: Tuple[int, np.ndarray, np.ndarray] | None = None
+
+        # Read-only refresh: another process may be between writing its vectors and its ids
+        self._refresh()
+
+        logger.info(f"Opened NoveltyIndex at {self.directory} ({len(self)} papers)")
+
+    def __len__(self) -> int:
+        """Number of indexed papers."""
+        return len(self._ids)
+
+    def __contains__(self, paper_id: str) -> bool:
+        """Whether a paper (any version) is already indexed."""
+        return base_id(paper_id) in self._known
+
+    def add(self, paper_ids: Sequence[str], vectors: np.ndarray) -> int:
+        """
+        Append embeddings of papers not yet in the index.
+
+        Args:
+            paper_ids: Paper ids (arXiv ids; versions are ignored for deduplication)
+            vectors: (n, d) array of embeddings
+
+        Returns:
+            Number of papers added
+        """
+        vectors = normalize(vectors)
+
+        with self._lock, self._file_lock():
+            self._refresh(truncate=True)
+
+            if self.dim is None:
+                self.dim = int(vectors.shape[1])
+                (self.directory / self.META_FILE).write_text(json.dumps({"dim": self.dim}))
+            elif vectors.shape[1] != self.dim:
+                raise ValueError(
+                    f"Embedding dimension {vectors.shape[1]} does not match index ({self.dim})"
+                )
+
+            rows, new_ids, seen = [], [], set()
+            for i, paper_id in enumerate(paper_ids):
+                base = base_id(paper_id)
+                if base in self._known or base in seen:
+                    continue
+                seen.add(base)
+                rows.append(i)
+                new_ids.append(paper_id)
+
+            if not rows:
+                return 0
+
+            new_vectors = np.ascontiguousarray(vectors[rows], dtype=np.float32)
+
+            # Vectors and labels first: on a crash, rows without an id are truncated by _refresh
+            with open(self.directory / self.VECTORS_FILE, "ab") as f:
+                f.write(new_vectors.tobytes())
+            if self._centroids is not None:
+                self._append_lists(new_vectors)
+            with open(self.directory / self.IDS_FILE, "a", encoding="utf-8") as f:
+                f.write("".join(f"{paper_id}\n" for paper_id in new_ids))
+
+            self._refresh()
+
+            if self._centroids is None and len(self) >= self.ivf_min_rows:
+                self._train_ivf()
+
+        return len(new_ids)
+
+    def search(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k most similar indexed papers for each query.
+
+        Args:
+            queries: (q, d) array of embeddings
+            k: Number of neighbours
+
+        Returns:
+            Tuple of ((q, k) cosine similarities, (q, k) row numbers), best first;
+            missing neighbours have similarity -inf and row -1
+        """
+        queries = normalize(queries)
+        best_s = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        best_i = np.full((len(queries), k), -1, dtype=np.int64)
+
+        matrix = self._matrix()
+        if matrix is None or k <= 0:
+            return best_s, best_i
+
+        if self._centroids is not None:
+            best_s, best_i = self._search_ivf(matrix, queries, best_s, best_i)
+        else:
+            for start in range(0, len(matrix), self.block_rows):
+                block = np.asarray(matrix[start : start + self.block_rows])
+                rows = np.arange(start, start + len(block))
+                best_s, best_i = _merge_topk(best_s, best_i, queries @ block.T, rows)
+
+        order = np.argsort(-best_s, axis=1)
+        return np.take_along_axis(best_s, order, 1), np.take_along_axis(best_i, order, 1)
+
+    def novelty(self, paper_ids: Sequence[str], queries: np.ndarray, k: int = 10) -> np.ndarray:
+        """
+        Novelty of papers relative to everything indexed so far.
+
+        Defined as one minus the mean cosine similarity to the k nearest
+        historical papers; earlier versions of the same paper are ignored.
+
+        Args:
+            paper_ids: Ids of the query papers
+            queries: (q, d) array of embeddings
+            k: Number of neighbours
+
+        Returns:
+            (q,) array of novelty values (1.0 when there is no history)
+        """
+        # Extra neighbours so that self-matches can be dropped
+        sims, rows = self.search(queries, k + 2)
+        novelty = np.ones(len(queries), dtype=np.float32)
+
+        for q, paper_id in enumerate(paper_ids):
+            base = base_id(paper_id)
+            neighbours = [
+                s
+                for s, row in zip(sims[q], rows[q], strict=True)
+                if row >= 0 and base_id(self._ids[row]) != base
+            ][:k]
+            if neighbours:
+                novelty[q] = 1.0 - float(np.mean(neighbours))
+
+        return novelty
+
+    def _matrix(self) -> np.memmap | None:
+        """Memory-map the committed rows read-only."""
+        if self.dim is None or not self._ids:
+            return None
+        return np.memmap(
+            self.directory / self.VECTORS_FILE,
+            dtype=np.float32,
+            mode="r",
+            shape=(len(self._ids), self.dim),
+        )
+
+    def _refresh(self, truncate: bool = False) -> None:
+        """
+        Pick up rows appended by other processes.
+
+        Args:
+            truncate: Drop vectors without an id (left by a crashed writer). Only
+                safe while holding the file lock, since a live writer appends its
+                vectors before its ids.
+        """
+        meta_path = self.directory / self.META_FILE
+        if self.dim is None and meta_path.exists():
+            self.dim = json.loads(meta_path.read_text())["dim"]
+
+        ids_path = self.directory / self.IDS_FILE
+        if ids_path.exists():
+            with open(ids_path, encoding="utf-8") as f:
+                f.seek(self._ids_offset)
+                chunk = f.read()
+            # Ignore a trailing partial line
+            complete = chunk[: chunk.rfind("\n") + 1]
+            self._ids_offset += len(complete.encode("utf-8"))
+            for paper_id in complete.splitlines():
+                self._ids.append(paper_id)
+                self._known.add(base_id(paper_id))
+
+        vectors_path = self.directory / self.VECTORS_FILE
+        if truncate and self.dim is not None and vectors_path.exists():
+            expected = len(self._ids) * self.dim * 4
+            if vectors_path.stat().st_size > expected:
+                with open(vectors_path, "r+b") as f:
+                    f.truncate(expected)
+
+        centroids_path = self.directory / self.CENTROIDS_FILE
+        if self._centroids is None and centroids_path.exists():
+            self._centroids = np.load(centroids_path)
+
+        if truncate and self._centroids is not None:
+            self._repair_lists()
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        """Exclusive lock serializing writers across processes."""
+        with open(self.directory / self.LOCK_FILE, "w") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _train_ivf(self) -> None:
+        """Train the coarse quantizer on a sample and label every existing row."""
+        matrix = self._matrix()
+        sample_rows = np.linspace(0, len(matrix) - 1, min(len(matrix), 50000)).astype(int)
+        sample = np.asarray(matrix[sample_rows])
+
+        centroids, _ = spherical_kmeans(sample, self.num_lists)
+        np.save(self.directory / self.CENTROIDS_FILE, centroids)
+        self._centroids = centroids
+
+        (self.directory / self.LISTS_FILE).unlink(missing_ok=True)
+        self._ivf_lists = None
+        for start in range(0, len(matrix), self.block_rows):
+            self._append_lists(np.asarray(matrix[start : start + self.block_rows]))
+
+        logger.info(f"Trained IVF quantizer for NoveltyIndex ({self.num_lists} lists)")
+
+    def _repair_lists(self) -> None:
+        """
+        Make ``lists.i32`` hold exactly one label per committed row.
+
+        A writer that crashed after its labels but before its ids leaves extra
+        labels, which are dropped; one that crashed while (re)labelling leaves
+        too few, which are recomputed from the committed vectors.
+        """
+        lists_path = self.directory / self.LISTS_FILE
+        size = lists_path.stat().st_size if lists_path.exists() else 0
+        num_rows = len(self._ids)
+        if size == num_rows * 4:
+            return
+
+        labelled = min(size // 4, num_rows)
+        with open(lists_path, "ab") as f:
+            f.truncate(labelled * 4)
+        matrix = self._matrix()
+        for start in range(labelled, num_rows, self.block_rows):
+            self._append_lists(np.asarray(matrix[start : start + self.block_rows]))
+        self._ivf_lists = None
+        logger.warning(f"Repaired NoveltyIndex list labels ({size // 4} for {num_rows} rows)")
+
+    def _append_lists(self, vectors: np.ndarray) -> None:
+        """Append IVF list labels for new rows."""
+        labels = (vectors @ self._centroids.T).argmax(axis=1).astype(np.int32)
+        with open(self.directory / self.LISTS_FILE, "ab") as f:
+            f.write(labels.tobytes())
+
+    def _search_ivf(
+        self,
+        matrix: np.memmap,
+        queries: np.ndarray,
+        best_s: np.ndarray,
+        best_i: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Search only the ``nprobe`` lists closest to each query."""
+        order, bounds = self._lists(len(matrix))
+
+        nprobe = min(self.nprobe, len(self._centroids))
+        probes = np.argsort(-(queries @ self._centroids.T), axis=1)[:, :nprobe]
+
+        for list_id in np.unique(probes):
+            rows = np.sort(order[bounds[list_id] : bounds[list_id + 1]])
+            if len(rows) == 0:
+                continue
+            q = np.nonzero((probes == list_id).any(axis=1))[0]
+            sims = queries[q] @ np.asarray(matrix[rows]).T
+            best_s[q], best_i[q] = _merge_topk(best_s[q], best_i[q], sims, rows)
+
+        return best_s, best_i
+
+    def _lists(self, num_rows: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rows grouped by IVF list, re-read only when the row count changes.
+
+        Returns:
+            Tuple of (row numbers ordered by list, start offset of each list in it)
+        """
+        if self._ivf_lists is None or self._ivf_lists[0] != num_rows:
+            labels = np.fromfile(self.directory / self.LISTS_FILE, dtype=np.int32)[:num_rows]
+            order = np.argsort(labels, kind="stable")
+            bounds = np.searchsorted(labels[order], np.arange(len(self._centroids) + 1))
+            self._ivf_lists = (num_rows, order, bounds)
+        return self._ivf_lists[1], self._ivf_lists[2]
+
+
+def base_id(paper_id: str) -> str:
+    """arXiv id without its version suffix (2511.14899v2 -> 2511.14899)."""
+    base, sep, version = paper_id.rpartition("v")
+    return base if sep and version.isdigit() and base else paper_id
+
+
+def _merge_topk(
+    best_s: np.ndarray, best_i: np.ndarray, sims: np.ndarray, rows: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Merge a block of candidate similarities into the running top-k per query."""
+    k = best_s.shape[1]
+    cand_s = np.concatenate([best_s, sims], axis=1)
+    cand_i = np.concatenate([best_i, np.broadcast_to(rows, sims.shape)], axis=1)
+    top = np.argpartition(-cand_s, k - 1, axis=1)[:, :k]
+    return np.take_along_axis(cand_s, top, 1), np.take_along_axis(cand_i, top, 1)
@@ -82,19 +82,29 @@ class PDFProcessor:
             Dictionary of PDF metadata
         """
         try:
-            doc = fitz.open(str(pdf_path))
-            metadata = doc.metadata
-            page_count = len(doc)
-            doc.close()
-
-            return {
-                "title": metadata.get("title", ""),
-                "author": metadata.get("author", ""),
-                "subject": metadata.get("subject", ""),
-                "creator": metadata.get("creator", ""),
-                "producer": metadata.get("producer", ""),
-                "page_count": page_count,
-            }
+            with fitz.open(str(pdf_path)) as doc:
+                return self.document_metadata(doc)
         except Exception as e:
             logger.error(f"Error extracting metadata: {e}")
             return {}
+
+    @staticmethod
+    def document_metadata(doc: fitz.Document) -> Dict[str, Any]:
+        """
+        Extract metadata from an already opened PDF.
+
+        Args:
+            doc: Open PyMuPDF document
+
+        Returns:
+            Dictionary of PDF metadata
+        """
+        metadata = doc.metadata or {}
+        return {
+            "title": metadata.get("title", ""),
+            "author": metadata.get("author", ""),
+            "subject": metadata.get("subject", ""),
+            "creator": metadata.get("creator", ""),
+            "producer": metadata.get("producer", ""),
+            "page_count": len(doc),
+        }
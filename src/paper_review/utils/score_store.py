@@ -0,0 +1,127 @@
+"""Persistent store of novelty scores."""
+
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from loguru import logger
+
+from paper_review.models import NoveltyScore
+from paper_review.utils.store import SQLiteStore
+
+
+class ScoreStore(SQLiteStore):
+    """
+    On-disk NoveltyScore store shared across runs and processes.
+
+    Scores are keyed by the versioned arXiv id (e.g. ``2511.14899v2``), the
+    scoring model and a hash of the prompt templates, so a new paper
+    version, a model switch or a prompt change all lead to re-scoring.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS novelty_scores (
+        arxiv_id TEXT NOT NULL,
+        model TEXT NOT NULL,
+        prompt_hash TEXT NOT NULL,
+        score TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        PRIMARY KEY (arxiv_id, model, prompt_hash)
+    );
+    """
+
+    # SQLite limits the number of bound parameters per statement
+    LOOKUP_CHUNK = 500
+
+    def __init__(self, path: str | Path = "data/cache/scores.sqlite3"):
+        """
+        Initialize the store.
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        super().__init__(path)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ScoreStore | None":
+        """
+        Create a store from the ``novelty_filter.score_cache`` config section.
+
+        Args:
+            config: score_cache configuration dictionary
+
+        Returns:
+            ScoreStore, or None if disabled
+        """
+        if not config.get("enabled", False):
+            return None
+
+        return cls(path=config.get("path", "data/cache/scores.sqlite3"))
+
+    def get_many(
+        self, arxiv_ids: List[str], model: str, prompt_hash: str
+    ) -> Dict[str, NoveltyScore]:
+        """
+        Look up stored scores.
+
+        Args:
+            arxiv_ids: Versioned arXiv ids
+            model: Scoring model name
+            prompt_hash: Hash of the scoring prompt templates
+
+        Returns:
+            Mapping of arxiv_id to NoveltyScore for the ids found
+        """
+        found: Dict[str, NoveltyScore] = {}
+        for start in range(0, len(arxiv_ids), self.LOOKUP_CHUNK):
+            chunk = arxiv_ids[start : start + self.LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.query(
+                f"SELECT arxiv_id, score FROM novelty_scores "
+                f"WHERE model = ? AND prompt_hash = ? AND arxiv_id IN ({placeholders})",
+                (model, prompt_hash, *chunk),
+            )
+            for arxiv_id, score in rows:
+                try:
+                    found[arxiv_id] = NoveltyScore.model_validate_json(score)
+                except ValueError as e:
+                    logger.warning(f"Ignoring invalid stored score for {arxiv_id}: {e}")
+
+        self.hits += len(found)
+        self.misses += len(set(arxiv_ids)) - len(found)
+        return found
+
+    def put_many(self, scores: Dict[str, NoveltyScore], model: str, prompt_hash: str) -> None:
+        """
+        Store scores.
+
+        Args:
+            scores: Mapping of versioned arXiv id to NoveltyScore
+            model: Scoring model name
+            prompt_hash: Hash of the scoring prompt templates
+        """
+        if not scores:
+            return
+
+        now = time.time()
+        with self.transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO novelty_scores "
+                "(arxiv_id, model, prompt_hash, score, created_at) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (arxiv_id, model, prompt_hash, score.model_dump_json(), now)
+                    for arxiv_id, score in scores.items()
+                ],
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get store counters.
+
+        Returns:
+            Dictionary with hits, misses and stored entry count
+        """
+        entries = self.query("SELECT COUNT(*) FROM novelty_scores")[0][0]
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
@@ -0,0 +1,64 @@
+"""SQLite helpers shared by the on-disk stores."""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, List, Sequence
+
+
+class SQLiteStore:
+    """
+    Base class for small SQLite-backed stores.
+
+    Subclasses declare their tables in ``SCHEMA``. A single connection is
+    shared by all threads of a process and guarded by a lock; WAL mode lets
+    several processes (e.g. web pipeline workers) use the same file.
+    """
+
+    SCHEMA: str = ""
+
+    def __init__(self, path: str | Path):
+        """
+        Open (and create if needed) the database.
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+
+        if self.SCHEMA:
+            with self._lock:
+                self._conn.executescript(self.SCHEMA)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in a single transaction (committed on success)."""
+        with self._lock:
+            with self._conn:
+                yield self._conn
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        """
+        Run a read query.
+
+        Args:
+            sql: SQL statement
+            params: Statement parameters
+
+        Returns:
+            All result rows
+        """
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
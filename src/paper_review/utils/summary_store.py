@@ -0,0 +1,129 @@
+"""Persistent store of generated paper summaries."""
+
+import hashlib
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+from paper_review.utils.store import SQLiteStore
+
+
+class SummaryStore(SQLiteStore):
+    """
+    On-disk store of summary texts for incremental pipeline runs.
+
+    Summaries are keyed by paper id, a hash of the summarized inputs (title,
+    authors, abstract), the model, the output language and the prompt
+    version, so a paper is only summarized again when one of them changes.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS summaries (
+        paper_id TEXT NOT NULL,
+        input_hash TEXT NOT NULL,
+        model TEXT NOT NULL,
+        language TEXT NOT NULL,
+        prompt_version TEXT NOT NULL,
+        summary TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        PRIMARY KEY (paper_id, input_hash, model, language, prompt_version)
+    );
+    """
+
+    def __init__(self, path: str | Path = "data/cache/summaries.sqlite3"):
+        """
+        Initialize the store.
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        super().__init__(path)
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "SummaryStore | None":
+        """
+        Create a store from the ``summary_mode.summary_store`` config section.
+
+        Args:
+            config: summary_store configuration dictionary
+
+        Returns:
+            SummaryStore, or None if disabled
+        """
+        if not config.get("enabled", False):
+            return None
+
+        return cls(path=config.get("path", "data/cache/summaries.sqlite3"))
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        """Short SHA-256 digest of a text."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+    def get(
+        self, paper_id: str, input_hash: str, model: str, language: str, prompt_version: str
+    ) -> str | None:
+        """
+        Look up a stored summary.
+
+        Args:
+            paper_id: Paper identifier
+            input_hash: Hash of the summarized inputs
+            model: Summarization model name
+            language: Output language
+            prompt_version: Hash of the prompt template and generation settings
+
+        Returns:
+            Summary text, or None if the paper needs summarizing
+        """
+        rows = self.query(
+            "SELECT summary FROM summaries WHERE paper_id = ? AND input_hash = ? "
+            "AND model = ? AND language = ? AND prompt_version = ?",
+            (paper_id, input_hash, model, language, prompt_version),
+        )
+        if not rows:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return rows[0][0]
+
+    def put(
+        self,
+        paper_id: str,
+        input_hash: str,
+        model: str,
+        language: str,
+        prompt_version: str,
+        summary: str,
+    ) -> None:
+        """
+        Store a summary.
+
+        Args:
+            paper_id: Paper identifier
+            input_hash: Hash of the summarized inputs
+            model: Summarization model name
+            language: Output language
+            prompt_version: Hash of the prompt template and generation settings
+            summary: Summary text
+        """
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO summaries "
+                "(paper_id, input_hash, model, language, prompt_version, summary, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (paper_id, input_hash, model, language, prompt_version, summary, time.time()),
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get store counters.
+
+        Returns:
+            Dictionary with hits, misses and stored entry count
+        """
+        entries = self.query("SELECT COUNT(*) FROM summaries")[0][0]
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
@@ -0,0 +1,49 @@
+"""Vector helpers for embedding-based ranking."""
+
+from typing import List, Tuple
+
+import numpy as np
+
+
+def normalize(vectors: List[List[float]] | np.ndarray) -> np.ndarray:
+    """L2-normalize rows (as float32)."""
+    matrix = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+def rescale(values: np.ndarray) -> np.ndarray:
+    """Min-max rescale to [0, 1] so components with different ranges can be weighted."""
+    span = values.max() - values.min()
+    if span <= 0:
+        return np.zeros_like(values)
+    return (values - values.min()) / span
+
+
+def spherical_kmeans(
+    vectors: np.ndarray, k: int, iterations: int = 10
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cluster normalized vectors by cosine similarity.
+
+    Args:
+        vectors: (n, d) array of L2-normalized vectors
+        k: Number of clusters
+        iterations: Number of assignment/update rounds
+
+    Returns:
+        Tuple of ((k, d) normalized centroids, (n,) cluster labels)
+    """
+    # Deterministic initialization from evenly spaced rows
+    centroids = vectors[np.linspace(0, len(vectors) - 1, k).astype(int)].copy()
+
+    for _ in range(iterations):
+        labels = (vectors @ centroids.T).argmax(axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, vectors)
+        empty = ~sums.any(axis=1)
+        sums[empty] = centroids[empty]
+        centroids = normalize(sums)
+
+    labels = (vectors @ centroids.T).argmax(axis=1)
+    return centroids, labels
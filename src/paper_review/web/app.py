@@ -1,6 +1,7 @@
 """FastAPI web application."""
 
-from datetime import date, timedelta
+import asyncio
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import List
 
@@ -11,8 +12,9 @@ from fastapi.templating import Jinja2Templates
 from loguru import logger
 
 from paper_review.core.config import ConfigLoader
-from paper_review.core.pipeline import PaperReviewPipeline
-from paper_review.models import FilterConfig, SummaryReport
+from paper_review.models import FilterConfig, PaperSummary, SummaryReport
+from paper_review.utils import ArxivClient, CatalogSync, PaperCatalog
+from paper_review.web.executor import PipelineExecutor
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -34,6 +36,15 @@ if static_dir.exists():
 config_loader = ConfigLoader()
 config = config_loader.config
 
+# Created in startup_event, not at import time
+# Pipelines run in worker processes; the event loop only handles HTTP
+executor: PipelineExecutor | None = None
+# Local arXiv metadata mirror kept up to date in the background (None: sync disabled)
+catalog_config = config.get("arxiv", {}).get("catalog", {})
+catalog: PaperCatalog | None = None
+catalog_sync: CatalogSync | None = None
+sync_task: asyncio.Task | None = None
+
 # Global state for storing latest report
 latest_report: SummaryReport | None = None
 is_running: bool = False
@@ -61,10 +72,15 @@ async def list_papers(
     hf_keywords: str = "",
     hf_filter_mode: str = "OR",
     days_back: int = 1,
+    limit: int = 200,
 ):
     """
     논문 리스트 페이지 (SSR).
 
+    백그라운드 동기화로 유지되는 로컬 메타데이터 미러가 요청한 카테고리와
+    기간을 모두 담고 있으면 arXiv 논문은 미러에서 바로 조회한다 (초록을 요약
+    대신 표시). 그 밖의 경우에는 파이프라인을 실행한다.
+
     Query parameters:
         sources: 논문 소스 (comma-separated)
         arxiv_categories: arXiv 카테고리 (comma-separated)
@@ -72,6 +88,7 @@ async def list_papers(
         hf_keywords: HF 키워드 (comma-separated)
         hf_filter_mode: AND 또는 OR
         days_back: 최근 N일
+        limit: 미러에서 가져올 최대 arXiv 논문 수
     """
     # Parse sources
     source_list = [s.strip() for s in sources.split(",") if s.strip()]
@@ -90,9 +107,12 @@ async def list_papers(
         hf_filter_mode=hf_filter_mode,
     )
 
-    # Run pipeline
-    pipeline = PaperReviewPipeline(config)
-    report = await pipeline.run(filter_config, process_pdfs=False)
+    catalog_filter = catalog_filter_for(filter_config)
+    if catalog_filter is not None:
+        report = await list_from_catalog(catalog_filter, limit)
+    else:
+        # Run pipeline
+        report = await executor.run(filter_config, process_pdfs=False)
 
     global latest_report
     latest_report = report
@@ -154,14 +174,55 @@ async def fetch_papers(
     return {"status": "started", "message": "논문 수집을 시작했습니다"}
 
 
+def catalog_filter_for(filter_config: FilterConfig) -> FilterConfig | None:
+    """미러로 답할 수 있으면 미러 조회용 필터를, 아니면 None을 반환."""
+    if catalog_sync is None or "arxiv" not in filter_config.sources:
+        return None
+
+    if not filter_config.arxiv_categories:
+        # Without a category filter the mirror holds just the synced categories
+        filter_config = filter_config.model_copy(
+            update={"arxiv_categories": catalog_sync.categories}
+        )
+    date_from, _ = filter_config.get_date_range()
+    if not catalog_sync.catalog.covers(filter_config.arxiv_categories, date_from):
+        logger.info("Local arXiv mirror does not cover the request, running the pipeline")
+        return None
+    return filter_config
+
+
+async def list_from_catalog(filter_config: FilterConfig, limit: int) -> SummaryReport:
+    """로컬 미러에서 arXiv 논문 리스트 생성 (HF는 파이프라인으로 가져옴)."""
+    papers = await asyncio.to_thread(catalog.search, filter_config, limit)
+    summaries = [
+        PaperSummary(paper_id=metadata.arxiv_id, metadata=metadata, summary=metadata.summary)
+        for metadata in papers
+    ]
+
+    huggingface_count = 0
+    if "huggingface" in filter_config.sources:
+        hf_report = await executor.run(
+            filter_config.model_copy(update={"sources": ["huggingface"]}), process_pdfs=False
+        )
+        summaries.extend(hf_report.summaries)
+        huggingface_count = hf_report.huggingface_count
+
+    return SummaryReport(
+        date=datetime.now().strftime("%Y-%m-%d"),
+        total_papers=len(summaries),
+        arxiv_count=len(papers),
+        huggingface_count=huggingface_count,
+        summaries=summaries,
+    )
+
+
 async def run_pipeline_background(filter_config: FilterConfig):
     """백그라운드에서 파이프라인 실행."""
     global latest_report, is_running
 
     try:
         logger.info("Starting background pipeline")
-        pipeline = PaperReviewPipeline(config)
-        report = await pipeline.run(filter_config, process_pdfs=True)
+        report = await executor.run(filter_config, process_pdfs=True, background=True)
         latest_report = report
         logger.info(f"Background pipeline completed: {report.total_papers} papers")
     except Exception as e:
@@ -190,10 +251,29 @@ async def get_papers_json():
 @app.on_event("startup")
 async def startup_event():
     """애플리케이션 시작 시 실행."""
+    global executor, catalog, catalog_sync, sync_task
+
+    executor = PipelineExecutor(
+        config, max_workers=config.get("web", {}).get("pipeline_workers", 2)
+    )
+    executor.start()
+
+    # A mirror without background sync goes stale, so /papers only uses a synced one
+    if catalog_config.get("sync", {}).get("enabled", False):
+        catalog = PaperCatalog.from_config(catalog_config)
+        if catalog is not None:
+            client = ArxivClient(config.get("arxiv", {}))
+            catalog_sync = CatalogSync.from_config(catalog_config, catalog, client)
+            sync_task = asyncio.create_task(catalog_sync.run())
+
     logger.info("Paper Review Service started")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """애플리케이션 종료 시 실행."""
+    if sync_task is not None:
+        sync_task.cancel()
+    if executor is not None:
+        executor.shutdown()
     logger.info("Paper Review Service stopped")
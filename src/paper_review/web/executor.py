@@ -0,0 +1,119 @@
+"""Out-of-process pipeline execution for the web application."""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict
+
+from loguru import logger
+
+from paper_review.models import FilterConfig, SummaryReport
+
+
+def _run_pipeline(
+    config: Dict[str, Any], filter_data: Dict[str, Any], process_pdfs: bool
+) -> Dict[str, Any]:
+    """
+    Run the pipeline inside a worker process.
+
+    Arguments and the result cross the process boundary as plain dicts.
+
+    Args:
+        config: Full configuration dictionary
+        filter_data: Serialized FilterConfig
+        process_pdfs: Whether to download PDFs and extract content
+
+    Returns:
+        Serialized SummaryReport
+    """
+    from paper_review.core.pipeline import PaperReviewPipeline
+
+    pipeline = PaperReviewPipeline(config)
+    report = asyncio.run(
+        pipeline.run(FilterConfig.model_validate(filter_data), process_pdfs=process_pdfs)
+    )
+    return report.model_dump(mode="json")
+
+
+class PipelineExecutor:
+    """
+    Run pipelines in dedicated worker processes so the web event loop only serves HTTP.
+
+    Background runs (full fetch, ranking and PDF processing) take at most one
+    worker at a time, so interactive requests such as ``/papers`` listings
+    always have a worker of their own instead of queueing behind them.
+    """
+
+    def __init__(self, config: Dict[str, Any], max_workers: int = 2):
+        """
+        Initialize the executor.
+
+        Args:
+            config: Full configuration dictionary
+            max_workers: Number of pipeline worker processes (at least 2: one
+                for background runs, the rest for interactive requests)
+        """
+        self.config = config
+        self.max_workers = max(2, max_workers)
+        self._pool: ProcessPoolExecutor | None = None
+        self._background = asyncio.Semaphore(1)
+
+    def start(self) -> None:
+        """Start the worker pool (no-op if already running)."""
+        if self._pool is None:
+            # spawn: never fork the uvicorn process with its threads and sockets
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"Started pipeline executor ({self.max_workers} worker process(es))")
+
+    def shutdown(self) -> None:
+        """Stop the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            logger.info("Stopped pipeline executor")
+
+    async def run(
+        self, filter_config: FilterConfig, process_pdfs: bool = True, background: bool = False
+    ) -> SummaryReport:
+        """
+        Run the pipeline in a worker process and await its report.
+
+        Args:
+            filter_config: Filter configuration
+            process_pdfs: Whether to download PDFs and extract content
+            background: Queue behind other background runs (one at a time)
+
+        Returns:
+            SummaryReport produced by the worker
+        """
+        if not background:
+            return await self._submit(filter_config, process_pdfs)
+
+        async with self._background:
+            return await self._submit(filter_config, process_pdfs)
+
+    async def _submit(self, filter_config: FilterConfig, process_pdfs: bool) -> SummaryReport:
+        """Run the pipeline in the worker pool."""
+        self.start()
+        loop = asyncio.get_running_loop()
+
+        try:
+            data = await loop.run_in_executor(
+                self._pool,
+                _run_pipeline,
+                self.config,
+                filter_config.model_dump(mode="json"),
+                process_pdfs,
+            )
+        except BrokenProcessPool:
+            # A worker died (e.g. a crash inside PyMuPDF); replace the pool for the next run
+            logger.error("Pipeline worker process died, restarting executor")
+            self.shutdown()
+            self.start()
+            raise
+
+        return SummaryReport.model_validate(data)
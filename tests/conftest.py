@@ -0,0 +1,23 @@
+"""Shared test fixtures."""
+
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from paper_review.core.config import ConfigLoader
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def shipped_config() -> Dict[str, Any]:
+    """The repository's config/config.yaml."""
+    return ConfigLoader(REPO_ROOT / "config" / "config.yaml").config
+
+
+@pytest.fixture
+def workdir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Run the test from an empty directory, so relative data/ paths land in tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
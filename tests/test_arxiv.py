@@ -0,0 +1,261 @@
+"""Tests for the arXiv API client."""
+
+import io
+import socket
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+
+from paper_review.utils.arxiv import MERGE_BUFFER, ArxivClient, parse_export_feed
+
+T0 = datetime(2026, 10, 1, tzinfo=UTC)
+
+ENTRY = """<entry>
+  <id>http://arxiv.org/abs/2610.{n:05d}v1</id>
+  <published>{date}</published>
+  <title>Paper
+    {n}</title>
+  <summary>  Abstract {n}.
+  </summary>
+  <author><name>A. Author</name></author>
+  <author><name>B. Author</name></author>
+  {extra}
+  <category term="cs.LG"/>
+  <category term="cs.AI"/>
+</entry>"""
+
+
+def feed(minutes: list, extra: str = "") -> bytes:
+    """Build an export API response with one entry per minute offset from ``T0``."""
+    entries = "".join(
+        ENTRY.format(
+            n=m, date=(T0 - timedelta(minutes=m)).strftime("%Y-%m-%dT%H:%M:%SZ"), extra=extra
+        )
+        for m in minutes
+    )
+    return (
+        '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">'
+        f"{entries}</feed>"
+    ).encode()
+
+
+class OkHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    """Serve pages of ``minutes`` by offset; ``faults`` holds one action per request."""
+
+    minutes: list = []
+    faults: list = []
+    offsets: list = []
+
+    def do_GET(self):
+        params = parse_qs(urlparse(self.path).query)
+        offset, size = int(params["start"][0]), int(params["max_results"][0])
+        self.offsets.append(offset)
+        fault = self.faults.pop(0) if self.faults else None
+        body = feed(self.minutes[offset : offset + size])
+        if fault == "slow":
+            time.sleep(1)
+        elif fault == "truncated":
+            body = body[: len(body) // 2]
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def export_api():
+    """Start a local export API and return a client factory pointed at it."""
+    FeedHandler.minutes, FeedHandler.faults, FeedHandler.offsets = list(range(5)), [], []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FeedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/query"
+    yield lambda **config: ArxivClient(
+        {"delay_seconds": 0, "api_url": url, "page_size": 2, **config}
+    )
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client():
+    return ArxivClient({"delay_seconds": 0, "split_threshold": 3})
+
+
+def results(query: str, minutes: list):
+    """Fake API results for a query, newest first."""
+    for m in minutes:
+        yield SimpleNamespace(query=query, published=T0 - timedelta(minutes=m))
+
+
+def test_api_requests_time_out():
+    # Accepts the connection but never answers
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    port = server.getsockname()[1]
+    client = ArxivClient({"api_timeout": 0.3, "delay_seconds": 0})
+
+    started = time.monotonic()
+    try:
+        with pytest.raises(requests.Timeout):
+            client.client._session.get(f"http://127.0.0.1:{port}/api/query")
+    finally:
+        server.close()
+    assert time.monotonic() - started < 2
+
+
+@pytest.mark.parametrize(
+    "cats, mode, planned",
+    [
+        (["cs.LG", "cs.AI", "cs.CL"], "OR", [["cs.LG"], ["cs.AI"], ["cs.CL"]]),
+        (["cs.LG", "cs.AI"], "OR", [["cs.LG", "cs.AI"]]),
+        (["cs.LG", "cs.AI", "cs.CL"], "AND", [["cs.LG", "cs.AI", "cs.CL"]]),
+    ],
+)
+def test_plan_queries(client, cats, mode, planned):
+    assert client.plan_queries(cats, mode) == planned
+
+
+def test_build_query_pushes_the_date_range(client):
+    query = client._build_query(["cs.LG", "cs.AI"], T0 - timedelta(days=1), T0, "AND")
+    assert query == "(cat:cs.LG AND cat:cs.AI) AND submittedDate:[202609300000 TO 202610010000]"
+    assert client._build_query(["cs.LG"]) == "cat:cs.LG"
+
+
+def test_merge_orders_results_by_submission_date(client):
+    streams = {"a": [0, 5, 9], "b": [1, 2, 20], "c": []}
+
+    merged = client._iter_merged(list(streams), lambda q, _: results(q, streams[q]))
+
+    assert [T0 - r.published for r in merged] == [
+        timedelta(minutes=m) for m in (0, 1, 2, 5, 9, 20)
+    ]
+
+
+def test_merge_reraises_query_errors(client):
+    def run_query(query, in_thread):
+        yield from results(query, [0])
+        if query == "b":
+            raise requests.ConnectionError("down")
+
+    with pytest.raises(requests.ConnectionError):
+        list(client._iter_merged(["a", "b"], run_query))
+
+
+def test_merge_buffers_are_bounded_and_released_on_close(client):
+    produced = {"a": 0, "b": 0}
+    finished = threading.Event()
+
+    def run_query(query, in_thread):
+        try:
+            for result in results(query, range(100_000)):
+                produced[query] += 1
+                yield result
+        finally:
+            if query == "a":
+                finished.set()
+
+    merged = client._iter_merged(["a", "b"], run_query)
+    assert len([next(merged) for _ in range(5)]) == 5
+    time.sleep(0.2)
+    assert max(produced.values()) <= MERGE_BUFFER + 10
+    merged.close()
+
+    # Producers blocked on a full queue exit once the merge has stopped
+    assert finished.wait(2)
+
+
+def test_api_requests_share_one_rate_limit():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), OkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/query"
+    config = {"delay_seconds": 0.15}
+
+    # Separate clients, as used by parallel split queries
+    sessions = [ArxivClient(config)._new_client()._session for _ in range(2)]
+    started = time.monotonic()
+    try:
+        for session in sessions * 2:
+            session.get(url)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert time.monotonic() - started >= 0.4
+
+
+def test_parse_export_feed():
+    extra = (
+        '<link title="pdf" href="https://arxiv.org/pdf/2610.00001v1"/>'
+        '<arxiv:primary_category term="cs.AI"/>'
+    )
+    [paper] = parse_export_feed(io.BytesIO(feed([1], extra)))
+    [bare] = parse_export_feed(io.BytesIO(feed([2])))
+
+    assert paper.arxiv_id == "2610.00001v1"
+    assert paper.title == "Paper 1"
+    assert paper.summary == "Abstract 1."
+    assert paper.authors == ["A. Author", "B. Author"]
+    assert paper.published == T0 - timedelta(minutes=1)
+    assert paper.categories == ["cs.LG", "cs.AI"]
+    assert (paper.primary_category, paper.pdf_url) == ("cs.AI", "https://arxiv.org/pdf/2610.00001v1")
+    # Without the optional elements the first category and the canonical PDF URL are used
+    assert (bare.primary_category, bare.pdf_url) == ("cs.LG", "https://arxiv.org/pdf/2610.00002v1")
+
+
+def test_parse_export_feed_raises_on_api_errors():
+    error = (
+        '<feed xmlns="http://www.w3.org/2005/Atom"><entry>'
+        "<id>http://arxiv.org/api/errors#incorrect_id_format</id>"
+        "<summary>incorrect id format</summary></entry></feed>"
+    )
+    with pytest.raises(ValueError, match="incorrect id format"):
+        list(parse_export_feed(io.BytesIO(error.encode())))
+
+
+def test_native_query_pages_until_the_start_date(export_api):
+    client = export_api()
+
+    papers = list(client._iter_query_native("cat:cs.LG", 10, T0 - timedelta(minutes=2), None))
+
+    # The page holding the first older paper is the last one requested
+    assert [p.arxiv_id for p in papers] == [f"2610.{m:05d}v1" for m in range(3)]
+    assert FeedHandler.offsets == [0, 2]
+
+
+@pytest.mark.parametrize("fault", ["truncated", "slow"])
+def test_native_query_retries_failed_pages(export_api, fault):
+    client = export_api(api_timeout=0.3)
+    FeedHandler.faults = [None, fault]
+
+    papers = list(client._iter_query_native("cat:cs.LG", 10, None, None))
+
+    assert len(papers) == 5
+    assert FeedHandler.offsets == [0, 2, 2, 4]
+
+
+def test_native_query_is_paced_by_the_shared_limiter(export_api):
+    client = export_api(delay_seconds=0.15)
+
+    started = time.monotonic()
+    assert len(list(client._iter_query_native("cat:cs.LG", 10, None, None))) == 5
+    assert time.monotonic() - started >= 0.3
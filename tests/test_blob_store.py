@@ -0,0 +1,136 @@
+"""Tests for the content-addressed blob store."""
+
+import time
+
+import pytest
+
+from paper_review.utils.blob_store import BlobStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = BlobStore(tmp_path / "blobs", max_size_gb=None)
+    yield store
+    store.close()
+
+
+def quota_store(tmp_path, max_bytes: int, **kwargs) -> BlobStore:
+    return BlobStore(tmp_path / "blobs", max_size_gb=max_bytes / 1024**3, **kwargs)
+
+
+def expire_leases(store: BlobStore) -> None:
+    store.lease_age = 0
+    time.sleep(0.01)
+    store.release_pins()
+
+
+def test_identical_content_is_stored_once(store):
+    first = store.put_bytes(b"figure", "2610.00001v1", "image_1", ".png")
+    second = store.put_bytes(b"figure", "2610.00002v1", "image_1", ".png")
+
+    assert first == second
+    assert first.read_bytes() == b"figure"
+    assert store.stats()["blobs"] == 1
+    assert store.deduplicated == 1
+    assert store.get("2610.00002v1", "image_1") == first
+
+
+def test_put_file_moves_the_source(store, tmp_path):
+    source = tmp_path / "paper.pdf"
+    source.write_bytes(b"%PDF-1.7")
+
+    path = store.put_file(source, "2610.00001v1", "pdf")
+
+    assert not source.exists()
+    assert path.suffix == ".pdf"
+    assert store.paths("2610.00001v1") == {"pdf": path}
+    assert store.get("2610.00001v1", "image_1") is None
+
+
+def test_eviction_removes_least_recently_used_unpinned_blobs(tmp_path):
+    store = quota_store(tmp_path, 25)
+    for n in range(3):
+        store.put_bytes(bytes([n]) * 10, f"p{n}", "pdf", ".pdf")
+        time.sleep(0.01)
+    expire_leases(store)
+    store.pin(["p0"], owner="report:2026-10-16")
+
+    assert store.evict() == 1
+
+    assert store.get("p0", "pdf") is not None
+    assert store.get("p1", "pdf") is None
+    assert store.get("p2", "pdf") is not None
+    store.close()
+
+
+def test_blobs_of_a_run_in_progress_survive_periodic_eviction(tmp_path):
+    store = quota_store(tmp_path, 10)
+    store.EVICT_INTERVAL = 1
+    paths = [store.put_bytes(bytes([n]) * 10, f"p{n}", "pdf", ".pdf") for n in range(5)]
+
+    # Over quota, but every blob is leased by the run that wrote it
+    assert all(path.exists() for path in paths)
+
+    store.pin(["p4"], owner="report:2026-10-16")
+    expire_leases(store)
+    assert store.evict() == 4
+    assert [path.exists() for path in paths] == [False] * 4 + [True]
+    store.close()
+
+
+def test_reading_a_blob_renews_its_lease(tmp_path):
+    store = quota_store(tmp_path, 10)
+    store.put_bytes(b"x" * 10, "old", "pdf", ".pdf")
+    store.put_bytes(b"y" * 10, "new", "pdf", ".pdf")
+    expire_leases(store)
+
+    store.lease_age = 3600
+    store.get("old", "pdf")
+    assert store.evict() == 1
+    assert store.get("old", "pdf") is not None
+    store.close()
+
+
+def test_pins_are_released_per_owner_and_by_age(tmp_path):
+    store = quota_store(tmp_path, 10)
+    store.put_bytes(b"x" * 10, "a", "pdf", ".pdf")
+    store.put_bytes(b"y" * 10, "b", "pdf", ".pdf")
+    store.pin(["a"], owner="report:1")
+    store.pin(["b"], owner="report:2")
+
+    assert store.unpin("report:1") == 1
+    store.pin_age = 0
+    expire_leases(store)
+    assert store.stats()["pinned"] == 0
+    assert store.evict() == 1
+    store.close()
+
+
+@pytest.mark.parametrize("put", ["bytes", "file"])
+def test_put_survives_a_concurrent_eviction_of_the_same_content(tmp_path, put):
+    store = quota_store(tmp_path, 10)
+    other = quota_store(tmp_path, 10)  # Another process sharing the store
+    store.put_bytes(b"x" * 10, "old", "pdf", ".pdf")
+    time.sleep(0.01)
+    store.put_bytes(b"y" * 10, "new", "pdf", ".pdf")
+    expire_leases(store)
+
+    # The other process evicts the unpinned "x" blob while this one stores it again
+    register = store._register
+
+    def evict_then_register(*args):
+        other.evict()
+        return register(*args)
+
+    store._register = evict_then_register
+    if put == "bytes":
+        path = store.put_bytes(b"x" * 10, "again", "pdf", ".pdf")
+    else:
+        source = tmp_path / "again.pdf"
+        source.write_bytes(b"x" * 10)
+        path = store.put_file(source, "again", "pdf")
+
+    assert path.read_bytes() == b"x" * 10
+    assert store.get("again", "pdf") == path
+    store.close()
+    other.close()
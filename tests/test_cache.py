@@ -0,0 +1,86 @@
+"""Tests for the LLM response cache."""
+
+import time
+
+import pytest
+
+from paper_review.utils.cache import LLMCache
+
+BASE = {
+    "model": "qwen3:8b",
+    "prompt": "Rate this abstract",
+    "system_prompt": "You are a reviewer",
+    "options": {"temperature": 0.3, "num_predict": 200},
+    "format": "json",
+}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMCache(tmp_path / "llm.sqlite3")
+    yield cache
+    cache.close()
+
+
+def test_key_is_deterministic_and_ignores_option_order():
+    reordered = dict(BASE, options={"num_predict": 200, "temperature": 0.3})
+    assert LLMCache.make_key(**BASE) == LLMCache.make_key(**reordered)
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"model": "llama3"},
+        {"prompt": "Rate this abstract!"},
+        {"system_prompt": None},
+        {"options": {"temperature": 0.7, "num_predict": 200}},
+        {"format": None},
+    ],
+)
+def test_key_changes_with_every_input(change):
+    assert LLMCache.make_key(**BASE) != LLMCache.make_key(**dict(BASE, **change))
+
+
+def test_get_put_and_stats(cache):
+    key = LLMCache.make_key(**BASE)
+    assert cache.get(key) is None
+
+    cache.put(key, "qwen3:8b", '{"score": 7}')
+    assert cache.get(key) == '{"score": 7}'
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    assert stats["size_bytes"] == len('{"score": 7}')
+
+
+def test_entries_persist_across_instances(tmp_path):
+    first = LLMCache(tmp_path / "llm.sqlite3")
+    first.put("k", "m", "response")
+    first.close()
+
+    second = LLMCache(tmp_path / "llm.sqlite3")
+    assert second.get("k") == "response"
+    second.close()
+
+
+def test_expired_entries_are_misses(cache):
+    cache.put("k", "m", "response")
+    cache.max_age = 0
+    time.sleep(0.01)
+
+    assert cache.get("k") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_evicts_least_recently_used_above_size_limit(cache):
+    cache.max_bytes = 25
+    for key in ("a", "b", "c"):
+        cache.put(key, "m", "x" * 10)
+        time.sleep(0.01)
+    # "a" becomes the most recently used entry
+    assert cache.get("a") is not None
+
+    assert cache.evict() == 1
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
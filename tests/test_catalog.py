@@ -0,0 +1,145 @@
+"""Tests for the local arXiv catalog and its incremental harvest."""
+
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+
+from paper_review.agents.fetcher.arxiv import ArxivFetcher
+from paper_review.models import FilterConfig, PaperMetadata
+from paper_review.utils.catalog import CatalogSync, PaperCatalog
+
+NOW = datetime(2026, 10, 2, 12, tzinfo=UTC)
+
+
+def paper(n: int, published: datetime, categories=("cs.LG",)) -> PaperMetadata:
+    return PaperMetadata(
+        title=f"Paper {n}",
+        authors=["A. Author"],
+        summary="Abstract",
+        published=published,
+        arxiv_id=f"2610.{n:05d}v1",
+        primary_category=categories[0],
+        categories=list(categories),
+        source="arxiv",
+    )
+
+
+class FakeClient:
+    """Serves ``papers`` like ArxivClient.iter_recent_metadata and records the queries."""
+
+    def __init__(self, papers, max_results: int = 1000):
+        self.papers = sorted(papers, key=lambda p: p.published, reverse=True)
+        self.max_results = max_results
+        self.page_size = 2
+        self.categories = ["cs.LG"]
+        self.category = "cs.LG"
+        self.queries = []
+
+    def iter_recent_metadata(self, categories, date_from=None, date_to=None):
+        self.queries.append((date_from, date_to))
+        matching = [
+            p
+            for p in self.papers
+            if set(categories) & set(p.categories)
+            and (date_from is None or p.published >= date_from)
+            and (date_to is None or p.published <= date_to)
+        ]
+        yield from matching[: self.max_results]
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    catalog = PaperCatalog(tmp_path / "catalog.sqlite3")
+    yield catalog
+    catalog.close()
+
+
+def test_marks_only_extend(catalog):
+    assert catalog.get_mark("cs.LG") is None
+    catalog.update_mark("cs.LG", NOW - timedelta(days=1), NOW, "2610.00001v1")
+
+    mark = catalog.update_mark("cs.LG", NOW - timedelta(hours=1), NOW - timedelta(hours=2))
+
+    assert mark.since == NOW - timedelta(days=1)
+    assert (mark.until, mark.arxiv_id) == (NOW, "2610.00001v1")
+    assert catalog.get_mark("cs.LG") == mark
+
+
+def test_search_applies_dates_and_category_mode(catalog):
+    noon = datetime(2026, 10, 1, 12, tzinfo=UTC)
+    catalog.add_many(
+        [
+            paper(1, noon, ("cs.LG",)),
+            paper(2, noon + timedelta(hours=1), ("cs.LG", "cs.AI")),
+            paper(3, noon - timedelta(days=3), ("cs.LG",)),
+        ]
+    )
+    day = {"date_from": date(2026, 10, 1), "date_to": date(2026, 10, 1)}
+
+    either = catalog.search(FilterConfig(arxiv_categories=["cs.LG", "cs.AI"], **day))
+    both = catalog.search(
+        FilterConfig(arxiv_categories=["cs.LG", "cs.AI"], arxiv_filter_mode="AND", **day)
+    )
+
+    assert [p.arxiv_id for p in either] == ["2610.00002v1", "2610.00001v1"]
+    assert [p.arxiv_id for p in both] == ["2610.00002v1"]
+
+
+def test_harvest_fetches_only_past_the_mark(catalog):
+    client = FakeClient([paper(n, NOW - timedelta(hours=n)) for n in range(10)])
+    sync = CatalogSync(catalog, client, overlap_minutes=30)
+
+    assert sync.harvest(["cs.LG"], NOW - timedelta(hours=5)) == 6
+    mark = catalog.get_mark("cs.LG")
+    assert (mark.since, mark.until) == (NOW - timedelta(hours=5), NOW)
+
+    client.papers.insert(0, paper(99, NOW + timedelta(hours=1)))
+    assert sync.harvest(["cs.LG"], NOW - timedelta(hours=5)) == 1
+    assert client.queries[-1] == (NOW - timedelta(minutes=30), None)
+
+    # A wider date range also fetches the older part
+    assert sync.harvest(["cs.LG"], NOW - timedelta(hours=8)) == 3
+    assert catalog.get_mark("cs.LG").since == NOW - timedelta(hours=8)
+
+
+def test_truncated_results_are_continued_from_the_oldest_paper(catalog):
+    client = FakeClient([paper(n, NOW - timedelta(hours=n)) for n in range(7)], max_results=3)
+
+    assert CatalogSync(catalog, client).harvest(["cs.LG"], NOW - timedelta(days=1)) == 7
+
+
+def test_harvest_steps_past_a_timestamp_shared_by_a_full_page(catalog):
+    tied = [paper(n, NOW) for n in range(5)]
+    older = [paper(10 + n, NOW - timedelta(hours=n + 1)) for n in range(2)]
+    client = FakeClient(tied + older, max_results=3)
+
+    added = CatalogSync(catalog, client).harvest(["cs.LG"], NOW - timedelta(days=1))
+
+    assert added == 3 + 2
+    assert len(client.queries) < 10
+
+
+def test_closing_a_harvest_stream_leaves_the_mark_unset(catalog):
+    client = FakeClient([paper(n, NOW - timedelta(hours=n)) for n in range(6)])
+    stream = CatalogSync(catalog, client).iter_harvest(["cs.LG"], NOW - timedelta(days=1))
+
+    first = next(stream)
+    stream.close()
+
+    assert first.arxiv_id == "2610.00000v1"
+    assert catalog.get_mark("cs.LG") is None
+
+
+def test_fetcher_streams_mirrored_papers_before_harvesting(catalog):
+    today = datetime.combine(date.today(), datetime.min.time()).astimezone(UTC)
+    catalog.add_many([paper(1, today + timedelta(minutes=1))])
+    client = FakeClient([paper(2, today + timedelta(minutes=2))])
+    fetcher = ArxivFetcher.__new__(ArxivFetcher)
+    fetcher.catalog = catalog
+    fetcher.catalog_sync = CatalogSync(catalog, client)
+
+    papers = fetcher._iter_catalog(FilterConfig(arxiv_categories=["cs.LG"]))
+
+    assert next(papers).metadata.arxiv_id == "2610.00001v1"
+    assert client.queries == []
+    assert [p.metadata.arxiv_id for p in papers] == ["2610.00002v1"]
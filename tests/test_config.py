@@ -0,0 +1,33 @@
+"""Tests for the shipped configuration."""
+
+from paper_review.core.pipeline import PaperReviewPipeline
+
+
+def test_shipped_config_builds_pipeline(shipped_config, workdir):
+    pipeline = PaperReviewPipeline(shipped_config)
+    try:
+        assert pipeline.rank_workers >= 1
+        assert pipeline.pdf_workers >= 1
+        assert pipeline.summarize_workers >= 1
+    finally:
+        pipeline.ingest_pool.shutdown()
+
+
+def test_empty_workers_section_uses_defaults(shipped_config, workdir):
+    shipped_config["pipeline"]["workers"] = None
+    pipeline = PaperReviewPipeline(shipped_config)
+    try:
+        assert pipeline.rank_workers == pipeline.novelty_ranker.llm.max_concurrency
+        assert pipeline.pdf_workers == pipeline.ingest_pool.processes
+    finally:
+        pipeline.ingest_pool.shutdown()
+
+
+def test_shipped_config_keeps_ranking_streaming(shipped_config, workdir):
+    pipeline = PaperReviewPipeline(shipped_config)
+    try:
+        # Prefilter and budget both make the rank stage wait for the whole fetch
+        assert not pipeline.novelty_ranker.prefilter.enabled
+        assert not pipeline.novelty_ranker.has_budget
+    finally:
+        pipeline.ingest_pool.shutdown()
@@ -0,0 +1,212 @@
+"""Tests for rate limiting and atomic downloads."""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import fitz
+import httpx
+import pytest
+import requests
+
+from paper_review.utils.download import (
+    QUARANTINE_DIR,
+    DownloadManager,
+    TokenBucket,
+    download_blocking,
+    validate_pdf,
+)
+
+
+def make_pdf_bytes() -> bytes:
+    with fitz.open() as doc:
+        doc.new_page().insert_text((72, 72), "hello " * 200)
+        return doc.tobytes()
+
+
+PDF = make_pdf_bytes()
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Serves ``/paper.pdf`` with Range support, an HTML page and 404s."""
+
+    requests: list = []
+
+    def do_GET(self):
+        self.requests.append((self.path, self.headers.get("Range")))
+        time.sleep(0.05)
+        if self.path == "/html":
+            return self._reply(200, b"<html>rate limited</html>")
+        if self.path != "/paper.pdf":
+            return self._reply(404, b"missing")
+
+        byte_range = self.headers.get("Range")
+        if byte_range is None:
+            return self._reply(200, PDF)
+        start = int(byte_range.removeprefix("bytes=").rstrip("-"))
+        if start >= len(PDF):
+            return self._reply(416, b"")
+        self._reply(206, PDF[start:])
+
+    def _reply(self, status: int, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    Handler.requests = []
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def download(url, dest, validate=validate_pdf):
+    manager = DownloadManager(rate_per_second=0)
+
+    async def run():
+        try:
+            return await manager.download(url, dest, validate)
+        finally:
+            await manager.aclose()
+
+    return asyncio.run(run()), manager
+
+
+def test_bucket_allows_a_burst_then_spaces_requests():
+    bucket = TokenBucket(rate=10, capacity=3)
+
+    waits = [bucket.reserve() for _ in range(5)]
+
+    assert waits[:3] == [0, 0, 0]
+    assert waits[3] == pytest.approx(0.1, abs=0.02)
+    assert waits[4] == pytest.approx(0.2, abs=0.02)
+
+
+def test_bucket_refills_over_time():
+    bucket = TokenBucket(rate=50)
+    bucket.reserve()
+    time.sleep(0.05)
+    assert bucket.reserve() == pytest.approx(0, abs=0.01)
+
+
+def test_zero_rate_disables_limiting():
+    bucket = TokenBucket(rate=0)
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+
+
+def test_acquire_blocking_waits_for_a_token():
+    bucket = TokenBucket(rate=20)
+    started = time.monotonic()
+    for _ in range(3):
+        bucket.acquire_blocking()
+    assert time.monotonic() - started >= 0.09
+
+
+def test_lock_file_shares_the_budget_between_buckets(tmp_path):
+    # Separate instances stand in for separate processes
+    first = TokenBucket(rate=1, lock_path=tmp_path / "rate.lock")
+    second = TokenBucket(rate=1, lock_path=tmp_path / "rate.lock")
+
+    assert first.reserve() == 0
+    assert second.reserve() == pytest.approx(1, abs=0.05)
+
+
+def test_shared_returns_one_bucket_per_setting(tmp_path):
+    assert TokenBucket.shared(0.5) is TokenBucket.shared(0.5)
+    assert TokenBucket.shared(0.5) is not TokenBucket.shared(0.5, 2)
+    assert TokenBucket.shared(0.5) is not TokenBucket.shared(0.5, lock_path=tmp_path / "r")
+
+
+def test_download_is_validated_and_committed(server, tmp_path):
+    dest, manager = download(f"{server}/paper.pdf", tmp_path / "a.pdf")
+
+    assert dest.read_bytes() == PDF
+    assert not (tmp_path / "a.pdf.part").exists()
+    assert manager.stats()["completed"] == 1
+
+
+def test_interrupted_download_resumes_with_range(server, tmp_path):
+    half = len(PDF) // 2
+    (tmp_path / "a.pdf.part").write_bytes(PDF[:half])
+
+    dest, manager = download(f"{server}/paper.pdf", tmp_path / "a.pdf")
+
+    assert dest.read_bytes() == PDF
+    assert Handler.requests == [("/paper.pdf", f"bytes={half}-")]
+    assert manager.resumed == 1
+
+
+def test_complete_partial_file_is_committed_on_416(server, tmp_path):
+    (tmp_path / "a.pdf.part").write_bytes(PDF)
+
+    dest, _ = download(f"{server}/paper.pdf", tmp_path / "a.pdf")
+
+    assert dest.read_bytes() == PDF
+
+
+def test_error_response_discards_the_partial_file(server, tmp_path):
+    (tmp_path / "a.pdf.part").write_bytes(b"stale")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        download(f"{server}/gone.pdf", tmp_path / "a.pdf")
+    assert not (tmp_path / "a.pdf.part").exists()
+
+
+def test_invalid_body_is_quarantined(server, tmp_path):
+    with pytest.raises(ValueError):
+        download(f"{server}/html", tmp_path / "a.pdf")
+
+    assert not (tmp_path / "a.pdf").exists()
+    assert len(list((tmp_path / QUARANTINE_DIR).iterdir())) == 1
+
+
+def test_invalid_cached_file_is_downloaded_again(server, tmp_path):
+    (tmp_path / "a.pdf").write_bytes(b"<html>")
+
+    dest, manager = download(f"{server}/paper.pdf", tmp_path / "a.pdf")
+
+    assert dest.read_bytes() == PDF
+    assert manager.skipped == 0
+    assert (tmp_path / QUARANTINE_DIR).exists()
+
+
+def test_concurrent_downloads_of_one_file_fetch_it_once(server, tmp_path):
+    manager = DownloadManager(rate_per_second=0)
+
+    async def run():
+        try:
+            return await asyncio.gather(
+                *(manager.download(f"{server}/paper.pdf", tmp_path / "a.pdf") for _ in range(3))
+            )
+        finally:
+            await manager.aclose()
+
+    asyncio.run(run())
+
+    assert len(Handler.requests) == 1
+    assert manager.skipped == 2
+    assert (tmp_path / "a.pdf").read_bytes() == PDF
+
+
+def test_blocking_downloads_share_the_destination_lock(server, tmp_path):
+    def fetch():
+        with requests.Session() as session:
+            download_blocking(session, f"{server}/paper.pdf", tmp_path / "a.pdf", 10, validate_pdf)
+
+    threads = [threading.Thread(target=fetch) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(Handler.requests) == 1
+    assert (tmp_path / "a.pdf").read_bytes() == PDF
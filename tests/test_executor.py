@@ -0,0 +1,38 @@
+"""Tests for scheduling pipeline runs in the web executor."""
+
+import asyncio
+
+from paper_review.models import FilterConfig
+from paper_review.web.executor import PipelineExecutor
+
+
+def test_at_least_two_workers():
+    assert PipelineExecutor({}, max_workers=1).max_workers == 2
+
+
+def test_interactive_runs_do_not_wait_for_background_runs(monkeypatch):
+    executor = PipelineExecutor({})
+    running = {"background": 0, "peak": 0}
+    finished = []
+
+    async def submit(filter_config, process_pdfs):
+        if process_pdfs:
+            running["background"] += 1
+            running["peak"] = max(running["peak"], running["background"])
+            await asyncio.sleep(0.1)
+            running["background"] -= 1
+        finished.append("background" if process_pdfs else "interactive")
+
+    monkeypatch.setattr(executor, "_submit", submit)
+
+    async def run():
+        background = [
+            executor.run(FilterConfig(), process_pdfs=True, background=True) for _ in range(3)
+        ]
+        interactive = executor.run(FilterConfig(), process_pdfs=False)
+        await asyncio.gather(*background, interactive)
+
+    asyncio.run(run())
+
+    assert running["peak"] == 1
+    assert finished[0] == "interactive"
@@ -0,0 +1,78 @@
+"""Tests for single-pass PDF ingestion and the ingest process pool."""
+
+import asyncio
+import os
+
+import fitz
+import pytest
+
+from paper_review.utils.ingest import PDFIngestor, PDFIngestPool
+
+
+def make_pdf(path, pages: int = 2):
+    with fitz.open() as doc:
+        for n in range(pages):
+            doc.new_page().insert_text((72, 72), f"page {n} text")
+        doc.save(str(path))
+    return path
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = PDFIngestPool(processes=2, timeout=30, text_dir=tmp_path / "text")
+    yield pool
+    pool.shutdown()
+
+
+def test_ingestor_extracts_text_and_page_offsets(tmp_path):
+    result = PDFIngestor().ingest(make_pdf(tmp_path / "a.pdf"))
+
+    assert result.error is None
+    assert result.page_count == 2
+    assert result.text[result.page_offsets[1] :].startswith("page 1 text")
+
+
+def test_ingestor_reports_errors(tmp_path):
+    (tmp_path / "bad.pdf").write_bytes(b"not a pdf")
+    result = PDFIngestor().ingest(tmp_path / "bad.pdf")
+    assert result.error
+
+
+def test_pool_writes_text_files_and_reuses_workers(pool, tmp_path):
+    pdfs = [make_pdf(tmp_path / f"{n}.pdf") for n in range(4)]
+
+    async def run():
+        return await asyncio.gather(*(pool.ingest(p, None, p.stem) for p in pdfs))
+
+    results = asyncio.run(run())
+
+    assert [r.error for r in results] == [None] * 4
+    assert "page 1 text" in open(results[3].text_path).read()
+    assert len(pool._workers) == 2
+
+
+def test_hung_and_crashed_tasks_fail_alone(pool, tmp_path):
+    # Writing text to a FIFO without a reader blocks forever, like a pathological PDF
+    (tmp_path / "text").mkdir()
+    for paper_id in ("hung", "crashed"):
+        os.mkfifo(tmp_path / "text" / f"{paper_id}.txt")
+    pdf = make_pdf(tmp_path / "paper.pdf")
+    pool.timeout = 5
+
+    async def run():
+        pool.start()
+        first = asyncio.create_task(pool.ingest(pdf, None, "hung"))
+        await asyncio.sleep(0.5)
+        busy = set(pool._workers) - set(pool._idle)
+        second = asyncio.create_task(pool.ingest(pdf, None, "crashed"))
+        await asyncio.sleep(0.5)
+        (crashed,) = set(pool._workers) - set(pool._idle) - busy
+        crashed.process.kill()
+        return await asyncio.gather(first, second, pool.ingest(pdf, None, "good"))
+
+    timed_out, crashed, ok = asyncio.run(run())
+
+    assert timed_out.error == "Ingestion timed out"
+    assert crashed.error == "Worker process crashed"
+    assert ok.error is None
+    assert all(w.process.is_alive() for w in pool._workers)
@@ -0,0 +1,91 @@
+"""Tests for the arXiv daily listing feeds."""
+
+import io
+import threading
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from paper_review.utils.listing import DailyListing, parse_listing
+
+
+def entry(arxiv_id: str, announce_type: str = "new", categories=("cs.LG", "stat.ML")) -> str:
+    terms = "".join(f'<category term="{c}"/>' for c in categories)
+    return f"""
+  <entry>
+    <id>oai:arXiv.org:{arxiv_id}</id>
+    <title>A   Title
+      on two lines</title>
+    <summary>arXiv:{arxiv_id} Announce Type: {announce_type}
+Abstract: Some   abstract.</summary>
+    {terms}
+    <published>2026-10-16T00:00:00-04:00</published>
+    <arxiv:announce_type>{announce_type}</arxiv:announce_type>
+    <dc:creator>Ada Lovelace, Alan Turing and Grace Hopper</dc:creator>
+  </entry>"""
+
+
+def feed(*entries: str) -> bytes:
+    return f"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom"
+      xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <title>cs.LG updates on arXiv.org</title>{"".join(entries)}
+  <entry><id>https://example.org/not-a-paper</id></entry>
+</feed>""".encode()
+
+
+FEED = feed(entry("2610.00001v1"), entry("2610.00002v1", "cross"), entry("2609.00003v2", "replace"))
+
+
+def test_entries_are_converted():
+    papers = list(parse_listing(io.BytesIO(FEED)))
+
+    assert [p.arxiv_id for p in papers] == ["2610.00001v1", "2610.00002v1", "2609.00003v2"]
+    first = papers[0]
+    assert first.title == "A Title on two lines"
+    assert first.summary == "Some abstract."
+    assert first.authors == ["Ada Lovelace", "Alan Turing", "Grace Hopper"]
+    assert first.primary_category == "cs.LG"
+    assert first.published == datetime(2026, 10, 16, 4, tzinfo=UTC)
+    assert first.pdf_url == "https://arxiv.org/pdf/2610.00001v1"
+
+
+def test_announce_types_are_filtered():
+    papers = parse_listing(io.BytesIO(FEED), ["new", "cross"])
+    assert [p.arxiv_id for p in papers] == ["2610.00001v1", "2610.00002v1"]
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = FEED if self.path == "/cs.LG.xml" else b"missing"
+        self.send_response(200 if self.path == "/cs.LG.xml" else 404)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def listing():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FeedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/{{category}}.xml"
+    with requests.Session() as session:
+        yield DailyListing.from_config({"enabled": True, "url_template": url}, session)
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_many_reports_failed_listings(listing):
+    results = dict(listing.fetch_many(["cs.LG", "cs.AI"]))
+
+    assert [p.arxiv_id for p in results["cs.LG"]] == ["2610.00001v1", "2610.00002v1"]
+    assert results["cs.AI"] is None
+
+
+def test_disabled_listing_is_not_created():
+    assert DailyListing.from_config({}, requests.Session()) is None
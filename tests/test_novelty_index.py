@@ -0,0 +1,179 @@
+"""Tests for the persistent novelty index."""
+
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from paper_review.utils.novelty_index import NoveltyIndex, base_id
+
+DIM = 16
+
+
+def random_vectors(n: int, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).normal(size=(n, DIM)).astype(np.float32)
+
+
+def exact_topk(vectors: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    sims = (queries / np.linalg.norm(queries, axis=1, keepdims=True)) @ unit.T
+    return np.argsort(-sims, axis=1)[:, :k]
+
+
+def assert_consistent(directory) -> None:
+    index = NoveltyIndex(directory)
+    size = (directory / NoveltyIndex.VECTORS_FILE).stat().st_size
+    assert size == len(index) * DIM * 4
+
+
+@pytest.mark.parametrize(
+    "paper_id, base",
+    [
+        ("2511.14899v2", "2511.14899"),
+        ("2511.14899", "2511.14899"),
+        ("hep-th/9901001v1", "hep-th/9901001"),
+        ("v2", "v2"),
+        ("2511.14899vx", "2511.14899vx"),
+    ],
+)
+def test_base_id(paper_id, base):
+    assert base_id(paper_id) == base
+
+
+def test_add_deduplicates_versions_and_persists(tmp_path):
+    index = NoveltyIndex(tmp_path)
+    vectors = random_vectors(3)
+    assert index.add(["2610.00001v1", "2610.00002v1", "2610.00001v2"], vectors) == 2
+    assert index.add(["2610.00002v3"], vectors[:1]) == 0
+
+    reopened = NoveltyIndex(tmp_path)
+    assert len(reopened) == 2
+    assert "2610.00001v5" in reopened
+
+
+def test_dimension_mismatch_is_rejected(tmp_path):
+    index = NoveltyIndex(tmp_path)
+    index.add(["a"], random_vectors(1))
+    with pytest.raises(ValueError):
+        index.add(["b"], np.ones((1, DIM + 1), dtype=np.float32))
+
+
+def test_novelty_ignores_other_versions_of_the_same_paper(tmp_path):
+    index = NoveltyIndex(tmp_path)
+    vectors = random_vectors(20)
+    index.add([f"2610.{i:05d}v1" for i in range(20)], vectors)
+
+    # A new version of an indexed paper is not "seen before" just because of itself
+    novelty = index.novelty(["2610.00000v2"], vectors[:1], k=3)
+    duplicate = index.novelty(["2610.99999v1"], vectors[:1], k=3)
+    assert novelty[0] > duplicate[0]
+    assert NoveltyIndex(tmp_path / "empty").novelty(["x"], vectors[:1])[0] == 1.0
+
+
+def test_open_does_not_truncate_a_writer_in_progress(tmp_path):
+    index = NoveltyIndex(tmp_path)
+    index.add(["a", "b"], random_vectors(2))
+
+    # Another process has appended its vectors but not yet its ids
+    with index._file_lock():
+        with open(tmp_path / NoveltyIndex.VECTORS_FILE, "ab") as f:
+            f.write(random_vectors(1, seed=1).tobytes())
+        opener = NoveltyIndex(tmp_path)
+        with open(tmp_path / NoveltyIndex.IDS_FILE, "a") as f:
+            f.write("c\n")
+
+    assert len(opener) == 2
+    assert_consistent(tmp_path)
+    assert len(NoveltyIndex(tmp_path)) == 3
+
+
+def test_crashed_writer_rows_are_dropped_by_the_next_add(tmp_path):
+    index = NoveltyIndex(tmp_path)
+    index.add(["a"], random_vectors(1))
+    with open(tmp_path / NoveltyIndex.VECTORS_FILE, "ab") as f:
+        f.write(random_vectors(1, seed=1).tobytes())
+
+    index.add(["b"], random_vectors(1, seed=2))
+    assert_consistent(tmp_path)
+
+
+def expected_labels(index: NoveltyIndex) -> np.ndarray:
+    return (np.asarray(index._matrix()) @ index._centroids.T).argmax(axis=1)
+
+
+@pytest.mark.parametrize("stale_rows", [3, -40])
+def test_crashed_writer_list_labels_are_repaired_by_the_next_add(tmp_path, stale_rows):
+    index = NoveltyIndex(tmp_path, ivf_min_rows=100, num_lists=4)
+    index.add([str(i) for i in range(100)], random_vectors(100))
+    lists_path = tmp_path / NoveltyIndex.LISTS_FILE
+
+    if stale_rows > 0:
+        # Labels written, ids never: the next rows must not inherit these
+        with open(lists_path, "ab") as f:
+            f.write(np.full(stale_rows, 3, dtype=np.int32).tobytes())
+    else:
+        # Relabelling cut short
+        with open(lists_path, "r+b") as f:
+            f.truncate((100 + stale_rows) * 4)
+
+    index = NoveltyIndex(tmp_path, ivf_min_rows=100, num_lists=4)
+    index.add([str(i) for i in range(100, 120)], random_vectors(20, seed=1))
+
+    labels = np.fromfile(lists_path, dtype=np.int32)
+    np.testing.assert_array_equal(labels, expected_labels(index))
+
+
+def _add_rows(directory, worker: int) -> None:
+    for batch in range(10):
+        index = NoveltyIndex(directory)
+        ids = [f"{worker}-{batch}-{i}" for i in range(5)]
+        index.add(ids, random_vectors(5, seed=worker * 100 + batch))
+        index.search(random_vectors(2), 3)
+
+
+def test_concurrent_processes_open_and_add(tmp_path):
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_add_rows, args=(tmp_path, w)) for w in range(4)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join(60)
+        assert process.exitcode == 0
+
+    assert_consistent(tmp_path)
+    index = NoveltyIndex(tmp_path)
+    assert len(index) == 4 * 10 * 5
+
+    # Each stored vector is the one added under its id
+    ids = (tmp_path / NoveltyIndex.IDS_FILE).read_text().split()
+    matrix = np.asarray(index._matrix())
+    row = ids.index("2-3-4")
+    expected = random_vectors(5, seed=203)[4]
+    np.testing.assert_allclose(matrix[row], expected / np.linalg.norm(expected), rtol=1e-5)
+
+
+def test_ivf_search_matches_exact_search_when_probing_every_list(tmp_path):
+    vectors = random_vectors(600)
+    queries = random_vectors(20, seed=1)
+    index = NoveltyIndex(tmp_path, ivf_min_rows=500, num_lists=8, nprobe=8, block_rows=64)
+    index.add([str(i) for i in range(600)], vectors)
+    assert index._centroids is not None
+
+    _, rows = index.search(queries, 5)
+    np.testing.assert_array_equal(rows, exact_topk(vectors, queries, 5))
+
+
+def test_ivf_search_recall_and_new_rows(tmp_path):
+    vectors = random_vectors(2000)
+    queries = random_vectors(50, seed=1)
+    index = NoveltyIndex(tmp_path, ivf_min_rows=1000, num_lists=16, nprobe=8)
+    index.add([str(i) for i in range(1000)], vectors[:1000])
+    index.search(queries, 10)
+    # Rows added after training are labelled and found (list cache refreshed)
+    index.add([str(i) for i in range(1000, 2000)], vectors[1000:])
+
+    _, rows = index.search(queries, 10)
+    exact = exact_topk(vectors, queries, 10)
+    recall = np.mean([len(set(r) & set(e)) / 10 for r, e in zip(rows, exact, strict=True)])
+    assert recall > 0.8
+    assert (rows >= 1000).any()
@@ -0,0 +1,104 @@
+"""Tests for the streaming pipeline engine."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from paper_review.core.pipeline import PaperReviewPipeline, _iterate_in_thread
+from paper_review.models import Paper, PaperMetadata, PDFIngestResult
+
+
+def _slow_source(first: int, block: threading.Event):
+    """Yield ``first`` items, then block like a stalled HTTP request."""
+    yield from range(first)
+    block.wait(10)
+    yield first
+
+
+def _pipeline(deadlines):
+    pipeline = PaperReviewPipeline.__new__(PaperReviewPipeline)
+    pipeline.source_deadlines = deadlines
+    return pipeline
+
+
+def test_iterate_in_thread_yields_all_items():
+    async def consume():
+        return [item async for item in _iterate_in_thread(lambda: iter(range(5)))]
+
+    assert asyncio.run(consume()) == [0, 1, 2, 3, 4]
+
+
+def test_iterate_in_thread_reraises_producer_errors():
+    def failing():
+        yield 1
+        raise ValueError("boom")
+
+    async def consume():
+        items = []
+        try:
+            async for item in _iterate_in_thread(failing):
+                items.append(item)
+        except ValueError as e:
+            return items, str(e)
+
+    assert asyncio.run(consume()) == ([1], "boom")
+
+
+def test_deadline_bounds_wall_time_with_blocked_producer():
+    block = threading.Event()
+    outbox: asyncio.Queue = asyncio.Queue()
+    papers = _iterate_in_thread(lambda: _slow_source(3, block))
+
+    started = time.monotonic()
+    count = asyncio.run(_pipeline({"arxiv": 0.3})._fetch_source("arxiv", 0, papers, outbox))
+    elapsed = time.monotonic() - started
+    block.set()
+
+    # Partial results are kept, and asyncio.run does not wait for the blocked thread
+    assert count == 3
+    assert outbox.qsize() == 3
+    assert elapsed < 2
+
+
+def test_source_without_deadline_runs_to_completion():
+    outbox: asyncio.Queue = asyncio.Queue()
+    papers = _iterate_in_thread(lambda: iter(range(4)))
+
+    count = asyncio.run(_pipeline({})._fetch_source("huggingface", 1, papers, outbox))
+
+    assert count == 4
+    assert [outbox.get_nowait()[0] for _ in range(4)] == [(1, i) for i in range(4)]
+
+
+@pytest.mark.parametrize("error", [None, "Ingestion timed out"])
+def test_pdf_handler_keeps_content_only_from_successful_ingestion(error):
+    paper = Paper(
+        metadata=PaperMetadata(
+            title="T",
+            authors=[],
+            summary="S",
+            published=datetime(2026, 10, 1),
+            arxiv_id="2610.00001v1",
+            primary_category="cs.LG",
+            source="arxiv",
+        )
+    )
+
+    async def adownload_paper(paper):
+        paper.pdf_path = "paper.pdf"
+        return paper
+
+    async def ingest(pdf_path, images_dir, paper_id):
+        return PDFIngestResult(pdf_path=pdf_path, text_path="t.txt", error=error)
+
+    pipeline = PaperReviewPipeline.__new__(PaperReviewPipeline)
+    pipeline.arxiv_fetcher = SimpleNamespace(adownload_paper=adownload_paper, images_dir=None)
+    pipeline.ingest_pool = SimpleNamespace(ingest=ingest)
+
+    [(_, result)] = asyncio.run(pipeline._make_pdf_handler(True)(((0, 0), paper)))
+
+    assert result.text_path == (None if error else "t.txt")
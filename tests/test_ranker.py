@@ -0,0 +1,176 @@
+"""Tests for batched novelty scoring in NoveltyRanker."""
+
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+from paper_review.agents.ranker import NoveltyRanker
+from paper_review.models import Paper, PaperMetadata
+
+
+def make_paper(n: int, summary: str = "An abstract.", **fields) -> Paper:
+    return Paper(
+        metadata=PaperMetadata(
+            **{
+                "title": f"Paper {n}",
+                "authors": ["A. Author"],
+                "summary": summary,
+                "published": datetime(2026, 10, 1),
+                "arxiv_id": f"2610.{n:05d}v1",
+                "primary_category": "cs.LG",
+                "source": "arxiv",
+                **fields,
+            }
+        )
+    )
+
+
+def budget_ranker(**budget) -> NoveltyRanker:
+    return NoveltyRanker({"novelty_filter": {"batch_size": 4, "budget": budget}})
+
+
+def entry(n: int, novelty=8, impact=6, clarity=7):
+    return {"id": n, "novelty": novelty, "impact": impact, "clarity": clarity, "reasoning": "ok"}
+
+
+@pytest.fixture
+def ranker(workdir):
+    return NoveltyRanker({"novelty_filter": {"batch_size": 4, "num_ctx": 8192}})
+
+
+def test_batch_scores_are_assigned_by_id(ranker):
+    papers = [make_paper(i) for i in range(3)]
+    response = json.dumps({"scores": [entry(3, novelty=2), entry(1), entry(2, impact=9)]})
+
+    assert ranker._apply_batch_scores(papers, response) == []
+    assert papers[0].novelty_score.novelty == 8
+    assert papers[1].novelty_score.impact == 9
+    assert papers[2].novelty_score.novelty == 2
+    assert papers[0].novelty_score.total_score == pytest.approx(7.0)
+
+
+def test_batch_accepts_a_bare_list_in_a_code_fence(ranker):
+    papers = [make_paper(i) for i in range(2)]
+    response = "```json\n" + json.dumps([entry(1), entry(2)]) + "\n```"
+
+    assert ranker._apply_batch_scores(papers, response) == []
+
+
+@pytest.mark.parametrize(
+    "bad",
+    [
+        entry(0),  # ids are 1-based
+        entry(4),  # out of range
+        {"id": "x", "novelty": 5, "impact": 5, "clarity": 5},
+        entry(2, novelty=11),
+        entry(2, impact="7"),
+        entry(2, clarity=True),
+        {"id": 2, "novelty": 5, "impact": 5},
+    ],
+)
+def test_invalid_entries_are_rescored_individually(ranker, bad):
+    papers = [make_paper(i) for i in range(3)]
+    response = json.dumps({"scores": [entry(1), bad, entry(3)]})
+
+    missing = ranker._apply_batch_scores(papers, response)
+
+    assert missing == [papers[1]]
+    assert papers[1].novelty_score is None
+
+
+def test_duplicate_ids_keep_the_first_entry(ranker):
+    papers = [make_paper(i) for i in range(2)]
+    response = json.dumps({"scores": [entry(1, novelty=3), entry(1, novelty=9)]})
+
+    assert ranker._apply_batch_scores(papers, response) == [papers[1]]
+    assert papers[0].novelty_score.novelty == 3
+
+
+def test_batches_respect_size_and_context(ranker):
+    papers = [make_paper(i) for i in range(10)]
+    assert [len(b) for b in ranker._plan_batches(papers)] == [4, 4, 2]
+
+    # Each long abstract costs ~2900 tokens, so only two fit in 8192
+    long_papers = [make_paper(i, summary="x" * 10000) for i in range(3)]
+    assert [len(b) for b in ranker._plan_batches(long_papers)] == [2, 1]
+
+
+def test_failed_batch_falls_back_to_single_requests(ranker, monkeypatch):
+    papers = [make_paper(i) for i in range(3)]
+    single = json.dumps({"novelty": 6, "impact": 6, "clarity": 6, "reasoning": "single"})
+
+    async def generate(prompt, **kwargs):
+        if "scores" in prompt:
+            raise ValueError("bad batch")
+        return single
+
+    monkeypatch.setattr(ranker.llm, "agenerate", generate)
+    calls = asyncio.run(ranker._ascore_batches([papers]))
+
+    assert calls == 1 + 3
+    assert all(p.novelty_score.reasoning == "single" for p in papers)
+
+
+def test_cancelled_round_keeps_completed_batches(workdir, monkeypatch):
+    ranker = NoveltyRanker(
+        {"novelty_filter": {"batch_size": 2, "score_cache": {"enabled": True}}}
+    )
+    papers = [make_paper(i) for i in range(4)]
+    fast, slow = papers[:2], papers[2:]
+
+    async def generate(prompt, **kwargs):
+        if fast[0].metadata.title in prompt:
+            return json.dumps({"scores": [entry(1), entry(2)]})
+        await asyncio.sleep(10)
+
+    async def run():
+        monkeypatch.setattr(ranker.llm, "agenerate", generate)
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(ranker._ascore_batches([fast, slow]), 0.2)
+
+    asyncio.run(run())
+
+    stored = ranker.score_store.get_many(
+        [p.metadata.arxiv_id for p in papers], ranker.llm.model, ranker.prompt_hash
+    )
+    assert set(stored) == {p.metadata.arxiv_id for p in fast}
+
+
+def test_budget_prior_uses_huggingface_upvotes(workdir):
+    ranker = budget_ranker(max_calls=1)
+    papers = [make_paper(i) for i in range(3)]
+    hf = make_paper(2, arxiv_id="2610.00002", source="huggingface", upvotes=40)
+
+    targets, _ = ranker._plan_anytime(papers, ranker.upvotes_by_id([hf, papers[0]]))
+
+    assert targets[0] is papers[2]
+
+
+@pytest.mark.parametrize("run_async", [False, True])
+def test_call_budget_covers_individual_rescores(workdir, monkeypatch, run_async):
+    ranker = budget_ranker(max_calls=2)
+    papers = [make_paper(i) for i in range(4)]
+    prompts = []
+    # The batch response only scores the first paper; the other three need re-scores
+    batch = json.dumps({"scores": [entry(1)]})
+    single = json.dumps({"novelty": 6, "impact": 6, "clarity": 6, "reasoning": "single"})
+
+    def generate(prompt, **kwargs):
+        prompts.append(prompt)
+        return batch if "scores" in prompt else single
+
+    async def agenerate(prompt, **kwargs):
+        return generate(prompt)
+
+    monkeypatch.setattr(ranker.llm, "generate", generate)
+    monkeypatch.setattr(ranker.llm, "agenerate", agenerate)
+    if run_async:
+        top = asyncio.run(ranker.arank_papers(papers, 3))
+    else:
+        top = ranker.rank_papers(papers, 3)
+
+    assert len(prompts) == 2
+    assert sum(p.novelty_score is not None for p in papers) == 2
+    assert len(top) == 3
@@ -0,0 +1,73 @@
+"""Tests for the persistent novelty score store."""
+
+import pytest
+
+from paper_review.models import NoveltyScore
+from paper_review.utils.score_store import ScoreStore
+
+
+def score(total: float) -> NoveltyScore:
+    return NoveltyScore(total_score=total, novelty=total, impact=total, clarity=total, reasoning="r")
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ScoreStore(tmp_path / "scores.sqlite3")
+    yield store
+    store.close()
+
+
+def test_put_and_get_many(store):
+    store.put_many({"2610.00001v1": score(7), "2610.00002v1": score(4)}, "qwen3:8b", "p1")
+
+    found = store.get_many(["2610.00001v1", "2610.00002v1", "2610.00003v1"], "qwen3:8b", "p1")
+
+    assert {k: v.total_score for k, v in found.items()} == {"2610.00001v1": 7, "2610.00002v1": 4}
+    stats = store.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 2)
+
+
+@pytest.mark.parametrize(
+    "arxiv_id, model, prompt_hash",
+    [
+        ("2610.00001v2", "qwen3:8b", "p1"),  # new paper version
+        ("2610.00001v1", "llama3", "p1"),
+        ("2610.00001v1", "qwen3:8b", "p2"),
+    ],
+)
+def test_any_key_change_is_a_miss(store, arxiv_id, model, prompt_hash):
+    store.put_many({"2610.00001v1": score(7)}, "qwen3:8b", "p1")
+    assert store.get_many([arxiv_id], model, prompt_hash) == {}
+
+
+def test_lookups_are_chunked(store):
+    store.LOOKUP_CHUNK = 3
+    ids = [f"2610.{i:05d}v1" for i in range(10)]
+    store.put_many({arxiv_id: score(5) for arxiv_id in ids}, "m", "p")
+
+    assert set(store.get_many(ids, "m", "p")) == set(ids)
+
+
+def test_invalid_rows_are_ignored(store):
+    store.put_many({"a": score(5)}, "m", "p")
+    with store.transaction() as conn:
+        conn.execute("UPDATE novelty_scores SET score = 'not json'")
+
+    assert store.get_many(["a"], "m", "p") == {}
+
+
+def test_scores_persist_across_instances(tmp_path):
+    first = ScoreStore(tmp_path / "scores.sqlite3")
+    first.put_many({"a": score(6)}, "m", "p")
+    first.close()
+
+    second = ScoreStore(tmp_path / "scores.sqlite3")
+    assert second.get_many(["a"], "m", "p")["a"].total_score == 6
+    second.close()
+
+
+def test_from_config_is_off_unless_enabled(tmp_path):
+    assert ScoreStore.from_config({}) is None
+    store = ScoreStore.from_config({"enabled": True, "path": str(tmp_path / "s.sqlite3")})
+    assert isinstance(store, ScoreStore)
+    store.close()
@@ -0,0 +1,111 @@
+"""Tests for the bulk snapshot backfill."""
+
+import gzip
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from paper_review.utils.catalog import PaperCatalog
+from paper_review.utils.snapshot import SnapshotIngestor, _parse_version_date, iter_snapshot_rows
+
+DAY = datetime(2026, 10, 10, 12, tzinfo=UTC)
+
+
+def record(n: int, published: datetime, categories: str = "cs.LG stat.ML") -> dict:
+    created = published.strftime("%a, %d %b %Y %H:%M:%S GMT")
+    return {
+        "id": f"2610.{n:05d}",
+        "title": f"Paper\n  {n}",
+        "authors": "A. Author, B. Author",
+        "authors_parsed": [["Author", "A.", ""], ["Author", "B.", "Jr"]],
+        "abstract": "  An\nabstract. ",
+        "categories": categories,
+        "versions": [{"version": "v1", "created": created}, {"version": "v2", "created": created}],
+        "update_date": f"{published:%Y-%m-%d}",
+    }
+
+
+def write_snapshot(path, records) -> None:
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "wt", encoding="utf-8") as f:
+        for r in records:
+            f.write(json.dumps(r) + "\n")
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    catalog = PaperCatalog(tmp_path / "catalog.sqlite3")
+    yield catalog
+    catalog.close()
+
+
+def test_version_dates_parse_as_utc():
+    expected = datetime(2007, 4, 2, 19, 18, 42, tzinfo=UTC)
+    assert _parse_version_date("Mon, 2 Apr 2007 19:18:42 GMT") == expected
+
+
+@pytest.mark.parametrize("name", ["snapshot.json", "snapshot.json.gz"])
+def test_rows_are_filtered_and_converted(tmp_path, name):
+    path = tmp_path / name
+    write_snapshot(
+        path,
+        [
+            record(1, DAY),
+            record(2, DAY, "math.CO"),
+            record(3, DAY - timedelta(days=30)),
+        ],
+    )
+
+    rows = list(iter_snapshot_rows(path, ["stat.ML"], date_from=DAY - timedelta(days=1)))
+
+    assert [row[0] for row in rows] == ["2610.00001v2"]
+    arxiv_id, published, primary, metadata, categories = rows[0]
+    assert (published, primary, categories) == (DAY.timestamp(), "cs.LG", ["cs.LG", "stat.ML"])
+    metadata = json.loads(metadata)
+    assert metadata["title"] == "Paper 1"
+    assert metadata["authors"] == ["A. Author", "B. Author Jr"]
+    assert metadata["summary"] == "An abstract."
+
+
+def test_ingest_sets_the_mark_of_an_unharvested_category(tmp_path, catalog):
+    write_snapshot(tmp_path / "s.json", [record(n, DAY - timedelta(days=n)) for n in range(3)])
+
+    stats = SnapshotIngestor(catalog, batch_size=2).ingest(
+        tmp_path / "s.json", ["cs.LG"], date_from=DAY - timedelta(days=5)
+    )
+
+    assert stats["rows"] == 3
+    mark = catalog.get_mark("cs.LG")
+    assert (mark.since, mark.until, mark.arxiv_id) == (
+        DAY - timedelta(days=5),
+        DAY,
+        "2610.00000v2",
+    )
+
+
+@pytest.mark.parametrize(
+    "scanned_hours, extended",
+    [
+        ((288, 144), True),  # overlaps the harvested range
+        ((288, 240.5), True),  # ends within the harvest overlap of its start
+        ((49, 0), True),  # continues it up to now
+        ((480, 360), False),  # ends well before it
+        ((24, 0), False),  # starts a day after its newest paper
+    ],
+)
+def test_mark_is_extended_only_by_a_contiguous_range(tmp_path, catalog, scanned_hours, extended):
+    # Harvested: from 10 days ago to 2 days ago
+    catalog.update_mark("cs.LG", DAY - timedelta(hours=240), DAY - timedelta(hours=48), "h")
+    before = catalog.get_mark("cs.LG")
+    date_from, date_to = (DAY - timedelta(hours=h) for h in scanned_hours)
+    write_snapshot(
+        tmp_path / "s.json",
+        [record(1, date_from + timedelta(minutes=1)), record(2, date_to - timedelta(minutes=1))],
+    )
+
+    SnapshotIngestor(catalog, overlap_minutes=60).ingest(
+        tmp_path / "s.json", ["cs.LG"], date_from, date_to
+    )
+
+    assert (catalog.get_mark("cs.LG") != before) == extended
@@ -0,0 +1,54 @@
+"""Tests for the persistent summary store."""
+
+import pytest
+
+from paper_review.utils.summary_store import SummaryStore
+
+KEY = ("2610.00001v1", SummaryStore.hash_text("title|abstract"), "qwen3:8b", "ko", "v1")
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SummaryStore(tmp_path / "summaries.sqlite3")
+    yield store
+    store.close()
+
+
+def test_put_get_and_stats(store):
+    assert store.get(*KEY) is None
+    store.put(*KEY, "요약")
+    assert store.get(*KEY) == "요약"
+
+    stats = store.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+@pytest.mark.parametrize("position, value", [(1, "other-hash"), (2, "llama3"), (3, "en"), (4, "v2")])
+def test_changed_inputs_need_a_new_summary(store, position, value):
+    store.put(*KEY, "요약")
+    changed = list(KEY)
+    changed[position] = value
+    assert store.get(*changed) is None
+
+
+def test_put_replaces_existing_summary(store):
+    store.put(*KEY, "old")
+    store.put(*KEY, "new")
+    assert store.get(*KEY) == "new"
+    assert store.stats()["entries"] == 1
+
+
+def test_hash_text_is_stable():
+    assert SummaryStore.hash_text("abc") == SummaryStore.hash_text("abc")
+    assert SummaryStore.hash_text("abc") != SummaryStore.hash_text("abd")
+    assert len(SummaryStore.hash_text("abc")) == 16
+
+
+def test_summaries_persist_across_instances(tmp_path):
+    first = SummaryStore(tmp_path / "summaries.sqlite3")
+    first.put(*KEY, "요약")
+    first.close()
+
+    second = SummaryStore(tmp_path / "summaries.sqlite3")
+    assert second.get(*KEY) == "요약"
+    second.close()
@@ -0,0 +1,49 @@
+"""Tests for choosing between the local arXiv mirror and the pipeline in the web app."""
+
+import importlib
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from paper_review.models import FilterConfig
+from paper_review.utils.catalog import PaperCatalog
+
+# paper_review.web re-exports the FastAPI instance under the module's name
+web = importlib.import_module("paper_review.web.app")
+
+
+@pytest.fixture
+def synced(tmp_path, monkeypatch):
+    catalog = PaperCatalog(tmp_path / "catalog.sqlite3")
+    catalog.update_mark("cs.LG", datetime.now() - timedelta(days=8), datetime.now())
+    monkeypatch.setattr(web, "catalog_sync", SimpleNamespace(catalog=catalog, categories=["cs.LG"]))
+    yield catalog
+    catalog.close()
+
+
+def test_nothing_is_created_at_import():
+    assert web.executor is None
+    assert web.catalog is None
+
+
+def test_pipeline_is_used_without_background_sync(monkeypatch):
+    monkeypatch.setattr(web, "catalog_sync", None)
+    assert web.catalog_filter_for(FilterConfig(arxiv_categories=["cs.LG"])) is None
+
+
+def test_covered_request_is_served_from_the_mirror(synced):
+    filter_config = web.catalog_filter_for(FilterConfig(days_back=7))
+    assert filter_config.arxiv_categories == ["cs.LG"]
+
+
+@pytest.mark.parametrize(
+    "request_filter",
+    [
+        FilterConfig(days_back=10),  # older than the harvested range
+        FilterConfig(arxiv_categories=["cs.LG", "cs.AI"]),  # cs.AI never harvested
+        FilterConfig(sources=["huggingface"]),
+    ],
+)
+def test_uncovered_request_runs_the_pipeline(synced, request_filter):
+    assert web.catalog_filter_for(request_filter) is None